@@ -0,0 +1,151 @@
+"""Compare bytes on the wire and throughput of a wide result set with and
+without the compressed protocol, against a stand-in server.
+
+The result set has TEXT and JSON columns shaped like post bodies and message
+history.  The server runs in its own process, and compresses its responses as
+MySQL does, so the timings include the server's compression work.  Pass
+``--mbps`` to limit the server's sending rate, standing in for a link between
+availability zones rather than the loopback interface.
+
+Run from the repository root::
+
+    python benchmarks/bench_compression.py [--rows N] [--repeat N] [--mbps N]
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+
+import fakemysql  # noqa: E402
+import pymysql  # noqa: E402
+from pymysql.constants import FIELD_TYPE  # noqa: E402
+
+COLUMNS = [
+    ("id", FIELD_TYPE.LONG, 63),
+    ("title", FIELD_TYPE.VAR_STRING, 45),
+    ("body", FIELD_TYPE.BLOB, 45),
+    ("history", FIELD_TYPE.JSON, 63),
+]
+
+
+def make_handler(rows=20_000):
+    rand = random.Random(0)
+    # a vocabulary of made-up words with a skewed frequency, so that the
+    # text compresses roughly like prose does
+    vocabulary = [
+        "".join(rand.choice("etaoinshrdlucmfwypvbgkjqxz") for _ in range(n))
+        for n in (rand.randint(2, 10) for _ in range(5000))
+    ]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+
+    def text(words):
+        return " ".join(rand.choices(vocabulary, weights, k=words))
+
+    data = []
+    for i in range(rows):
+        history = [
+            {
+                "from": rand.randrange(100_000),
+                "at": 1_700_000_000 + i * 60 + n,
+                "text": text(rand.randint(5, 30)),
+            }
+            for n in range(5)
+        ]
+        data.append(
+            [
+                b"%d" % i,
+                text(8).encode(),
+                text(rand.randint(50, 300)).encode(),
+                json.dumps(history).encode(),
+            ]
+        )
+    result = ("rs", COLUMNS, data)
+
+    def handler(sql):
+        if sql.startswith("SELECT"):
+            return [result]
+        return [("ok", 0)]
+
+    return handler
+
+
+def _bytes_sent(cursor):
+    cursor.execute("SHOW SESSION STATUS LIKE 'Bytes_sent'")
+    return int(cursor.fetchone()[1])
+
+
+def run(port, repeat, **kw):
+    conn = pymysql.connect(
+        host="127.0.0.1", port=port, user="bench", password="", **kw
+    )
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT")
+        cursor.fetchall()
+        best = None
+        for _ in range(repeat):
+            before = _bytes_sent(cursor)
+            start = time.perf_counter()
+            cursor.execute("SELECT")
+            rows = cursor.fetchall()
+            elapsed = time.perf_counter() - start
+            wire = _bytes_sent(cursor) - before
+            best = elapsed if best is None else min(best, elapsed)
+        payload = sum(len(v) for row in rows for v in row[1:]) + 4 * len(rows)
+        return len(rows), payload, wire, best
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--mbps", type=float, help="limit the server to this many megabits/s"
+    )
+    args = parser.parse_args()
+
+    port = fakemysql.serve_in_process(
+        functools.partial(make_handler, args.rows),
+        cache_results=True,
+        bandwidth=args.mbps * 1e6 / 8 if args.mbps else None,
+    )
+    modes = [{}, {"compress": "zlib"}]
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        print("zstandard is not installed; skipping zstd")
+    else:
+        modes.append({"compress": "zstd"})
+
+    baseline = None
+    for kw in modes:
+        count, payload, wire, best = run(port, args.repeat, **kw)
+        baseline = baseline or wire
+        print(
+            "%-12s %d rows  %6.1f MB on the wire (%5.1f%%)  %.3fs  %6.1f MB/s"
+            % (
+                kw.get("compress", "none"),
+                count,
+                wire / 1e6,
+                100.0 * wire / baseline,
+                best,
+                payload / 1e6 / best,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Time the PyMySQL temporal converters per call, against the regex-only
+implementations kept in ``tests/test_pymysql_converters.py``.
+
+Run from the repository root::
+
+    python benchmarks/bench_converters.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+here = os.path.dirname(__file__)
+sys.path.insert(
+    0, os.path.join(here, "..", "myenv", "lib", "python3.11", "site-packages")
+)
+sys.path.insert(0, os.path.join(here, "..", "tests"))
+
+from pymysql import converters  # noqa: E402
+import test_pymysql_converters as regex  # noqa: E402
+
+VALUES = [
+    ("DATETIME", "convert_datetime", b"2024-03-01 12:34:56"),
+    ("DATETIME(6)", "convert_datetime", b"2024-03-01 12:34:56.123456"),
+    ("zero DATETIME", "convert_datetime", b"0000-00-00 00:00:00"),
+    ("DATE", "convert_date", b"2024-03-01"),
+    ("TIME as time", "convert_time", b"12:34:56"),
+    ("TIME as timedelta", "convert_timedelta", b"12:34:56"),
+    ("negative TIME", "convert_timedelta", b"-838:59:59"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print("%-20s %10s %10s" % ("per call", "regex", "current"))
+    for label, name, value in VALUES:
+        timings = []
+        for fn in (getattr(regex, "regex_" + name), getattr(converters, name)):
+            best = min(
+                timeit.repeat(lambda: fn(value), number=args.number, repeat=3)
+            )
+            timings.append(best / args.number * 1e6)
+        print("%-20s %8.2fus %8.2fus" % (label, *timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Time the escaping of query arguments by ``Cursor.mogrify()`` and by the
+statements ``executemany()`` builds, comparing the per-type escapers of the
+connection with escaping every value through ``Connection.literal()``.
+
+No server is needed: the connection is created with ``defer_connect=True``.
+
+Run from the repository root::
+
+    python benchmarks/bench_mogrify.py [--number N]
+"""
+
+import argparse
+import datetime
+import decimal
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+
+import pymysql  # noqa: E402
+from pymysql.cursors import Cursor  # noqa: E402
+
+
+class LiteralCursor(Cursor):
+    """Escape each argument with Connection.literal(), as Cursor used to."""
+
+    def _escape_args(self, args, conn):
+        if isinstance(args, (tuple, list)):
+            return tuple(conn.literal(arg) for arg in args)
+        elif isinstance(args, dict):
+            return {key: conn.literal(val) for (key, val) in args.items()}
+        else:
+            return conn.escape(args)
+
+
+ROW = (
+    1,
+    "hello world",
+    2.5,
+    None,
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    decimal.Decimal("1.25"),
+)
+INSERT = "INSERT INTO t (a, b, c, d, e, f) VALUES (%s, %s, %s, %s, %s, %s)"
+UPDATE = "UPDATE t SET b = %s, c = %s, d = %s, e = %s, f = %s WHERE a = %s"
+
+
+def shapes(cursor):
+    rows = [ROW] * 100
+    return [
+        ("scalar", 1, lambda: cursor.mogrify("SELECT %s", 5)),
+        ("tuple of 6", 1, lambda: cursor.mogrify(INSERT, ROW)),
+        (
+            "dict of 3",
+            1,
+            lambda: cursor.mogrify(
+                "SELECT * FROM t WHERE a = %(a)s AND b = %(b)s AND c = %(c)s",
+                {"a": 1, "b": "x'y", "c": b"bytes"},
+            ),
+        ),
+        (
+            "executemany INSERT",
+            len(rows),
+            lambda: list(
+                cursor._insert_batches(
+                    "INSERT INTO t (a, b, c, d, e, f) VALUES ",
+                    "(%s, %s, %s, %s, %s, %s)",
+                    "",
+                    rows,
+                    cursor.max_stmt_length,
+                    "utf8",
+                )
+            ),
+        ),
+        (
+            "executemany UPDATE",
+            len(rows),
+            lambda: list(
+                cursor._statement_batches(
+                    UPDATE, rows, cursor.max_stmt_length, "utf8"
+                )
+            ),
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    conn = pymysql.connect(defer_connect=True)
+    # set from the server's handshake on a real connection
+    conn.server_status = 0
+    old = shapes(LiteralCursor(conn))
+    new = shapes(Cursor(conn))
+
+    print("%-20s %12s %12s" % ("per call", "literal()", "escapers"))
+    for (name, rows, old_fn), (_, _, new_fn) in zip(old, new):
+        assert old_fn() == new_fn(), name
+        number = max(args.number // rows, 1)
+        old_us = min(timeit.repeat(old_fn, number=number, repeat=3)) / number * 1e6
+        new_us = min(timeit.repeat(new_fn, number=number, repeat=3)) / number * 1e6
+        print("%-20s %10.2fus %10.2fus" % (name, old_us, new_us))
+
+
+if __name__ == "__main__":
+    main()
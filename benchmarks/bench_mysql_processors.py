@@ -0,0 +1,207 @@
+"""Compare result processing of a wide MySQL table with the per-value
+closures the MySQL types used to return and with the processors they return
+now.
+
+The table has JSON and DECIMAL columns along with TIME, SET and BIT ones.
+Rows hold the values PyMySQL hands over for these columns, and are built into
+``Row`` objects with the processors of the ``mysql+pymysql`` dialect, which is
+the work ``CursorResult`` does for each fetched row.  No server is involved.
+
+Run from the repository root::
+
+    python benchmarks/bench_mysql_processors.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import datetime
+import decimal
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+
+from sqlalchemy import util  # noqa: E402
+from sqlalchemy.dialects import mysql  # noqa: E402
+from sqlalchemy.dialects.mysql import pymysql as mysql_pymysql  # noqa: E402
+from sqlalchemy.engine import processors  # noqa: E402
+from sqlalchemy.engine.row import Row  # noqa: E402
+
+FLAGS = ["a", "b", "c", "d", "e", "f"]
+
+# (type, make a value as PyMySQL returns it); repeated to make the table wide
+COLUMN_KINDS = [
+    (mysql.INTEGER(), lambda r: r.randrange(1 << 31)),
+    (
+        mysql.DECIMAL(12, 2),
+        lambda r: decimal.Decimal(r.randrange(10**8)).scaleb(-2),
+    ),
+    (
+        mysql.DECIMAL(12, 4, asdecimal=False),
+        lambda r: decimal.Decimal(r.randrange(10**10)).scaleb(-4),
+    ),
+    (
+        mysql.JSON(),
+        lambda r: json.dumps(
+            {"id": r.randrange(1000), "tags": r.sample(FLAGS, 3), "ok": True}
+        ),
+    ),
+    (
+        mysql.TIME(),
+        lambda r: datetime.timedelta(
+            seconds=r.randrange(86400), microseconds=r.randrange(10**6)
+        ),
+    ),
+    (
+        mysql.SET(*FLAGS),
+        lambda r: ",".join(sorted(r.sample(FLAGS, r.randint(0, 3)))),
+    ),
+    (
+        mysql.SET(*FLAGS, retrieve_as_bitwise=True),
+        lambda r: r.randrange(1 << len(FLAGS)),
+    ),
+    (mysql.BIT(16), lambda r: r.randrange(1 << 16).to_bytes(2, "big")),
+]
+
+
+def _baseline_processor(type_, dialect):
+    """Return the per-value closure the MySQL type returned before the
+    dedicated processors were added, or None to keep its current one."""
+
+    if isinstance(type_, mysql.JSON):
+        json_deserializer = dialect._json_deserializer or json.loads
+
+        def process(value):
+            if value is None:
+                return None
+            return json_deserializer(value)
+
+        return process
+
+    elif isinstance(type_, mysql.TIME):
+        time_ = datetime.time
+
+        def process(value):
+            if value is not None:
+                microseconds = value.microseconds
+                seconds = value.seconds
+                minutes = seconds // 60
+                return time_(
+                    minutes // 60,
+                    minutes % 60,
+                    seconds - minutes * 60,
+                    microsecond=microseconds,
+                )
+            else:
+                return None
+
+        return process
+
+    elif isinstance(type_, mysql.SET):
+        if type_.retrieve_as_bitwise:
+            bitmap = type_._bitmap
+
+            def process(value):
+                if value is not None:
+                    value = int(value)
+                    return set(util.map_bits(bitmap.__getitem__, value))
+                else:
+                    return None
+
+            return process
+
+        def process(value):
+            if isinstance(value, str):
+                return set(re.findall(r"[^,]+", value))
+            else:
+                if value is not None:
+                    value.discard("")
+                return value
+
+        return process
+
+    elif isinstance(type_, mysql.BIT):
+
+        def process(value):
+            if value is not None:
+                v = 0
+                for i in value:
+                    if not isinstance(i, int):
+                        i = ord(i)
+                    v = v << 8 | i
+                return v
+            return value
+
+        return process
+
+    return None
+
+
+def build(width, rows):
+    rand = random.Random(0)
+    kinds = [COLUMN_KINDS[i % len(COLUMN_KINDS)] for i in range(width)]
+    data = [
+        tuple(
+            None if rand.random() < 0.05 else make(rand) for _, make in kinds
+        )
+        for _ in range(rows)
+    ]
+    return [type_ for type_, _ in kinds], data
+
+
+def run(procs, data, keymap, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in data:
+            Row(None, procs, keymap, raw)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dialect = mysql_pymysql.dialect()
+    types, data = build(args.width, args.rows)
+    keymap = {"c%d" % i: i for i in range(args.width)}
+
+    current = [
+        t.dialect_impl(dialect).result_processor(dialect, None) for t in types
+    ]
+    baseline = [
+        _baseline_processor(t, dialect) or proc for t, proc in zip(types, current)
+    ]
+
+    for raw in data[:1000]:
+        assert Row(None, current, keymap, raw) == Row(None, baseline, keymap, raw)
+
+    print(
+        "%d rows of %d columns, %s processors"
+        % (
+            args.rows,
+            args.width,
+            "compiled" if processors.HAS_CYEXTENSION else "pure-Python",
+        )
+    )
+    old = run(baseline, data, keymap, args.repeat)
+    new = run(current, data, keymap, args.repeat)
+    print("per-value closures: %.3fs" % old)
+    print("MySQL processors:   %.3fs  (%.2fx)" % (new, old / new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare AffinityQueuePool with QueuePool under thread contention.
+
+Each thread loops over ``connect()`` / ``close()`` on a pool of sqlite
+connections, so the time measured is that of checking connections out and in.
+Runs use 8, 32 and 128 threads with ``pool_size`` equal to the thread count,
+then 32 threads sharing a pool of 4 with a short sleep while a connection is
+held, where threads have to wait for each other.
+
+Run from the repository root::
+
+    python benchmarks/bench_pool_contention.py [--checkouts N]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+
+from sqlalchemy.pool import AffinityQueuePool  # noqa: E402
+from sqlalchemy.pool import QueuePool  # noqa: E402
+
+
+def run(pool_cls, threads, checkouts, pool_size, max_overflow, hold=0.0):
+    """Return the elapsed time and the number of connections opened."""
+    opened = []
+
+    def creator():
+        opened.append(None)
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    pool = pool_cls(
+        creator, pool_size=pool_size, max_overflow=max_overflow, timeout=30
+    )
+    errors = []
+    per_thread = checkouts // threads
+
+    def work():
+        rand = random.Random()
+        try:
+            for _ in range(per_thread):
+                conn = pool.connect()
+                if hold:
+                    time.sleep(hold * rand.random())
+                conn.close()
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    assert not errors, errors[:3]
+    assert pool.checkedout() == 0, pool.status()
+    pool.dispose()
+    return elapsed, len(opened)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--checkouts", type=int, default=160_000)
+    args = parser.parse_args()
+
+    runs = [
+        ("%d threads" % threads, dict(threads=threads, pool_size=threads))
+        for threads in (8, 32, 128)
+    ] + [
+        (
+            "32 threads, pool of 4",
+            dict(threads=32, pool_size=4, hold=0.001),
+        )
+    ]
+
+    print("%-24s %22s %22s" % ("", "QueuePool", "AffinityQueuePool"))
+    for label, kw in runs:
+        checkouts = args.checkouts if not kw.get("hold") else 6400
+        cells = []
+        for pool_cls in (QueuePool, AffinityQueuePool):
+            elapsed, opened = run(
+                pool_cls, checkouts=checkouts, max_overflow=10, **kw
+            )
+            cells.append("%.3fs, %3d opened" % (elapsed, opened))
+        print("%-24s %22s %22s" % (label, *cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Time reading a 1M-row SELECT from a stand-in server, with the default
+buffered socket reads and with ``recv_buffer_size``.
+
+Run from the repository root::
+
+    python benchmarks/bench_read_packet.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+
+import fakemysql  # noqa: E402
+import pymysql  # noqa: E402
+from pymysql.constants import FIELD_TYPE  # noqa: E402
+
+COLUMNS = [
+    ("id", FIELD_TYPE.LONG, 63),
+    ("name", FIELD_TYPE.VAR_STRING, 45),
+    ("data", FIELD_TYPE.BLOB, 63),
+]
+
+
+def make_handler(rows=1_000_000):
+    result = (
+        "rs",
+        COLUMNS,
+        [[b"%d" % i, b"name%d" % i, b"abcdefghij" * 5] for i in range(rows)],
+    )
+
+    def handler(sql):
+        if sql.startswith("SELECT"):
+            return [result]
+        return [("ok", 0)]
+
+    return handler
+
+
+def run(port, cursorclass, repeat, **kw):
+    conn = pymysql.connect(
+        host="127.0.0.1", port=port, user="bench", password="", **kw
+    )
+    try:
+        cursor = conn.cursor(cursorclass)
+        # the first query warms up the server's result cache
+        cursor.execute("SELECT")
+        cursor.fetchall()
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            cursor.execute("SELECT")
+            count = len(cursor.fetchall())
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return count, best
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    port = fakemysql.serve_in_process(
+        functools.partial(make_handler, args.rows), cache_results=True
+    )
+    for cursorclass in (pymysql.cursors.Cursor, pymysql.cursors.SSCursor):
+        for kw in ({}, {"recv_buffer_size": 256 * 1024}):
+            count, best = run(port, cursorclass, args.repeat, **kw)
+            mode = (
+                "recv_buffer_size=%d" % kw["recv_buffer_size"]
+                if kw
+                else "buffered socket reads"
+            )
+            print(
+                "%-9s %-24s %d rows  %.3fs"
+                % (cursorclass.__name__, mode, count, best)
+            )
+
+
+if __name__ == "__main__":
+    main()
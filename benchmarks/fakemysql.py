@@ -0,0 +1,633 @@
+"""A stand-in MySQL server for benchmarking PyMySQL without a real server.
+
+It speaks just enough of the client/server protocol for ``pymysql.connect()``
+to log in with ``mysql_native_password`` (any password is accepted, unless the
+server is given one), after switching to another authentication method if
+asked to, and for
+``COM_QUERY`` to return result sets or OK packets.  Prepared statements are
+supported too: ``COM_STMT_EXECUTE`` answers with the binary protocol, and the
+decoded parameters of each execution and the ids of closed statements are
+recorded.  The compressed protocol is
+supported with zlib, and with zstd if the ``zstandard`` package is installed.
+``SHOW SESSION STATUS LIKE 'Bytes_sent'`` returns the number of bytes sent on
+the connection so far, as it does on MySQL.
+
+The server is given a ``handler(sql)`` returning a list of responses, one per
+result of the query:
+
+* ``("ok", affected_rows[, insert_id])``
+* ``("err", errno, message)``
+* ``("rs", columns, rows)``, where ``columns`` is a list of
+  ``(name, type_code, charsetnr)`` and ``rows`` a list of lists of ``bytes``
+  or ``None``.  Values are given in their text protocol form; in results of
+  prepared statements they are converted to the binary protocol form of the
+  column type.
+
+For a prepared statement, the handler receives the SQL with its ``?``
+placeholders.
+
+Result sets can be large; pass ``cache_results=True`` to encode each distinct
+response once and send the same bytes for every later query, so that the
+server isn't the bottleneck of a client-side benchmark.
+"""
+
+import datetime
+import decimal
+import hashlib
+import itertools
+import socket
+import struct
+import threading
+import time
+
+SERVER_MORE_RESULTS_EXISTS = 8
+SERVER_STATUS_AUTOCOMMIT = 2
+
+COM_QUIT = 0x01
+COM_INIT_DB = 0x02
+COM_QUERY = 0x03
+COM_PING = 0x0E
+COM_STMT_PREPARE = 0x16
+COM_STMT_EXECUTE = 0x17
+COM_STMT_CLOSE = 0x19
+
+CLIENT_COMPRESS = 1 << 5
+CLIENT_SSL = 1 << 11
+CLIENT_DEPRECATE_EOF = 1 << 24
+CLIENT_ZSTD_COMPRESSION_ALGORITHM = 1 << 26
+
+# field types, see pymysql.constants.FIELD_TYPE
+_INT_SIZES = {1: 1, 2: 2, 3: 4, 8: 8, 9: 4, 13: 2}
+_FLOAT = 4
+_DOUBLE = 5
+_DATE_TYPES = (7, 10, 12, 14)  # TIMESTAMP, DATE, DATETIME, NEWDATE
+_TIME = 11
+_NEWDECIMAL = 246
+_NULL = 6
+
+#: packets shorter than this are sent uncompressed, as the server does
+MIN_COMPRESS_LENGTH = 50
+#: the server compresses what it has buffered when its network buffer of
+#: net_buffer_length bytes fills up
+NET_BUFFER_LENGTH = 16384
+
+
+def lenenc(i):
+    if i < 251:
+        return bytes([i])
+    if i < 1 << 16:
+        return b"\xfc" + struct.pack("<H", i)
+    if i < 1 << 24:
+        return b"\xfd" + struct.pack("<I", i)[:3]
+    return b"\xfe" + struct.pack("<Q", i)
+
+
+def lenenc_str(b):
+    return lenenc(len(b)) + b
+
+
+def _binary_value(type_code, text):
+    """Convert a value from its text protocol form to the binary protocol."""
+    if type_code in _INT_SIZES:
+        size = _INT_SIZES[type_code]
+        return int(text).to_bytes(size, "little", signed=int(text) < 0)
+    if type_code == _FLOAT:
+        return struct.pack("<f", float(text))
+    if type_code == _DOUBLE:
+        return struct.pack("<d", float(text))
+    if type_code in _DATE_TYPES:
+        date, _, time_ = text.decode().partition(" ")
+        year, month, day = map(int, date.split("-"))
+        hms, _, fraction = time_.partition(".")
+        hour, minute, second = map(int, hms.split(":")) if hms else (0, 0, 0)
+        microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+        if microsecond:
+            return struct.pack(
+                "<BHBBBBBI", 11, year, month, day, hour, minute, second, microsecond
+            )
+        if hour or minute or second:
+            return struct.pack("<BHBBBBB", 7, year, month, day, hour, minute, second)
+        if year or month or day:
+            return struct.pack("<BHBB", 4, year, month, day)
+        return b"\x00"
+    if type_code == _TIME:
+        text = text.decode()
+        negative = text.startswith("-")
+        hms, _, fraction = text.lstrip("-").partition(".")
+        hour, minute, second = map(int, hms.split(":"))
+        microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+        return struct.pack(
+            "<BBIBBBI",
+            12,
+            negative,
+            hour // 24,
+            hour % 24,
+            minute,
+            second,
+            microsecond,
+        )
+    return lenenc_str(text)
+
+
+def _read_lenenc(data, pos):
+    first = data[pos]
+    if first < 251:
+        return first, pos + 1
+    size = {0xFC: 2, 0xFD: 3, 0xFE: 8}[first]
+    return int.from_bytes(data[pos + 1 : pos + 1 + size], "little"), pos + 1 + size
+
+
+def _parse_param(data, pos, type_code, unsigned):
+    """Decode a parameter of COM_STMT_EXECUTE; return it and the next pos."""
+    if type_code in _INT_SIZES:
+        size = _INT_SIZES[type_code]
+        value = int.from_bytes(data[pos : pos + size], "little", signed=not unsigned)
+        return value, pos + size
+    if type_code == _FLOAT:
+        return struct.unpack_from("<f", data, pos)[0], pos + 4
+    if type_code == _DOUBLE:
+        return struct.unpack_from("<d", data, pos)[0], pos + 8
+    if type_code in _DATE_TYPES or type_code == _TIME:
+        length = data[pos]
+        body = data[pos + 1 : pos + 1 + length]
+        pos += 1 + length
+        if type_code == _TIME:
+            negative, days, hour, minute, second, microsecond = struct.unpack(
+                "<BIBBBI", body.ljust(12, b"\x00")
+            )
+            value = datetime.timedelta(
+                days=days,
+                hours=hour,
+                minutes=minute,
+                seconds=second,
+                microseconds=microsecond,
+            )
+            return (-value if negative else value), pos
+        year, month, day, hour, minute, second, microsecond = struct.unpack(
+            "<HBBBBBI", body.ljust(11, b"\x00")
+        )
+        if length == 4:
+            return datetime.date(year, month, day), pos
+        return (
+            datetime.datetime(year, month, day, hour, minute, second, microsecond),
+            pos,
+        )
+    length, pos = _read_lenenc(data, pos)
+    value = data[pos : pos + length]
+    pos += length
+    if type_code == _NEWDECIMAL:
+        return decimal.Decimal(value.decode()), pos
+    if type_code in (0xFC, 0xF9, 0xFA, 0xFB):  # BLOB types
+        return value, pos
+    return value.decode("utf8", "surrogateescape"), pos
+
+
+def _xor(a, b):
+    return bytes(x ^ y for x, y in zip(a, b))
+
+
+def _auth_response(plugin, password, salt):
+    """Return the response a client sends for password to the salt of an
+    authentication method."""
+    if not password:
+        return b""
+    if plugin == "mysql_native_password":
+        stage1 = hashlib.sha1(password).digest()
+        stage2 = hashlib.sha1(stage1).digest()
+        return _xor(hashlib.sha1(salt[:20] + stage2).digest(), stage1)
+    if plugin == "caching_sha2_password":
+        p1 = hashlib.sha256(password).digest()
+        p2 = hashlib.sha256(p1).digest()
+        return _xor(p1, hashlib.sha256(p2 + salt).digest())
+    if plugin == "mysql_clear_password":
+        return password + b"\0"
+    raise ValueError(f"unsupported authentication method {plugin!r}")
+
+
+class _PreparedStatement:
+    def __init__(self, sql):
+        self.sql = sql
+        self.param_count = sql.count("?")
+        self.types = None
+
+
+class _CompressedReader:
+    """Read the stream carried by compressed packets."""
+
+    def __init__(self, conn, raw):
+        self.conn = conn
+        self.raw = raw
+        self.buf = b""
+
+    def read(self, num_bytes):
+        while len(self.buf) < num_bytes:
+            header = self.raw.read(7)
+            if len(header) < 7:
+                return b""
+            length = header[0] | header[1] << 8 | header[2] << 16
+            self.conn.compressed_seq = (header[3] + 1) % 256
+            uncompressed = header[4] | header[5] << 8 | header[6] << 16
+            payload = self.raw.read(length)
+            if uncompressed:
+                payload = self.conn.decompress(payload, uncompressed)
+            self.buf += payload
+        data, self.buf = self.buf[:num_bytes], self.buf[num_bytes:]
+        return data
+
+
+class _Conn:
+    def __init__(self, sock, server):
+        self.sock = sock
+        self.rfile = sock.makefile("rb")
+        self.server = server
+        self.seq = 0
+        self.out = bytearray()
+        self.bytes_sent = 0
+        self.compress = None
+        self.statements = {}
+
+    def send(self, payload):
+        while True:
+            chunk = payload[:0xFFFFFF]
+            payload = payload[0xFFFFFF:]
+            self.out += struct.pack("<I", len(chunk))[:3] + bytes([self.seq]) + chunk
+            self.seq = (self.seq + 1) % 256
+            if len(chunk) < 0xFFFFFF:
+                break
+
+    def flush(self):
+        out = bytes(self.out)
+        self.out = bytearray()
+        if self.compress is not None:
+            out = self._compress(out)
+        self.bytes_sent += len(out)
+        bandwidth = self.server.bandwidth
+        if bandwidth:
+            # send at most bandwidth bytes per second
+            for start in range(0, len(out), 65536):
+                chunk = out[start : start + 65536]
+                self.sock.sendall(chunk)
+                time.sleep(len(chunk) / bandwidth)
+        else:
+            self.sock.sendall(out)
+
+    def _compress(self, data):
+        frames = []
+        for start in range(0, len(data), NET_BUFFER_LENGTH):
+            chunk = data[start : start + NET_BUFFER_LENGTH]
+            length = len(chunk)
+            if length >= MIN_COMPRESS_LENGTH:
+                chunk = self.compress(chunk)
+            else:
+                length = 0
+            frames.append(
+                struct.pack("<I", len(chunk))[:3]
+                + bytes([self.compressed_seq])
+                + struct.pack("<I", length)[:3]
+            )
+            frames.append(chunk)
+            self.compressed_seq = (self.compressed_seq + 1) % 256
+        return b"".join(frames)
+
+    def recv(self):
+        data = b""
+        while True:
+            hdr = self.rfile.read(4)
+            if len(hdr) < 4:
+                return None
+            length = hdr[0] | hdr[1] << 8 | hdr[2] << 16
+            self.seq = (hdr[3] + 1) % 256
+            data += self.rfile.read(length)
+            if length < 0xFFFFFF:
+                return data
+
+    def ok(self, affected=0, insert_id=0, status=SERVER_STATUS_AUTOCOMMIT):
+        self.send(
+            b"\x00"
+            + lenenc(affected)
+            + lenenc(insert_id)
+            + struct.pack("<HH", status, 0)
+        )
+
+    def eof(self, status=SERVER_STATUS_AUTOCOMMIT):
+        self.send(b"\xfe" + struct.pack("<HH", 0, status))
+
+    def err(self, errno, msg):
+        self.send(b"\xff" + struct.pack("<H", errno) + b"#HY000" + msg.encode())
+
+    def coldef(self, name, type_code, charsetnr=45):
+        name = name.encode()
+        self.send(
+            lenenc_str(b"def")
+            + lenenc_str(b"db")
+            + lenenc_str(b"t")
+            + lenenc_str(b"t")
+            + lenenc_str(name)
+            + lenenc_str(name)
+            + b"\x0c"
+            + struct.pack("<HIBHB", charsetnr, 255, type_code, 0, 0)
+            + b"\x00\x00"
+        )
+
+    def result(self, resp, more, binary=False):
+        status = SERVER_STATUS_AUTOCOMMIT
+        if more:
+            status |= SERVER_MORE_RESULTS_EXISTS
+        kind = resp[0]
+        if kind == "ok":
+            self.ok(resp[1], resp[2] if len(resp) > 2 else 0, status)
+            return True
+        if kind == "err":
+            self.err(resp[1], resp[2])
+            return False
+
+        cache = self.server.result_cache
+        if cache is not None:
+            # the sequence ids within a result set don't depend on its
+            # content, only on where it starts
+            key = (id(resp), more, self.seq, binary)
+            cached = cache.get(key)
+            if cached is None:
+                start = len(self.out)
+                self._result_set(resp, status, binary)
+                cache[key] = (bytes(self.out[start:]), self.seq)
+            else:
+                self.out += cached[0]
+                self.seq = cached[1]
+        else:
+            self._result_set(resp, status, binary)
+        return True
+
+    def _result_set(self, resp, status, binary=False):
+        columns, rows = resp[1], resp[2]
+        self.send(lenenc(len(columns)))
+        for column in columns:
+            self.coldef(*column)
+        self.eof()
+        if binary:
+            types = [column[1] for column in columns]
+            for row in rows:
+                # the NULL bitmap of binary rows has an offset of 2 bits
+                null_bitmap = bytearray((len(row) + 9) // 8)
+                values = []
+                for i, (type_code, v) in enumerate(zip(types, row)):
+                    if v is None:
+                        null_bitmap[(i + 2) // 8] |= 1 << ((i + 2) % 8)
+                    else:
+                        values.append(_binary_value(type_code, v))
+                self.send(b"\x00" + bytes(null_bitmap) + b"".join(values))
+        else:
+            for row in rows:
+                self.send(
+                    b"".join(b"\xfb" if v is None else lenenc_str(v) for v in row)
+                )
+        self.eof(status)
+
+    def handshake(self):
+        salt = b"abcdefghijklmnopqrst"
+        caps = 0xFFFFFFFF & ~CLIENT_SSL & ~CLIENT_DEPRECATE_EOF
+        caps &= self.server.capabilities
+        self.send(
+            b"\x0a"
+            + b"8.0.99-stand-in\x00"
+            + struct.pack("<I", 42)
+            + salt[:8]
+            + b"\x00"
+            + struct.pack("<H", caps & 0xFFFF)
+            + bytes([45])
+            + struct.pack("<H", SERVER_STATUS_AUTOCOMMIT)
+            + struct.pack("<H", caps >> 16)
+            + bytes([21])
+            + b"\x00" * 10
+            + salt[8:]
+            + b"\x00"
+            + b"mysql_native_password\x00"
+        )
+        self.flush()
+        response = self.recv()
+        self.client_flag = struct.unpack("<I", response[:4])[0]
+        if not self.authenticate(response, salt):
+            self.err(1045, "Access denied")
+            self.flush()
+            raise ValueError("access denied")
+        self.ok()
+        self.flush()
+
+        if self.client_flag & CLIENT_ZSTD_COMPRESSION_ALGORITHM:
+            import zstandard
+
+            # the compression level is the last byte of the response
+            compressor = zstandard.ZstdCompressor(level=response[-1])
+            decompressor = zstandard.ZstdDecompressor()
+            self.compress = compressor.compress
+            self.decompress = lambda data, length: decompressor.decompress(
+                data, max_output_size=length
+            )
+        elif self.client_flag & CLIENT_COMPRESS:
+            import zlib
+
+            self.compress = zlib.compress
+            self.decompress = lambda data, length: zlib.decompress(data)
+        if self.compress is not None:
+            self.rfile = _CompressedReader(self, self.rfile)
+
+    def authenticate(self, response, salt):
+        """Check the password of the handshake response, switching to the
+        server's auth_switch method first if it has one."""
+        # user name, then the length encoded auth response
+        pos = response.index(b"\0", 32) + 1
+        length, pos = _read_lenenc(response, pos)
+        auth = response[pos : pos + length]
+        plugin = "mysql_native_password"
+        switch = self.server.auth_switch
+        if switch is not None:
+            plugin = switch
+            salt = b"ABCDEFGHIJKLMNOPQRST\0"
+            self.send(b"\xfe" + plugin.encode() + b"\0" + salt)
+            self.flush()
+            auth = self.recv()
+        password = self.server.password
+        if password is None:
+            return True
+        if auth != _auth_response(plugin, password.encode(), salt):
+            return False
+        if plugin == "caching_sha2_password":
+            # fast authentication succeeded
+            self.send(b"\x01\x03")
+        return True
+
+    def run(self):
+        self.handshake()
+        while True:
+            data = self.recv()
+            if not data or data[0] == COM_QUIT:
+                return
+            self.dispatch(data)
+            self.flush()
+
+    def dispatch(self, data):
+        command = data[0]
+        if command in (COM_PING, COM_INIT_DB):
+            self.ok()
+        elif command == COM_QUERY:
+            sql = data[1:].decode("utf8", "surrogateescape")
+            self.server.queries.append(sql)
+            if sql == "SHOW SESSION STATUS LIKE 'Bytes_sent'":
+                # not cached, so bypass result()
+                self._result_set(
+                    (
+                        "rs",
+                        [("Variable_name", 253, 45), ("Value", 253, 45)],
+                        [[b"Bytes_sent", b"%d" % self.bytes_sent]],
+                    ),
+                    SERVER_STATUS_AUTOCOMMIT,
+                )
+                return
+            responses = self.server.handler(sql)
+            for idx, resp in enumerate(responses):
+                if not self.result(resp, idx < len(responses) - 1):
+                    break
+        elif command == COM_STMT_PREPARE:
+            self.prepare(data[1:].decode("utf8", "surrogateescape"))
+        elif command == COM_STMT_EXECUTE:
+            self.execute(data[1:])
+        elif command == COM_STMT_CLOSE:
+            # no response
+            statement_id = struct.unpack_from("<I", data, 1)[0]
+            self.statements.pop(statement_id, None)
+            self.server.closed_statements.append(statement_id)
+        else:
+            self.err(1047, "Unknown command")
+
+
+    def prepare(self, sql):
+        statement_id = self.server.next_statement_id()
+        stmt = self.statements[statement_id] = _PreparedStatement(sql)
+        # The columns of the result are only known when the handler is called,
+        # so none are announced here; they are sent with each result set.
+        self.send(
+            b"\x00" + struct.pack("<IHHxH", statement_id, 0, stmt.param_count, 0)
+        )
+        if stmt.param_count:
+            for _ in range(stmt.param_count):
+                self.coldef("?", 253)
+            self.eof()
+
+    def execute(self, data):
+        statement_id = struct.unpack_from("<I", data)[0]
+        stmt = self.statements.get(statement_id)
+        if stmt is None:
+            self.err(1243, "Unknown prepared statement handler")
+            return
+        params = []
+        if stmt.param_count:
+            pos = 9
+            null_bitmap = data[pos : pos + (stmt.param_count + 7) // 8]
+            pos += len(null_bitmap)
+            if data[pos]:
+                # new_params_bound_flag: the types follow
+                stmt.types = [
+                    (data[pos + 1 + 2 * i], data[pos + 2 + 2 * i] & 0x80)
+                    for i in range(stmt.param_count)
+                ]
+                pos += 2 * stmt.param_count
+            pos += 1
+            for i, (type_code, unsigned) in enumerate(stmt.types):
+                if null_bitmap[i // 8] & 1 << (i % 8) or type_code == _NULL:
+                    params.append(None)
+                else:
+                    value, pos = _parse_param(data, pos, type_code, unsigned)
+                    params.append(value)
+        self.server.executions.append((stmt.sql, params))
+        responses = self.server.handler(stmt.sql)
+        for idx, resp in enumerate(responses):
+            if not self.result(resp, idx < len(responses) - 1, binary=True):
+                break
+
+
+class FakeServer:
+    """Listen on an ephemeral port of 127.0.0.1, serving each connection on
+    its own daemon thread.
+
+    :param handler: callable receiving the SQL of a ``COM_QUERY`` or of a
+     prepared statement and returning a list of responses.
+    :param capabilities: mask applied to the capability flags the server
+     advertises.
+    :param cache_results: send the bytes of a result set encoded earlier for
+     the same response object, rather than encoding it again.
+    :param bandwidth: limit the bytes per second sent on each connection, to
+     stand in for a slower network than the loopback interface.
+    :param password: the password clients must log in with; any is accepted
+     if None.
+    :param auth_switch: the authentication method the server asks clients to
+     switch to after their handshake response: ``"mysql_native_password"``,
+     ``"caching_sha2_password"`` (fast authentication only) or
+     ``"mysql_clear_password"``.
+    """
+
+    def __init__(
+        self,
+        handler,
+        capabilities=0xFFFFFFFF,
+        cache_results=False,
+        bandwidth=None,
+        password=None,
+        auth_switch=None,
+    ):
+        self.handler = handler
+        self.capabilities = capabilities
+        self.result_cache = {} if cache_results else None
+        self.bandwidth = bandwidth
+        self.password = password
+        self.auth_switch = auth_switch
+        self.queries = []
+        self.executions = []
+        self.closed_statements = []
+        self._statement_ids = itertools.count(1)
+        self._sock = socket.socket()
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(16)
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def next_statement_id(self):
+        return next(self._statement_ids)
+
+    def _serve(self):
+        while True:
+            sock, _ = self._sock.accept()
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._run, args=(sock,), daemon=True).start()
+
+    def _run(self, sock):
+        try:
+            _Conn(sock, self).run()
+        except (OSError, ValueError):
+            pass
+        finally:
+            sock.close()
+
+
+def serve_in_process(make_handler, **kw):
+    """Run a :class:`FakeServer` in a child process, so that it doesn't share
+    the GIL with the client being measured, and return its port.
+
+    ``make_handler`` is called in the child to build the handler; it must be
+    a module-level function so that it can be pickled.
+    """
+    import multiprocessing
+
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_serve_forever, args=(queue, make_handler, kw), daemon=True
+    )
+    process.start()
+    return queue.get()
+
+
+def _serve_forever(queue, make_handler, kw):
+    server = FakeServer(make_handler(), **kw)
+    queue.put(server.port)
+    while True:
+        time.sleep(3600)
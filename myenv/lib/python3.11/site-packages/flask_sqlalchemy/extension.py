@@ -21,6 +21,8 @@ from .model import DefaultMeta
 from .model import DefaultMetaNoName
 from .model import Model
 from .model import NameMixin
+from .pagination import _CountCache
+from .pagination import KeysetPagination
 from .pagination import Pagination
 from .pagination import SelectPagination
 from .query import Query
@@ -272,6 +274,12 @@ class SQLAlchemy:
         self._engine_options = engine_options
         self._app_engines: WeakKeyDictionary[Flask, dict[str | None, sa.engine.Engine]]
         self._app_engines = WeakKeyDictionary()
+        self._app_routers: WeakKeyDictionary[
+            Flask, dict[str | None, sa.engine.ReplicaRouter]
+        ]
+        self._app_routers = WeakKeyDictionary()
+        self._app_count_caches: WeakKeyDictionary[Flask, _CountCache]
+        self._app_count_caches = WeakKeyDictionary()
         self._add_models_to_shell = add_models_to_shell
 
         if app is not None:
@@ -303,6 +311,8 @@ class SQLAlchemy:
         - :data:`.SQLALCHEMY_ENGINE_OPTIONS`
         - :data:`.SQLALCHEMY_ECHO`
         - :data:`.SQLALCHEMY_BINDS`
+        - :data:`.SQLALCHEMY_REPLICAS`
+        - :data:`.SQLALCHEMY_REPLICA_OPTIONS`
         - :data:`.SQLALCHEMY_RECORD_QUERIES`
         - :data:`.SQLALCHEMY_TRACK_MODIFICATIONS`
 
@@ -356,7 +366,36 @@ class SQLAlchemy:
                 "Either 'SQLALCHEMY_DATABASE_URI' or 'SQLALCHEMY_BINDS' must be set."
             )
 
+        config_replicas: dict[
+            str | None, list[str | sa.engine.URL | dict[str, t.Any]]
+        ] = app.config.setdefault("SQLALCHEMY_REPLICAS", {})
+        router_options: dict[str, t.Any] = app.config.setdefault(
+            "SQLALCHEMY_REPLICA_OPTIONS", {}
+        )
+        replica_options: dict[str | None, list[dict[str, t.Any]]] = {}
+
+        # Build the engine config for each replica, based on its bind's config.
+        for key, values in config_replicas.items():
+            if key not in engine_options:
+                raise RuntimeError(
+                    f"Bind key '{key}' in 'SQLALCHEMY_REPLICAS' is not in"
+                    " 'SQLALCHEMY_BINDS' config."
+                )
+
+            replica_options[key] = []
+
+            for value in values:
+                options = engine_options[key].copy()
+
+                if isinstance(value, (str, sa.engine.URL)):
+                    options["url"] = value
+                else:
+                    options.update(value)
+
+                replica_options[key].append(options)
+
         engines = self._app_engines.setdefault(app, {})
+        routers = self._app_routers.setdefault(app, {})
 
         # Dispose existing engines in case init_app is called again.
         if engines:
@@ -365,6 +404,12 @@ class SQLAlchemy:
 
             engines.clear()
 
+        if routers:
+            for router in routers.values():
+                router.dispose()
+
+            routers.clear()
+
         # Create the metadata and engine for each bind key.
         for key, options in engine_options.items():
             self._make_metadata(key)
@@ -373,16 +418,41 @@ class SQLAlchemy:
             self._apply_driver_defaults(options, app)
             engines[key] = self._make_engine(key, options, app)
 
+        # Create the replica engines and a router for each bind key with replicas.
+        for key, options_list in replica_options.items():
+            replicas = []
+
+            for options in options_list:
+                options.setdefault("echo", echo)
+                options.setdefault("echo_pool", echo)
+                self._apply_driver_defaults(options, app)
+                replicas.append(self._make_engine(key, options, app))
+
+            routers[key] = sa.engine.ReplicaRouter(
+                engines[key], replicas, **router_options
+            )
+
         if app.config.setdefault("SQLALCHEMY_RECORD_QUERIES", False):
             from . import record_queries
 
             for engine in engines.values():
                 record_queries._listen(engine)
 
+            for router in routers.values():
+                for engine in router.replicas:
+                    record_queries._listen(engine)
+
+        count_cache = self._app_count_caches[app] = _CountCache(
+            app.config.setdefault("SQLALCHEMY_COUNT_CACHE_TTL", 60)
+        )
+
         if app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False):
             from . import track_modifications
 
             track_modifications._listen(self.session)
+            track_modifications.models_committed.connect(
+                count_cache._models_committed, sender=app
+            )
 
     def _make_scoped_session(
         self, options: dict[str, t.Any]
@@ -695,6 +765,25 @@ class SQLAlchemy:
 
         return self._app_engines[app]
 
+    @property
+    def routers(self) -> t.Mapping[str | None, sa.engine.ReplicaRouter]:
+        """Map of bind keys to :class:`sqlalchemy.engine.ReplicaRouter` instances for
+        the current application, for the bind keys which have replicas. The router's
+        ``primary`` is the engine in :attr:`engines` for the same key.
+
+        :attr:`session` sends ``SELECT`` statements to a replica chosen by the router,
+        unless the session has already written in its current transaction. Set the
+        ``readonly`` execution option on a statement to ``True`` or ``False`` to choose
+        explicitly.
+
+        To customize, set the :data:`.SQLALCHEMY_REPLICAS` and
+        :data:`.SQLALCHEMY_REPLICA_OPTIONS` config.
+
+        This requires that a Flask application context is active.
+        """
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+        return self._app_routers.get(app, {})
+
     @property
     def engine(self) -> sa.engine.Engine:
         """The default :class:`~sqlalchemy.engine.Engine` for the current application,
@@ -808,6 +897,7 @@ class SQLAlchemy:
         max_per_page: int | None = None,
         error_out: bool = True,
         count: bool = True,
+        count_mode: t.Literal["exact", "estimate", "cached"] = "exact",
     ) -> Pagination:
         """Apply an offset and limit to a select statment based on the current page and
         number of items per page, returning a :class:`.Pagination` object.
@@ -830,12 +920,26 @@ class SQLAlchemy:
         :param count: Calculate the total number of values by issuing an extra count
             query. For very complex queries this may be inaccurate or slow, so it can be
             disabled and set manually if necessary.
+        :param count_mode: How ``count`` calculates the total. ``"exact"`` issues a
+            count query. ``"estimate"`` uses the row estimate of the database's query
+            planner, which is fast but may be far off; it falls back to a count query
+            if the dialect doesn't support estimates. ``"cached"`` reuses the count for
+            the same statement and parameters for
+            :data:`.SQLALCHEMY_COUNT_CACHE_TTL` seconds. If
+            :data:`.SQLALCHEMY_TRACK_MODIFICATIONS` is enabled, cached counts are also
+            discarded when models of the statement's tables are committed.
 
         .. versionchanged:: 3.0
             The ``count`` query is more efficient.
 
         .. versionadded:: 3.0
         """
+        if count_mode not in {"exact", "estimate", "cached"}:
+            raise ValueError(
+                "'count_mode' must be one of 'exact', 'estimate', or 'cached'."
+            )
+
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
         return SelectPagination(
             select=select,
             session=self.session(),
@@ -844,6 +948,72 @@ class SQLAlchemy:
             max_per_page=max_per_page,
             error_out=error_out,
             count=count,
+            count_mode=count_mode,
+            count_cache=self._app_count_caches.get(app),
+        )
+
+    def invalidate_count_cache(self, *tables: str) -> None:
+        """Discard the counts stored by :meth:`paginate` with ``count_mode="cached"``
+        for the current application. Only counts of statements that select from one of
+        the given table names are discarded, or all counts if no names are given.
+
+        Call this after changing data outside of the session, or if
+        :data:`.SQLALCHEMY_TRACK_MODIFICATIONS` is not enabled.
+        """
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+        cache = self._app_count_caches.get(app)
+
+        if cache is not None:
+            cache.invalidate(tables or None)
+
+    def keyset_paginate(
+        self,
+        select: sa.sql.Select[t.Any],
+        *,
+        key: t.Any,
+        cursor: str | None = None,
+        per_page: int | None = None,
+        max_per_page: int | None = None,
+        error_out: bool = True,
+    ) -> KeysetPagination:
+        """Select the items that follow a cursor in the order of a unique key, based
+        on the number of items per page, returning a :class:`.KeysetPagination` object.
+
+        Unlike :meth:`paginate`, each page is queried with a ``WHERE`` on the key rather
+        than an ``OFFSET``, so deep pages don't get slower, and no count query is run.
+        Pass the :attr:`~.KeysetPagination.next_cursor` of a page, for example as the
+        ``cursor`` query arg, to get the next page.
+
+        The statement should select a model class, like ``select(Post)``. This applies
+        ``unique()`` to the result, and replaces the statement's ``order_by`` with the
+        key.
+
+        .. code-block:: python
+
+            page = db.keyset_paginate(select(Post), key=Post.id)
+            return {"items": [...], "next": page.next_cursor}
+
+        :param select: The ``select`` statement to paginate.
+        :param key: A column, or a sequence of columns, that is unique for each item,
+            like ``Post.id`` or ``(sa.desc(Post.created), sa.desc(Post.id))``.
+        :param cursor: The cursor of the page to get. Defaults to the ``cursor`` query
+            arg during a request, or the first page otherwise.
+        :param per_page: The maximum number of items on a page. Defaults to the
+            ``per_page`` query arg during a request, or 20 otherwise.
+        :param max_per_page: The maximum allowed value for ``per_page``, to limit a
+            user-provided value. Use ``None`` for no limit. Defaults to 100.
+        :param error_out: Abort with a ``404 Not Found`` error if no items are returned
+            and ``cursor`` is given, or if ``cursor`` is not valid, or if ``per_page``
+            is less than 1 or not an int.
+        """
+        return KeysetPagination(
+            select=select,
+            session=self.session(),
+            key=key,
+            cursor=cursor,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
         )
 
     def _call_for_binds(
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import datetime
+import decimal
+import threading
+import time
 import typing as t
 from math import ceil
 
@@ -7,6 +13,8 @@ import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
 from flask import abort
 from flask import request
+from flask.json.tag import JSONTag
+from flask.json.tag import TaggedJSONSerializer
 
 
 class Pagination:
@@ -329,6 +337,12 @@ class SelectPagination(Pagination):
     """Returned by :meth:`.SQLAlchemy.paginate`. Takes ``select`` and ``session``
     arguments in addition to the :class:`Pagination` arguments.
 
+    A ``count_mode`` argument chooses how :attr:`total` is calculated. ``"exact"``
+    issues a count query. ``"estimate"`` asks the database for the row estimate it
+    would plan the query with, falling back to a count query if the dialect doesn't
+    provide one. ``"cached"`` reuses the count for the same statement and parameters
+    from a ``count_cache`` argument until it expires or the models are changed.
+
     .. versionadded:: 3.0
     """
 
@@ -339,12 +353,47 @@ class SelectPagination(Pagination):
         return list(session.execute(select).unique().scalars())
 
     def _query_count(self) -> int:
+        count_mode = self._query_args.get("count_mode", "exact")
+
+        if count_mode == "estimate":
+            out = self._query_estimate()
+
+            if out is not None:
+                return out
+        elif count_mode == "cached":
+            cache: _CountCache = self._query_args["count_cache"]
+            return cache.get(self._query_args["select"], self._query_exact_count)
+
+        return self._query_exact_count()
+
+    def _query_exact_count(self) -> int:
         select = self._query_args["select"]
         sub = select.options(sa_orm.lazyload("*")).order_by(None).subquery()
         session = self._query_args["session"]
         out = session.execute(sa.select(sa.func.count()).select_from(sub)).scalar()
         return out  # type: ignore[no-any-return]
 
+    def _query_estimate(self) -> int | None:
+        select = self._query_args["select"]
+
+        if not isinstance(select, sa.sql.Select):
+            # compound selects such as unions are counted exactly
+            return None
+
+        select = select.options(sa_orm.lazyload("*")).order_by(None)
+        session = self._query_args["session"]
+        mapper = None
+
+        for desc in select.column_descriptions:
+            if desc["entity"] is not None:
+                mapper = desc["entity"]
+                break
+
+        conn = session.connection(bind_arguments={"mapper": mapper, "clause": select})
+        return conn.dialect.estimate_row_count(  # type: ignore[no-any-return]
+            conn, select
+        )
+
 
 class QueryPagination(Pagination):
     """Returned by :meth:`.Query.paginate`. Takes a ``query`` argument in addition to
@@ -362,3 +411,397 @@ class QueryPagination(Pagination):
         # Query.count automatically disables eager loads
         out = self._query_args["query"].order_by(None).count()
         return out  # type: ignore[no-any-return]
+
+
+class _CountCache:
+    """Store the counts of ``select`` statements for :class:`SelectPagination`, keyed
+    by the statement's cache key and parameter values, for a number of seconds.
+    Counts for the tables of changed models are discarded when the
+    :data:`.models_committed` signal is sent.
+    """
+
+    max_size = 1000
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._counts: dict[t.Hashable, tuple[float, frozenset[str], int]] = {}
+
+    def get(
+        self, select: sa.sql.Select[t.Any], query_count: t.Callable[[], int]
+    ) -> int:
+        key = _count_cache_key(select)
+
+        if key is None:
+            return query_count()
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._counts.get(key)
+
+        if entry is not None and entry[0] > now:
+            return entry[2]
+
+        count = query_count()
+        tables = frozenset(table.fullname for table in sa.sql.util.find_tables(select))
+
+        with self._lock:
+            # re-insert so that entries are ordered by expiry, oldest first
+            self._counts.pop(key, None)
+            self._counts[key] = (now + self.ttl, tables, count)
+
+            while len(self._counts) > self.max_size:
+                del self._counts[next(iter(self._counts))]
+
+        return count
+
+    def invalidate(self, tables: t.Iterable[str] | None = None) -> None:
+        """Discard the counts of statements that select from any of the given table
+        names, or all counts if no names are given.
+        """
+        with self._lock:
+            if tables is None:
+                self._counts.clear()
+                return
+
+            tables = frozenset(tables)
+
+            for key, entry in list(self._counts.items()):
+                if entry[1] & tables:
+                    del self._counts[key]
+
+    def _models_committed(
+        self, sender: t.Any, changes: list[tuple[t.Any, str]]
+    ) -> None:
+        self.invalidate(
+            {
+                table.fullname
+                for obj, _ in changes
+                for table in sa.inspect(obj).mapper.tables
+            }
+        )
+
+
+def _count_cache_key(select: sa.sql.Select[t.Any]) -> t.Hashable | None:
+    """Produce a key from a statement's cache key and parameter values, or ``None`` if
+    the statement can't be cached or the values are not hashable.
+    """
+    cache_key = select._generate_cache_key()
+
+    if cache_key is None:
+        return None
+
+    key = (cache_key.key, tuple(b.effective_value for b in cache_key.bindparams))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+class _TagISODateTime(JSONTag):
+    """Serialize datetimes in ISO 8601 format, rather than as an HTTP date which
+    drops microseconds and the lack of a timezone.
+    """
+
+    __slots__ = ()
+    key = " dt"
+
+    def check(self, value: t.Any) -> bool:
+        return isinstance(value, datetime.datetime)
+
+    def to_json(self, value: t.Any) -> t.Any:
+        return value.isoformat()
+
+    def to_python(self, value: t.Any) -> t.Any:
+        return datetime.datetime.fromisoformat(value)
+
+
+class _TagISODate(JSONTag):
+    __slots__ = ()
+    key = " da"
+
+    def check(self, value: t.Any) -> bool:
+        return isinstance(value, datetime.date) and not isinstance(
+            value, datetime.datetime
+        )
+
+    def to_json(self, value: t.Any) -> t.Any:
+        return value.isoformat()
+
+    def to_python(self, value: t.Any) -> t.Any:
+        return datetime.date.fromisoformat(value)
+
+
+class _TagISOTime(JSONTag):
+    __slots__ = ()
+    key = " ti"
+
+    def check(self, value: t.Any) -> bool:
+        return isinstance(value, datetime.time)
+
+    def to_json(self, value: t.Any) -> t.Any:
+        return value.isoformat()
+
+    def to_python(self, value: t.Any) -> t.Any:
+        return datetime.time.fromisoformat(value)
+
+
+class _TagDecimal(JSONTag):
+    __slots__ = ()
+    key = " de"
+
+    def check(self, value: t.Any) -> bool:
+        return isinstance(value, decimal.Decimal)
+
+    def to_json(self, value: t.Any) -> t.Any:
+        return str(value)
+
+    def to_python(self, value: t.Any) -> t.Any:
+        return decimal.Decimal(value)
+
+
+# Cursor values must round-trip exactly, or the next page would start at a
+# different position. Check the lossless tags before Flask's own datetime tag.
+_cursor_serializer = TaggedJSONSerializer()
+
+for _tag in (_TagDecimal, _TagISOTime, _TagISODate, _TagISODateTime):
+    _cursor_serializer.register(_tag, index=0)
+
+del _tag
+
+
+class KeysetPagination:
+    """Query the items that follow a cursor in the order of a unique key, rather than
+    the items at an offset. Returned by :meth:`.SQLAlchemy.keyset_paginate`. Takes
+    ``select`` and ``session`` arguments in addition to the arguments below.
+
+    Each page is queried with ``WHERE key > :last ORDER BY key LIMIT per_page + 1``,
+    so that deep pages are as fast as the first one if the key is indexed, and no count
+    query is needed. The extra item only tells whether there is a next page. Pages can
+    only be traversed forwards, and there are no page numbers or total.
+
+    Don't create pagination objects manually. They are created by
+    :meth:`.SQLAlchemy.keyset_paginate`.
+
+    :param key: A column, or a sequence of columns, that is unique for each item, such
+        as ``Post.id`` or ``(Post.created, Post.id)``. Items are ordered by it,
+        replacing the statement's ``order_by``. Use ``sa.desc(column)`` for descending
+        order.
+    :param cursor: The :attr:`next_cursor` of the previous page. Defaults to the
+        ``cursor`` query arg during a request, or the first page otherwise.
+    :param per_page: The maximum number of items on a page. Defaults to the
+        ``per_page`` query arg during a request, or 20 otherwise.
+    :param max_per_page: The maximum allowed value for ``per_page``, to limit a
+        user-provided value. Use ``None`` for no limit. Defaults to 100.
+    :param error_out: Abort with a ``404 Not Found`` error if no items are returned
+        and ``cursor`` is given, or if ``cursor`` is not valid, or if ``per_page`` is
+        less than 1 or not an int.
+    :param kwargs: Information about the query to paginate.
+    """
+
+    def __init__(
+        self,
+        key: t.Any,
+        cursor: str | None = None,
+        per_page: int | None = None,
+        max_per_page: int | None = 100,
+        error_out: bool = True,
+        **kwargs: t.Any,
+    ) -> None:
+        self._query_args = kwargs
+        _, per_page = Pagination._prepare_page_args(
+            page=1,
+            per_page=per_page,
+            max_per_page=max_per_page,
+            error_out=error_out,
+        )
+
+        if cursor is None and request:
+            cursor = request.args.get("cursor") or None
+
+        self._keys = _prepare_keys(key)
+        values = None
+
+        if cursor is not None:
+            try:
+                values = _decode_cursor(cursor, len(self._keys))
+            except ValueError:
+                if error_out:
+                    abort(404)
+
+                cursor = None
+
+        self.key: t.Any = key
+        """The key that items are ordered by."""
+
+        self.cursor: str | None = cursor
+        """The cursor this page was queried with, or ``None`` for the first page."""
+
+        self.per_page: int = per_page
+        """The maximum number of items on a page."""
+
+        self.max_per_page: int | None = max_per_page
+        """The maximum allowed value for ``per_page``."""
+
+        items, last_values, has_next = self._query_items(values)
+
+        if not items and cursor is not None and error_out:
+            abort(404)
+
+        self.items: list[t.Any] = items
+        """The items on the current page. Iterating over the pagination object is
+        equivalent to iterating over the items.
+        """
+
+        self.has_next: bool = has_next
+        """``True`` if there are items after this page."""
+
+        self.next_cursor: str | None = (
+            _encode_cursor(last_values) if has_next else None
+        )
+        """The cursor for the next page, or ``None`` if this is the last page."""
+
+        # the next page of the last page is empty, rather than the first page
+        self._last_cursor = (
+            _encode_cursor(last_values) if last_values is not None else cursor
+        )
+
+    def _query_items(
+        self, values: list[t.Any] | None
+    ) -> tuple[list[t.Any], list[t.Any] | None, bool]:
+        """Execute the query to get the items after the key values of the cursor,
+        returning the items, the key values of the last item, and whether there are
+        more items.
+
+        :meta private:
+        """
+        keys = self._keys
+        select = self._query_args["select"]
+        select = select.order_by(None).order_by(
+            *(sa.desc(col) if desc else col for col, desc in keys)
+        )
+
+        if values is not None:
+            select = select.where(_keyset_criteria(keys, values))
+
+        select = select.add_columns(*(col for col, _ in keys)).limit(
+            self.per_page + 1
+        )
+        session = self._query_args["session"]
+        rows = session.execute(select).unique().all()
+        has_next = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if not rows:
+            return [], None, False
+
+        return [row[0] for row in rows], list(rows[-1][1:]), has_next
+
+    def next(self, *, error_out: bool = False) -> KeysetPagination:
+        """Query the :class:`KeysetPagination` object for the next page.
+
+        :param error_out: Abort with a ``404 Not Found`` error if no items are returned,
+            or if ``per_page`` is less than 1 or not an int.
+        """
+        return type(self)(
+            key=self.key,
+            cursor=self._last_cursor,
+            per_page=self.per_page,
+            max_per_page=self.max_per_page,
+            error_out=error_out,
+            **self._query_args,
+        )
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        yield from self.items
+
+
+def _prepare_keys(key: t.Any) -> list[tuple[t.Any, bool]]:
+    """Split a key into a list of ``(column, descending)`` pairs."""
+    if not isinstance(key, (list, tuple)):
+        key = [key]
+
+    keys = []
+
+    for col in key:
+        if hasattr(col, "__clause_element__"):
+            col = col.__clause_element__()
+
+        if isinstance(col, sa.UnaryExpression) and col.modifier in (
+            sa.sql.operators.desc_op,
+            sa.sql.operators.asc_op,
+        ):
+            keys.append((col.element, col.modifier is sa.sql.operators.desc_op))
+        else:
+            keys.append((col, False))
+
+    if not keys:
+        raise ValueError("A key of at least one column is required.")
+
+    return keys
+
+
+def _keyset_criteria(
+    keys: list[tuple[t.Any, bool]], values: list[t.Any]
+) -> sa.ColumnElement[bool]:
+    """Produce the criteria that select the items after the given key values."""
+    if len(keys) == 1:
+        (col, desc), value = keys[0], values[0]
+        return col < value if desc else col > value  # type: ignore[no-any-return]
+
+    if len({desc for _, desc in keys}) == 1:
+        lhs = sa.tuple_(*(col for col, _ in keys))
+        rhs = sa.tuple_(
+            *(sa.literal(value, col.type) for (col, _), value in zip(keys, values))
+        )
+        return lhs < rhs if keys[0][1] else lhs > rhs
+
+    # mixed directions can't use a row comparison
+    clauses = []
+
+    for idx, (col, desc) in enumerate(keys):
+        clauses.append(
+            sa.and_(
+                *(c == v for (c, _), v in zip(keys[:idx], values[:idx])),
+                col < values[idx] if desc else col > values[idx],
+            )
+        )
+
+    return sa.or_(*clauses)
+
+
+def _encode_cursor(values: list[t.Any]) -> str:
+    data = _cursor_serializer.dumps(values).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str, length: int) -> list[t.Any]:
+    """Decode a cursor into key values. Raise ``ValueError`` if the cursor is not a
+    list of as many values as the key has columns, or if any of the values is a list,
+    tuple, or dict rather than a single value that can be compared to a column.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = _cursor_serializer.loads(data.decode())
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        ValueError,
+        TypeError,
+        KeyError,
+        decimal.InvalidOperation,
+    ):
+        raise ValueError("Invalid cursor.") from None
+
+    if (
+        not isinstance(values, list)
+        or len(values) != length
+        or any(isinstance(value, (list, tuple, dict)) for value in values)
+    ):
+        raise ValueError("Invalid cursor.")
+
+    return values
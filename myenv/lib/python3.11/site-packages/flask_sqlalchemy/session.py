@@ -27,6 +27,7 @@ class Session(sa_orm.Session):
         super().__init__(**kwargs)
         self._db = db
         self._model_changes: dict[object, tuple[t.Any, str]] = {}
+        self._routed_engines: dict[sa.engine.Engine, sa.engine.Engine] = {}
 
     def get_bind(
         self,
@@ -38,6 +39,16 @@ class Session(sa_orm.Session):
         """Select an engine based on the ``bind_key`` of the metadata associated with
         the model or table being queried. If no bind key is set, uses the default bind.
 
+        If the bind key has replicas configured with :data:`.SQLALCHEMY_REPLICAS`,
+        ``SELECT`` statements are sent to a replica chosen by the key's
+        :class:`~sqlalchemy.engine.ReplicaRouter`, and everything else to the primary.
+        The same replica is used for the rest of the transaction, and once something is
+        sent to the primary, it is used instead so that reads see the transaction's own
+        writes. Loading the expired or deferred attributes of an instance, including
+        after a commit, uses the primary as well, since a replica may not have the row
+        yet. A ``readonly`` execution option on the statement, or a ``readonly`` key in
+        ``bind_arguments``, overrides the choice.
+
         .. versionchanged:: 3.0.3
             Fix finding the bind for a joined inheritance model.
 
@@ -64,19 +75,76 @@ class Session(sa_orm.Session):
             engine = _clause_to_engine(mapper.local_table, engines)
 
             if engine is not None:
-                return engine
+                return self._route(engine, clause, kwargs.get("readonly"))
 
         if clause is not None:
             engine = _clause_to_engine(clause, engines)
 
             if engine is not None:
-                return engine
+                return self._route(engine, clause, kwargs.get("readonly"))
 
         if None in engines:
-            return engines[None]
+            return self._route(engines[None], clause, kwargs.get("readonly"))
 
         return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
 
+    def _route(
+        self, engine: sa.engine.Engine, clause: t.Any | None, readonly: bool | None
+    ) -> sa.engine.Engine:
+        """If the engine has replicas, choose the primary or a replica for the clause.
+
+        :meta private:
+        """
+        routers = self._db.routers
+
+        if not routers:
+            return engine
+
+        for router in routers.values():
+            if router.primary is engine:
+                break
+        else:
+            return engine
+
+        if readonly is None and isinstance(clause, sa.Executable):
+            readonly = clause.get_execution_options().get("readonly")
+
+        if readonly is None:
+            # Loads of expired or deferred attributes of an instance, such as those
+            # after a commit, go to the primary, where the rows the instance was
+            # written to are guaranteed to exist.
+            readonly = (
+                isinstance(clause, sa.Select)
+                and clause._for_update_arg is None
+                and not getattr(clause._compile_options, "_for_refresh_state", False)
+            )
+
+        routed = self._routed_engines.get(engine)
+
+        if readonly:
+            if routed is None:
+                # Connect through the router rather than only choosing an engine,
+                # so that a replica refusing connections is passed over for another
+                # replica or the primary, instead of failing the session's work.
+                with router.connect(readonly=True) as conn:
+                    routed = conn.engine
+
+                self._routed_engines[engine] = routed
+
+            return routed
+
+        self._routed_engines[engine] = engine
+        return engine
+
+
+def _unpin_replicas(session: Session, transaction: sa_orm.SessionTransaction) -> None:
+    """Choose engines for reads again once the outermost transaction ends."""
+    if transaction.parent is None:
+        session._routed_engines.clear()
+
+
+sa.event.listen(Session, "after_transaction_end", _unpin_replicas)
+
 
 def _clause_to_engine(
     clause: sa.ClauseElement | None,
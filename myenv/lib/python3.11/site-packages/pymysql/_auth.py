@@ -113,14 +113,28 @@ def ed25519_password(password, scramble):
     return R + S
 
 
-# sha256_password
+# Exchanges of more than one packet are written as generators, so that the
+# blocking and the asyncio connections run the same steps.  A generator yields
+# the payload of the next packet to send, or None to only read one, and is sent
+# the packet the server replies with, once checked not to be an error.  It
+# returns the last packet read.
+
 
+def run_steps(conn, steps):
+    """Run the steps of an exchange over a blocking connection."""
+    try:
+        data = next(steps)
+        while True:
+            if data is not None:
+                conn.write_packet(data)
+            pkt = conn._read_packet()
+            pkt.check_error()
+            data = steps.send(pkt)
+    except StopIteration as e:
+        return e.value
 
-def _roundtrip(conn, send_data):
-    conn.write_packet(send_data)
-    pkt = conn._read_packet()
-    pkt.check_error()
-    return pkt
+
+# sha256_password
 
 
 def _xor_password(password, salt):
@@ -158,11 +172,15 @@ def sha2_rsa_encrypt(password, salt, public_key):
 
 
 def sha256_password_auth(conn, pkt):
+    return run_steps(conn, sha256_password_steps(conn, pkt))
+
+
+def sha256_password_steps(conn, pkt):
     if conn._secure:
         if DEBUG:
             print("sha256: Sending plain password")
         data = conn.password + b"\0"
-        return _roundtrip(conn, data)
+        return (yield data)
 
     if pkt.is_auth_switch_request():
         conn.salt = pkt.read_all()
@@ -170,10 +188,10 @@ def sha256_password_auth(conn, pkt):
             # Request server public key
             if DEBUG:
                 print("sha256: Requesting server public key")
-            pkt = _roundtrip(conn, b"\1")
+            pkt = yield b"\1"
 
     if pkt.is_extra_auth_data():
-        conn.server_public_key = pkt._data[1:]
+        conn.server_public_key = pkt.get_all_data()[1:]
         if DEBUG:
             print("Received public key:\n", conn.server_public_key.decode("ascii"))
 
@@ -185,7 +203,7 @@ def sha256_password_auth(conn, pkt):
     else:
         data = b""
 
-    return _roundtrip(conn, data)
+    return (yield data)
 
 
 def scramble_caching_sha2(password, nonce):
@@ -209,9 +227,13 @@ def scramble_caching_sha2(password, nonce):
 
 
 def caching_sha2_password_auth(conn, pkt):
+    return run_steps(conn, caching_sha2_password_steps(conn, pkt))
+
+
+def caching_sha2_password_steps(conn, pkt):
     # No password fast path
     if not conn.password:
-        return _roundtrip(conn, b"")
+        return (yield b"")
 
     if pkt.is_auth_switch_request():
         # Try from fast auth
@@ -219,12 +241,12 @@ def caching_sha2_password_auth(conn, pkt):
             print("caching sha2: Trying fast path")
         conn.salt = pkt.read_all()
         scrambled = scramble_caching_sha2(conn.password, conn.salt)
-        pkt = _roundtrip(conn, scrambled)
+        pkt = yield scrambled
     # else: fast auth is tried in initial handshake
 
     if not pkt.is_extra_auth_data():
         raise OperationalError(
-            "caching sha2: Unknown packet for fast auth: %s" % pkt._data[:1]
+            "caching sha2: Unknown packet for fast auth: %s" % pkt.get_bytes(0)
         )
 
     # magic numbers:
@@ -238,8 +260,7 @@ def caching_sha2_password_auth(conn, pkt):
     if n == 3:
         if DEBUG:
             print("caching sha2: succeeded by fast path.")
-        pkt = conn._read_packet()
-        pkt.check_error()  # pkt must be OK packet
+        pkt = yield None  # pkt must be OK packet
         return pkt
 
     if n != 4:
@@ -251,18 +272,18 @@ def caching_sha2_password_auth(conn, pkt):
     if conn._secure:
         if DEBUG:
             print("caching sha2: Sending plain password via secure connection")
-        return _roundtrip(conn, conn.password + b"\0")
+        return (yield conn.password + b"\0")
 
     if not conn.server_public_key:
-        pkt = _roundtrip(conn, b"\x02")  # Request public key
+        pkt = yield b"\x02"  # Request public key
         if not pkt.is_extra_auth_data():
             raise OperationalError(
-                "caching sha2: Unknown packet for public key: %s" % pkt._data[:1]
+                "caching sha2: Unknown packet for public key: %s" % pkt.get_bytes(0)
             )
 
-        conn.server_public_key = pkt._data[1:]
+        conn.server_public_key = pkt.get_all_data()[1:]
         if DEBUG:
             print(conn.server_public_key.decode("ascii"))
 
     data = sha2_rsa_encrypt(conn.password, conn.salt, conn.server_public_key)
-    pkt = _roundtrip(conn, data)
+    return (yield data)
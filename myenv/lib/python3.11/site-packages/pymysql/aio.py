@@ -0,0 +1,989 @@
+"""
+asyncio support.
+
+:class:`AsyncConnection` speaks the same protocol as
+:class:`~pymysql.connections.Connection`, over an :class:`asyncio.StreamReader`
+and :class:`asyncio.StreamWriter` pair instead of a blocking socket.  Packet
+parsing, column descriptors, converters and escaping are shared with the
+blocking implementation; only the methods doing I/O are coroutines here.
+
+Usage::
+
+    conn = await pymysql.aio.connect(host="localhost", user="root")
+    async with conn.cursor() as cur:
+        await cur.execute("SELECT 1")
+        print(await cur.fetchone())
+    await conn.close()
+"""
+
+import asyncio
+from collections import deque
+import socket
+import struct
+import warnings
+
+from . import err
+from .charset import charset_by_name
+from .connections import (
+    MAX_PACKET_LEN,
+    PIPELINE_MAX_AHEAD,
+    Connection,
+    MySQLResult,
+)
+from .constants import CLIENT, COMMAND, CR, ER
+from .cursors import RE_INSERT_VALUES, Cursor, DictCursorMixin
+from .protocol import (
+    dump_packet,
+    MysqlPacket,
+    FieldDescriptorPacket,
+    LoadLocalPacketWrapper,
+    OKPacketWrapper,
+)
+
+DEBUG = False
+
+
+class AsyncCursor(Cursor):
+    """
+    Cursor of an :class:`AsyncConnection`.
+
+    It has the interface of :class:`~pymysql.cursors.Cursor`, but the methods
+    which may talk to the server are coroutines: :meth:`execute`,
+    :meth:`executemany`, :meth:`callproc`, :meth:`nextset`, :meth:`close` and
+    the fetch methods.  Rows are buffered like with
+    :class:`~pymysql.cursors.Cursor`.
+
+    Use ``async for`` to iterate over rows and ``async with`` to close it.
+    """
+
+    # Iterating with a plain for loop would never stop: fetchone() is a coroutine.
+    __iter__ = None
+
+    async def close(self):
+        """
+        Closing a cursor just exhausts all remaining data.
+        """
+        conn = self.connection
+        if conn is None:
+            return
+        try:
+            while await self.nextset():
+                pass
+        finally:
+            self.connection = None
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncCursor")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        del exc_info
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration
+        return row
+
+    async def _nextset(self, unbuffered=False):
+        """Get the next query set."""
+        conn = self._get_db()
+        current_result = self._result
+        if current_result is None or current_result is not conn._result:
+            return None
+        if not current_result.has_next:
+            return None
+        self._result = None
+        self._clear_result()
+        await conn.next_result(unbuffered=unbuffered)
+        self._do_get_result()
+        return True
+
+    async def nextset(self):
+        return await self._nextset(False)
+
+    async def execute(self, query, args=None):
+        """Execute a query.
+
+        :param query: Query to execute.
+        :type query: str
+
+        :param args: Parameters used with query. (optional)
+        :type args: tuple, list or dict
+
+        :return: Number of affected rows.
+        :rtype: int
+
+        If args is a list or tuple, %s can be used as a placeholder in the query.
+        If args is a dict, %(name)s can be used as a placeholder in the query.
+        """
+        while await self.nextset():
+            pass
+
+        query = self.mogrify(query, args)
+
+        result = await self._query(query)
+        self._executed = query
+        return result
+
+    async def executemany(self, query, args):
+        """Run several data against one query.
+
+        Statements are batched like with
+        :meth:`pymysql.cursors.Cursor.executemany`.
+
+        :return: Number of rows affected, if any.
+        :rtype: int or None
+        """
+        if not args:
+            return
+
+        conn = self._get_db()
+        m = RE_INSERT_VALUES.match(query)
+        if m:
+            q_prefix = m.group(1) % ()
+            q_values = m.group(2).rstrip()
+            q_postfix = m.group(3) or ""
+            assert q_values[0] == "(" and q_values[-1] == ")"
+            rows = 0
+            for sql in self._insert_batches(
+                q_prefix,
+                q_values,
+                q_postfix,
+                args,
+                self.max_stmt_length,
+                conn.encoding,
+            ):
+                rows += await self.execute(sql)
+            self.rowcount = rows
+            return rows
+
+        rowcounts = []
+        try:
+            if self._check_batch_statements(conn):
+                for sql in self._statement_batches(
+                    query, args, self.max_stmt_length, conn.encoding
+                ):
+                    rowcounts.append(await self.execute(sql))
+                    while await self.nextset():
+                        rowcounts.append(self.rowcount)
+            else:
+                for arg in args:
+                    rowcounts.append(await self.execute(query, arg))
+        finally:
+            # execute() resets it; set even if a statement failed
+            self.rowcounts = rowcounts
+        self.rowcount = sum(rowcounts)
+        return self.rowcount
+
+    async def callproc(self, procname, args=()):
+        """Execute stored procedure procname with args.
+
+        See :meth:`pymysql.cursors.Cursor.callproc`.
+        """
+        conn = self._get_db()
+        if args:
+            fmt = f"@_{procname}_%d=%s"
+            await self._query(
+                "SET %s"
+                % ",".join(
+                    fmt % (index, conn.escape(arg)) for index, arg in enumerate(args)
+                )
+            )
+            await self.nextset()
+
+        q = "CALL {}({})".format(
+            procname,
+            ",".join(["@_%s_%d" % (procname, i) for i in range(len(args))]),
+        )
+        await self._query(q)
+        self._executed = q
+        return args
+
+    async def fetchone(self):
+        """Fetch the next row."""
+        return super().fetchone()
+
+    async def fetchmany(self, size=None):
+        """Fetch several rows."""
+        return super().fetchmany(size)
+
+    async def fetchall(self):
+        """Fetch all the rows."""
+        return super().fetchall()
+
+    async def scroll(self, value, mode="relative"):
+        super().scroll(value, mode)
+
+    async def _query(self, q):
+        conn = self._get_db()
+        self._clear_result()
+        await conn.query(q)
+        self._do_get_result()
+        return self.rowcount
+
+
+class AsyncDictCursor(DictCursorMixin, AsyncCursor):
+    """An asyncio cursor which returns results as a dictionary"""
+
+
+class AsyncSSCursor(AsyncCursor):
+    """
+    Unbuffered cursor of an :class:`AsyncConnection`.
+
+    Like :class:`~pymysql.cursors.SSCursor`, rows are read from the connection
+    as they are fetched, which keeps memory use flat for big results.  The
+    result must be read to its end (or the cursor closed) before the
+    connection runs another query.
+    """
+
+    def _conv_row(self, row):
+        return row
+
+    def _conv_columns(self, columns):
+        return columns
+
+    async def close(self):
+        conn = self.connection
+        if conn is None:
+            return
+
+        if self._result is not None and self._result is conn._result:
+            await self._result._finish_unbuffered_query()
+
+        try:
+            while await self.nextset():
+                pass
+        finally:
+            self.connection = None
+
+    async def _query(self, q):
+        conn = self._get_db()
+        self._clear_result()
+        await conn.query(q, unbuffered=True)
+        self._do_get_result()
+        return self.rowcount
+
+    async def nextset(self):
+        return await self._nextset(unbuffered=True)
+
+    async def read_next(self):
+        """Read next row."""
+        return self._conv_row(await self._result._read_rowdata_packet_unbuffered())
+
+    async def fetchone(self):
+        """Fetch next row."""
+        self._check_executed()
+        row = await self.read_next()
+        if row is None:
+            self.warning_count = self._result.warning_count
+            return None
+        self.rownumber += 1
+        return row
+
+    async def fetchall(self):
+        """Fetch all the remaining rows into a list."""
+        return [row async for row in self.fetchall_unbuffered()]
+
+    async def fetchall_unbuffered(self):
+        """
+        Fetch all, implemented as an asynchronous generator.
+        """
+        while True:
+            row = await self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    async def fetch_columns(self, size=None):
+        """Fetch up to size rows as one sequence per column.
+
+        See :meth:`pymysql.cursors.SSCursor.fetch_columns`.
+        """
+        self._check_executed()
+        if size is None:
+            size = self.arraysize
+
+        columns = await self._result._read_columns_unbuffered(size)
+        if columns is None:
+            self.warning_count = self._result.warning_count
+            return None
+        self.rownumber += self._result.affected_rows
+        return self._conv_columns(columns)
+
+    async def fetchmany(self, size=None):
+        """Fetch many."""
+        self._check_executed()
+        if size is None:
+            size = self.arraysize
+
+        rows = []
+        for i in range(size):
+            row = await self.read_next()
+            if row is None:
+                self.warning_count = self._result.warning_count
+                break
+            rows.append(row)
+            self.rownumber += 1
+        if not rows:
+            return ()
+        return rows
+
+    async def scroll(self, value, mode="relative"):
+        self._check_executed()
+
+        if mode == "relative":
+            if value < 0:
+                raise err.NotSupportedError(
+                    "Backwards scrolling not supported by this cursor"
+                )
+            end = value
+        elif mode == "absolute":
+            if value < self.rownumber:
+                raise err.NotSupportedError(
+                    "Backwards scrolling not supported by this cursor"
+                )
+            end = value - self.rownumber
+        else:
+            raise err.ProgrammingError("unknown scroll mode %s" % mode)
+
+        for _ in range(end):
+            await self.read_next()
+        self.rownumber += end
+
+
+class AsyncSSDictCursor(DictCursorMixin, AsyncSSCursor):
+    """An unbuffered asyncio cursor, which returns results as a dictionary"""
+
+
+class AsyncConnection(Connection):
+    """
+    Connection to a MySQL server for asyncio.
+
+    It takes the arguments of :class:`~pymysql.connections.Connection`, but
+    doesn't connect on construction: await :meth:`connect`, or use the
+    :func:`connect` coroutine of this module.  The methods which talk to the
+    server are coroutines.  ``cursorclass`` must be one of the cursors of this
+    module and defaults to :class:`AsyncCursor`.
+
+    ``compress``, ``recv_buffer_size``, ``auth_plugin_map`` and prepared
+    statements are not supported.  ``ssl`` needs Python 3.11 or newer.
+    """
+
+    _reader = None
+    _writer = None
+
+    def __init__(self, *, cursorclass=AsyncCursor, **kwargs):
+        if kwargs.get("compress"):
+            raise NotImplementedError(
+                "compress argument is not supported by AsyncConnection"
+            )
+        if kwargs.get("recv_buffer_size") is not None:
+            raise NotImplementedError(
+                "recv_buffer_size argument is not supported by AsyncConnection"
+            )
+        if kwargs.get("auth_plugin_map"):
+            raise NotImplementedError(
+                "auth_plugin_map argument is not supported by AsyncConnection"
+            )
+        kwargs["defer_connect"] = True
+        super().__init__(cursorclass=cursorclass, **kwargs)
+        if self.ssl and not hasattr(asyncio.StreamWriter, "start_tls"):
+            raise NotImplementedError("ssl on AsyncConnection requires Python 3.11+")
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncConnection")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        del exc_info
+        await self.close()
+
+    async def close(self):
+        """
+        Send the quit message and close the connection.
+
+        :raise Error: If the connection is already closed.
+        """
+        if self._closed:
+            raise err.Error("Already closed")
+        self._closed = True
+        writer = self._writer
+        if writer is None:
+            return
+        send_data = struct.pack("<iB", 1, COMMAND.COM_QUIT)
+        try:
+            await self._write_bytes(send_data)
+        except Exception:
+            pass
+        finally:
+            self._force_close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    @property
+    def open(self):
+        """Return True if the connection is open."""
+        return self._writer is not None
+
+    def _force_close(self):
+        """Close connection without QUIT message."""
+        if self._writer:
+            try:
+                self._writer.close()
+            except:  # noqa
+                pass
+        self._reader = None
+        self._writer = None
+
+    __del__ = _force_close
+
+    async def autocommit(self, value):
+        self.autocommit_mode = bool(value)
+        current = self.get_autocommit()
+        if value != current:
+            await self._send_autocommit_mode()
+
+    async def _read_ok_packet(self):
+        pkt = await self._read_packet()
+        if not pkt.is_ok_packet():
+            raise err.OperationalError(
+                CR.CR_COMMANDS_OUT_OF_SYNC,
+                "Command Out of Sync",
+            )
+        ok = OKPacketWrapper(pkt)
+        self.server_status = ok.server_status
+        return ok
+
+    async def _send_autocommit_mode(self):
+        """Set whether or not to commit after every execute()."""
+        await self._execute_command(
+            COMMAND.COM_QUERY, "SET AUTOCOMMIT = %s" % self.escape(self.autocommit_mode)
+        )
+        await self._read_ok_packet()
+
+    async def begin(self):
+        """Begin transaction."""
+        await self._execute_command(COMMAND.COM_QUERY, "BEGIN")
+        await self._read_ok_packet()
+
+    async def commit(self):
+        """Commit changes to stable storage."""
+        await self._execute_command(COMMAND.COM_QUERY, "COMMIT")
+        await self._read_ok_packet()
+
+    async def rollback(self):
+        """Roll back the current transaction."""
+        await self._execute_command(COMMAND.COM_QUERY, "ROLLBACK")
+        await self._read_ok_packet()
+
+    async def show_warnings(self):
+        """Send the "SHOW WARNINGS" SQL command."""
+        await self._execute_command(COMMAND.COM_QUERY, "SHOW WARNINGS")
+        result = AsyncMySQLResult(self)
+        await result.read()
+        return result.rows
+
+    async def select_db(self, db):
+        """
+        Set current db.
+
+        :param db: The name of the db.
+        """
+        await self._execute_command(COMMAND.COM_INIT_DB, db)
+        await self._read_ok_packet()
+
+    async def pipeline(self, queries):
+        """
+        Run several queries with one round trip.
+
+        See :meth:`pymysql.connections.Connection.pipeline`.
+        """
+        # lengths of the queries whose results are unread
+        pending = deque()
+        ahead = 0
+        results = []
+        errors = []
+        for sql in queries:
+            if isinstance(sql, str):
+                sql = sql.encode(self.encoding, "surrogateescape")
+            while pending and ahead + len(sql) > PIPELINE_MAX_AHEAD:
+                ahead -= pending.popleft()
+                await self._read_pipelined_result(results, errors)
+            await self._execute_command(COMMAND.COM_QUERY, sql)
+            pending.append(len(sql))
+            ahead += len(sql)
+
+        for _ in pending:
+            await self._read_pipelined_result(results, errors)
+        if errors:
+            raise errors[0]
+        return results
+
+    async def _read_pipelined_result(self, results, errors):
+        # Each response is numbered from its own command.
+        self._next_seq_id = 1
+        try:
+            await self._read_query_result()
+            results.append(self._result)
+            while self._result.has_next:
+                await self.next_result()
+        except err.Error as e:
+            if self._writer is None:
+                raise
+            errors.append(e)
+
+    # The following methods are INTERNAL USE ONLY (called from Cursor)
+    async def query(self, sql, unbuffered=False):
+        if isinstance(sql, str):
+            sql = sql.encode(self.encoding, "surrogateescape")
+        await self._execute_command(COMMAND.COM_QUERY, sql)
+        self._affected_rows = await self._read_query_result(unbuffered=unbuffered)
+        return self._affected_rows
+
+    async def next_result(self, unbuffered=False):
+        self._affected_rows = await self._read_query_result(unbuffered=unbuffered)
+        return self._affected_rows
+
+    def _prepare(self, query):
+        raise err.NotSupportedError(
+            "Prepared statements are not supported by AsyncConnection"
+        )
+
+    _execute_prepared = _prepare
+
+    async def kill(self, thread_id):
+        arg = struct.pack("<I", thread_id)
+        await self._execute_command(COMMAND.COM_PROCESS_KILL, arg)
+        return await self._read_ok_packet()
+
+    async def ping(self, reconnect=True):
+        """
+        Check if the server is alive.
+
+        :param reconnect: If the connection is closed, reconnect.
+        :type reconnect: boolean
+
+        :raise Error: If the connection is closed and reconnect=False.
+        """
+        if self._writer is None:
+            if reconnect:
+                await self.connect()
+                reconnect = False
+            else:
+                raise err.Error("Already closed")
+        try:
+            await self._execute_command(COMMAND.COM_PING, "")
+            await self._read_ok_packet()
+        except Exception:
+            if reconnect:
+                await self.connect()
+                await self.ping(False)
+            else:
+                raise
+
+    async def set_charset(self, charset):
+        """Deprecated. Use set_character_set() instead."""
+        await self.set_character_set(charset)
+
+    async def set_character_set(self, charset, collation=None):
+        """
+        Set charaset (and collation)
+
+        Send "SET NAMES charset [COLLATE collation]" query.
+        Update Connection.encoding based on charset.
+        """
+        # Make sure charset is supported.
+        encoding = charset_by_name(charset).encoding
+
+        if collation:
+            query = f"SET NAMES {charset} COLLATE {collation}"
+        else:
+            query = f"SET NAMES {charset}"
+        await self._execute_command(COMMAND.COM_QUERY, query)
+        await self._read_packet()
+        self.charset = charset
+        self.encoding = encoding
+        self.collation = collation
+
+    async def connect(self):
+        self._closed = False
+        try:
+            if self.unix_socket:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_unix_connection(self.unix_socket),
+                    self.connect_timeout,
+                )
+                self.host_info = "Localhost via UNIX socket"
+                self._secure = True
+            else:
+                kwargs = {}
+                if self.bind_address is not None:
+                    kwargs["local_addr"] = (self.bind_address, 0)
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, **kwargs),
+                    self.connect_timeout,
+                )
+                self.host_info = "socket %s:%d" % (self.host, self.port)
+                sock = writer.get_extra_info("socket")
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            self._reader = reader
+            self._writer = writer
+            self._next_seq_id = 0
+
+            self._parse_server_information(await self._read_packet())
+            await self._request_authentication()
+
+            # See Connection.connect() for why SET NAMES is always sent.
+            await self.set_character_set(self.charset, self.collation)
+
+            if self.sql_mode is not None:
+                c = self.cursor(AsyncCursor)
+                await c.execute("SET sql_mode=%s", (self.sql_mode,))
+                await c.close()
+
+            if self.init_command is not None:
+                c = self.cursor(AsyncCursor)
+                await c.execute(self.init_command)
+                await c.close()
+
+            if self.autocommit_mode is not None:
+                await self.autocommit(self.autocommit_mode)
+        except BaseException as e:
+            self._force_close()
+
+            if isinstance(e, (OSError, IOError, asyncio.TimeoutError)):
+                raise self._connect_error(e)
+
+            raise
+
+    async def write_packet(self, payload):
+        """Writes an entire "mysql packet" in its entirety to the network
+        adding its length and sequence number.
+        """
+        await self._write_bytes(self._frame_packet(payload))
+
+    async def _read_packet(self, packet_type=MysqlPacket):
+        """Read an entire "mysql packet" in its entirety from the network
+        and return a MysqlPacket type that represents the results.
+
+        :raise OperationalError: If the connection to the MySQL server is lost.
+        :raise InternalError: If the packet sequence number is wrong.
+        """
+        buff = []
+        while True:
+            bytes_to_read = self._parse_packet_header(await self._read_bytes(4))
+            recv_data = await self._read_bytes(bytes_to_read)
+            if DEBUG:
+                dump_packet(recv_data)
+            buff.append(recv_data)
+            if bytes_to_read < MAX_PACKET_LEN:
+                break
+        return self._make_packet(buff, packet_type)
+
+    async def _read_bytes(self, num_bytes):
+        try:
+            if self._read_timeout is None:
+                return await self._reader.readexactly(num_bytes)
+            return await asyncio.wait_for(
+                self._reader.readexactly(num_bytes), self._read_timeout
+            )
+        except asyncio.IncompleteReadError:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_LOST, "Lost connection to MySQL server during query"
+            )
+        except asyncio.TimeoutError:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_LOST,
+                "Lost connection to MySQL server during query (timed out)",
+            )
+        except OSError as e:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_LOST,
+                f"Lost connection to MySQL server during query ({e})",
+            )
+        except BaseException:
+            # Don't convert unknown exception (e.g. cancellation) to MySQLError.
+            self._force_close()
+            raise
+
+    async def _write_bytes(self, data):
+        try:
+            self._writer.write(data)
+            if self._write_timeout is None:
+                await self._writer.drain()
+            else:
+                await asyncio.wait_for(self._writer.drain(), self._write_timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_GONE_ERROR, f"MySQL server has gone away ({e!r})"
+            )
+        except BaseException:
+            self._force_close()
+            raise
+
+    async def _read_query_result(self, unbuffered=False):
+        self._result = None
+        result = AsyncMySQLResult(self)
+        if unbuffered:
+            try:
+                await result.init_unbuffered_query()
+            except:
+                result.unbuffered_active = False
+                result.connection = None
+                raise
+        else:
+            await result.read()
+        self._result = result
+        if result.server_status is not None:
+            self.server_status = result.server_status
+        return result.affected_rows
+
+    async def _execute_command(self, command, sql):
+        """
+        :raise InterfaceError: If the connection is closed.
+        """
+        if not self._writer:
+            raise err.InterfaceError(0, "")
+
+        # If the last query was unbuffered, make sure it finishes before
+        # sending new commands
+        if self._result is not None:
+            if self._result.unbuffered_active:
+                warnings.warn("Previous unbuffered result was left incomplete")
+                await self._result._finish_unbuffered_query()
+            while self._result.has_next:
+                await self.next_result()
+            self._result = None
+
+        await self._write_bytes(self._command_packets(command, sql))
+
+    async def _request_authentication(self):
+        data_init = self._handshake_response_prelude()
+
+        if self.ssl and self.server_capabilities & CLIENT.SSL:
+            await self.write_packet(data_init)
+            await self._writer.start_tls(self.ctx, server_hostname=self.host)
+            self._secure = True
+
+        await self.write_packet(self._handshake_response(data_init))
+        await self._run_auth_steps(self._auth_steps(await self._read_packet()))
+
+    async def _run_auth_steps(self, steps):
+        """Run the steps of an exchange; see :func:`pymysql._auth.run_steps`."""
+        try:
+            data = next(steps)
+            while True:
+                if data is not None:
+                    await self.write_packet(data)
+                pkt = await self._read_packet()
+                pkt.check_error()
+                data = steps.send(pkt)
+        except StopIteration as e:
+            return e.value
+
+    async def _send_local_file(self, filename):
+        """Send data packets from the local file to the server"""
+        try:
+            with open(filename, "rb") as open_file:
+                packet_size = min(
+                    self.max_allowed_packet, 16 * 1024
+                )  # 16KB is efficient enough
+                while True:
+                    chunk = open_file.read(packet_size)
+                    if not chunk:
+                        break
+                    await self.write_packet(chunk)
+        except OSError:
+            raise err.OperationalError(
+                ER.FILE_NOT_FOUND,
+                f"Can't find file '{filename}'",
+            )
+        finally:
+            if not self._closed and self._writer is not None:
+                # send the empty packet to signify we are done sending data
+                await self.write_packet(b"")
+
+
+class AsyncMySQLResult(MySQLResult):
+    """Result of a query on an :class:`AsyncConnection`.
+
+    Reading is done by coroutines; decoding is shared with
+    :class:`~pymysql.connections.MySQLResult`.
+    """
+
+    def __del__(self):
+        # An unfinished unbuffered result can't be drained from here; the
+        # connection drains it before sending its next command.
+        pass
+
+    async def read(self):
+        try:
+            first_packet = await self.connection._read_packet()
+
+            if first_packet.is_ok_packet():
+                self._read_ok_packet(first_packet)
+            elif first_packet.is_load_local_packet():
+                await self._read_load_local_packet(first_packet)
+            else:
+                await self._read_result_packet(first_packet)
+        finally:
+            self.connection = None
+
+    async def init_unbuffered_query(self):
+        """
+        :raise OperationalError: If the connection to the MySQL server is lost.
+        :raise InternalError:
+        """
+        self.unbuffered_active = True
+        first_packet = await self.connection._read_packet()
+
+        if first_packet.is_ok_packet():
+            self._read_ok_packet(first_packet)
+            self.unbuffered_active = False
+            self.connection = None
+        elif first_packet.is_load_local_packet():
+            await self._read_load_local_packet(first_packet)
+            self.unbuffered_active = False
+            self.connection = None
+        else:
+            self.field_count = first_packet.read_length_encoded_integer()
+            await self._get_descriptions()
+            self.affected_rows = 18446744073709551615
+
+    async def _read_load_local_packet(self, first_packet):
+        if not self.connection._local_infile:
+            raise RuntimeError(
+                "**WARN**: Received LOAD_LOCAL packet but local_infile option is false."
+            )
+        load_packet = LoadLocalPacketWrapper(first_packet)
+        try:
+            await self.connection._send_local_file(load_packet.filename)
+        except:
+            await self.connection._read_packet()  # skip ok packet
+            raise
+
+        ok_packet = await self.connection._read_packet()
+        if (
+            not ok_packet.is_ok_packet()
+        ):  # pragma: no cover - upstream induced protocol error
+            raise err.OperationalError(
+                CR.CR_COMMANDS_OUT_OF_SYNC,
+                "Commands Out of Sync",
+            )
+        self._read_ok_packet(ok_packet)
+
+    async def _read_result_packet(self, first_packet):
+        self.field_count = first_packet.read_length_encoded_integer()
+        await self._get_descriptions()
+        await self._read_rowdata_packet()
+
+    async def _read_rowdata_packet_unbuffered(self):
+        # Check if in an active query
+        if not self.unbuffered_active:
+            return
+
+        # EOF
+        packet = await self.connection._read_packet()
+        if self._check_packet_is_eof(packet):
+            self.unbuffered_active = False
+            self.connection = None
+            self.rows = None
+            return
+
+        row = self._read_row_from_packet(packet)
+        self.affected_rows = 1
+        self.rows = (row,)  # rows should tuple of row for MySQL-python compatibility.
+        return row
+
+    async def _finish_unbuffered_query(self):
+        # See MySQLResult._finish_unbuffered_query().
+        while self.unbuffered_active:
+            try:
+                packet = await self.connection._read_packet()
+            except err.OperationalError as e:
+                if e.args[0] in (
+                    ER.QUERY_TIMEOUT,
+                    ER.STATEMENT_TIMEOUT,
+                ):
+                    # if the query timed out we can simply ignore this error
+                    self.unbuffered_active = False
+                    self.connection = None
+                    return
+
+                raise
+
+            if self._check_packet_is_eof(packet):
+                self.unbuffered_active = False
+                self.connection = None  # release reference to kill cyclic reference.
+
+    async def _read_rowdata_packet(self):
+        """Read a rowdata packet for each data row in the result set."""
+        read_packet = self.connection._read_packet
+        payloads = []
+        while True:
+            packet = await read_packet()
+            if self._check_packet_is_eof(packet):
+                self.connection = None  # release reference to kill cyclic reference.
+                break
+            payloads.append(packet.get_payload())
+
+        rows = self._read_rows_from_payloads(payloads)
+        self.affected_rows = len(rows)
+        self.rows = tuple(rows)
+
+    async def _read_columns_unbuffered(self, size):
+        if not self.unbuffered_active:
+            return None
+
+        payloads = []
+        while len(payloads) < size:
+            packet = await self.connection._read_packet()
+            if self._check_packet_is_eof(packet):
+                self.unbuffered_active = False
+                self.connection = None
+                break
+            payloads.append(packet.get_payload())
+
+        self.rows = None
+        if not payloads:
+            return None
+        self.affected_rows = len(payloads)
+        return self._read_columns_from_payloads(payloads)
+
+    async def _get_descriptions(self):
+        """Read a column descriptor packet for each column in the result."""
+        fields = [
+            await self.connection._read_packet(FieldDescriptorPacket)
+            for _ in range(self.field_count)
+        ]
+        eof_packet = await self.connection._read_packet()
+        assert eof_packet.is_eof_packet(), "Protocol error, expecting EOF"
+        self._set_fields(fields)
+
+
+async def connect(**kwargs):
+    """Create an :class:`AsyncConnection` and connect it to the server.
+
+    Takes the keyword arguments of :class:`AsyncConnection`.
+    """
+    conn = AsyncConnection(**kwargs)
+    await conn.connect()
+    return conn
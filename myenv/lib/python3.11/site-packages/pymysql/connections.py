@@ -2,8 +2,13 @@
 # http://dev.mysql.com/doc/internals/en/client-server-protocol.html
 # Error codes:
 # https://dev.mysql.com/doc/refman/5.5/en/error-handling.html
+import array
+from collections import OrderedDict, deque
+import datetime
+from decimal import Decimal
 import errno
 import os
+import re
 import socket
 import struct
 import sys
@@ -13,13 +18,17 @@ import warnings
 from . import _auth
 
 from .charset import charset_by_name, charset_by_id
-from .constants import CLIENT, COMMAND, CR, ER, FIELD_TYPE, SERVER_STATUS
+from .constants import CLIENT, COMMAND, CR, ER, FIELD_TYPE, FLAG, SERVER_STATUS
 from . import converters
 from .cursors import Cursor
 from .optionfile import Parser
 from .protocol import (
     dump_packet,
     MysqlPacket,
+    NULL_COLUMN,
+    UNSIGNED_SHORT_COLUMN,
+    UNSIGNED_INT24_COLUMN,
+    UNSIGNED_INT64_COLUMN,
     FieldDescriptorPacket,
     OKPacketWrapper,
     EOFPacketWrapper,
@@ -35,6 +44,16 @@ except ImportError:
     ssl = None
     SSL_ENABLED = False
 
+try:
+    import zlib
+except ImportError:
+    zlib = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 try:
     import getpass
 
@@ -58,11 +77,49 @@ TEXT_TYPES = {
     FIELD_TYPE.GEOMETRY,
 }
 
+#: Converters which accept the raw ASCII bytes of a column as well as str.
+_BYTES_CONVERTERS = (int, float)
+
+
+def _buffer_step(encoding, converter):
+    """Return the ``(encoding, converter)`` decode step which does for values
+    that are memoryview slices of the receive buffer what the given step does
+    for bytes values.  Values with an encoding are decoded with ``str()``, the
+    others are copied to bytes unless the converter parses any buffer."""
+    if encoding is not None or converter in _BYTES_CONVERTERS:
+        return encoding, converter
+    if converter is None:
+        return None, bytes
+    return None, lambda value: converter(bytes(value))
+
+
+def _buffer_in_use(buf):
+    """Return True if memoryviews of the bytearray *buf* are still alive.
+
+    A bytearray can't be resized while it's exported, so growing it by one
+    byte tells whether any view of it remains.
+    """
+    try:
+        buf.append(0)
+    except BufferError:
+        return True
+    del buf[-1]
+    return False
+
 
 DEFAULT_CHARSET = "utf8mb4"
 
 MAX_PACKET_LEN = 2**24 - 1
 
+#: Bytes of queries :meth:`Connection.pipeline` sends ahead of the results it
+#: has read.  It's kept below the socket buffers of both ends, so that the
+#: unanswered queries always fit in them and neither end blocks on a write
+#: while the other one does.
+PIPELINE_MAX_AHEAD = 64 * 1024
+
+#: zstd compression level sent to the server; the default of the mysql client.
+ZSTD_COMPRESSION_LEVEL = 3
+
 
 def _pack_int24(n):
     return struct.pack("<I", n)[:3]
@@ -88,6 +145,179 @@ def _lenenc_int(i):
         )
 
 
+#: ``%s`` and ``%(name)s`` placeholders of the ``pyformat`` paramstyle, and ``%%``.
+_PLACEHOLDER_RE = re.compile(r"%(?:\(([^)]*)\))?s|%%")
+
+
+def _qmark_query(query):
+    """Translate placeholders of a ``pyformat`` query to the ``?`` of COM_STMT_PREPARE.
+
+    Returns the translated query and the list of parameter names, or None when
+    the query uses positional ``%s`` placeholders.
+    """
+    names = []
+    positional = []
+
+    def replace(m):
+        if m.group(0) == "%%":
+            return "%"
+        if m.group(1) is None:
+            positional.append(True)
+        else:
+            names.append(m.group(1))
+        return "?"
+
+    sql = _PLACEHOLDER_RE.sub(replace, query)
+    if names and positional:
+        raise err.ProgrammingError(
+            "Can not mix %s and %(name)s placeholders in a prepared statement"
+        )
+    return sql, (names if names else None)
+
+
+def _pack_binary_value(value, encoding):
+    """Encode a parameter for COM_STMT_EXECUTE.
+
+    Returns ``(type_code, flags, data)`` of the binary protocol value.
+    Types without a binary representation are sent as strings, like the text
+    protocol falls back to escaping ``str(value)``.
+    """
+    if isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            return FIELD_TYPE.LONGLONG, 0, struct.pack("<q", value)
+        if 0 <= value < (1 << 64):
+            return FIELD_TYPE.LONGLONG, 0x80, struct.pack("<Q", value)
+        value = str(value).encode("ascii")
+        return FIELD_TYPE.NEWDECIMAL, 0, _lenenc_int(len(value)) + value
+    if isinstance(value, float):
+        return FIELD_TYPE.DOUBLE, 0, struct.pack("<d", value)
+    if isinstance(value, (bytes, bytearray)):
+        return FIELD_TYPE.BLOB, 0, _lenenc_int(len(value)) + bytes(value)
+    if isinstance(value, Decimal):
+        value = format(value, "f").encode("ascii")
+        return FIELD_TYPE.NEWDECIMAL, 0, _lenenc_int(len(value)) + value
+    if isinstance(value, datetime.datetime):
+        if value.microsecond:
+            data = struct.pack(
+                "<BHBBBBBI",
+                11,
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            )
+        else:
+            data = struct.pack(
+                "<BHBBBBB",
+                7,
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+            )
+        return FIELD_TYPE.DATETIME, 0, data
+    if isinstance(value, datetime.date):
+        return (
+            FIELD_TYPE.DATE,
+            0,
+            struct.pack("<BHBB", 4, value.year, value.month, value.day),
+        )
+    if isinstance(value, datetime.timedelta):
+        negative = value < datetime.timedelta(0)
+        if negative:
+            value = -value
+        data = struct.pack(
+            "<BBIBBBI",
+            12,
+            negative,
+            value.days,
+            value.seconds // 3600,
+            value.seconds // 60 % 60,
+            value.seconds % 60,
+            value.microseconds,
+        )
+        return FIELD_TYPE.TIME, 0, data
+    if isinstance(value, datetime.time):
+        data = struct.pack(
+            "<BBIBBBI",
+            12,
+            0,
+            0,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+        )
+        return FIELD_TYPE.TIME, 0, data
+    if isinstance(value, (tuple, list, set, frozenset, dict)):
+        raise err.ProgrammingError(
+            f"{type(value).__name__} can not be used as a prepared statement parameter"
+        )
+    value = str(value).encode(encoding, "surrogateescape")
+    return FIELD_TYPE.VAR_STRING, 0, _lenenc_int(len(value)) + value
+
+
+class PreparedStatement:
+    """A server-side prepared statement of a :class:`Connection`.
+
+    Created and cached by the connection; see :class:`~pymysql.cursors.PreparedCursor`.
+    """
+
+    __slots__ = ("statement_id", "query", "param_count", "param_names", "field_count")
+
+    def __init__(self, statement_id, query, param_count, param_names, field_count):
+        self.statement_id = statement_id
+        self.query = query
+        self.param_count = param_count
+        self.param_names = param_names
+        self.field_count = field_count
+
+    def pack_execute(self, args, encoding):
+        """Build the COM_STMT_EXECUTE payload (without the command byte)."""
+        if self.param_names is not None:
+            if not isinstance(args, dict):
+                raise err.ProgrammingError(
+                    "Statement uses %(name)s placeholders; args must be a dict"
+                )
+            try:
+                args = [args[name] for name in self.param_names]
+            except KeyError as e:
+                raise err.ProgrammingError(f"Missing parameter {e}") from None
+        elif args is None:
+            args = ()
+        elif isinstance(args, dict):
+            raise err.ProgrammingError("Statement uses %s placeholders; args must be a sequence")
+        elif not isinstance(args, (tuple, list)):
+            args = (args,)
+        if len(args) != self.param_count:
+            raise err.ProgrammingError(
+                f"Statement takes {self.param_count} parameters, {len(args)} given"
+            )
+
+        # flags=CURSOR_TYPE_NO_CURSOR, iteration_count=1
+        payload = struct.pack("<IBI", self.statement_id, 0, 1)
+        if not args:
+            return payload
+        null_bitmap = bytearray((len(args) + 7) // 8)
+        types = []
+        values = []
+        for i, arg in enumerate(args):
+            if arg is None:
+                null_bitmap[i // 8] |= 1 << (i % 8)
+                types.append(struct.pack("<BB", FIELD_TYPE.NULL, 0))
+                continue
+            type_code, flags, data = _pack_binary_value(arg, encoding)
+            types.append(struct.pack("<BB", type_code, flags))
+            values.append(data)
+        # new_params_bound_flag=1: types are sent with every execution.
+        return b"".join([payload, null_bitmap, b"\x01"] + types + values)
+
+
 class Connection:
     """
     Representation of a socket with a mysql server.
@@ -151,7 +381,18 @@ class Connection:
         (if no authenticate method) for returning a string from the user. (experimental)
     :param server_public_key: SHA256 authentication plugin public key value. (default: None)
     :param binary_prefix: Add _binary prefix on bytes and bytearray. (default: False)
-    :param compress: Not supported.
+    :param recv_buffer_size: Read from the socket with ``recv_into()`` into a receive
+        buffer of this many bytes and hand packets to the protocol layer as
+        memoryview slices of it, instead of reading through a buffered file object.
+        (default: None - use the file object)
+    :param stmt_cache_size: Number of server-side prepared statements kept open on the
+        connection by :class:`~pymysql.cursors.PreparedCursor`. Least recently used
+        statements are closed beyond that. (default: 128)
+    :param compress: Use the compressed protocol if the server supports it.
+        ``True`` or ``"zlib"`` for zlib, ``"zstd"`` for zstd (MySQL 8.0.18+, needs the
+        zstandard package). (default: None - no compression)
+    :param compress_min_length: Packets shorter than this many bytes are sent
+        uncompressed. (default: 50)
     :param named_pipe: Not supported.
     :param db: **DEPRECATED** Alias for database.
     :param passwd: **DEPRECATED** Alias for password.
@@ -161,6 +402,8 @@ class Connection:
     """
 
     _sock = None
+    _rbuf = None
+    _compression = None
     _auth_plugin_name = ""
     _closed = False
     _secure = False
@@ -194,6 +437,8 @@ class Connection:
         write_timeout=None,
         bind_address=None,
         binary_prefix=False,
+        recv_buffer_size=None,
+        stmt_cache_size=128,
         program_name=None,
         server_public_key=None,
         ssl=None,
@@ -204,7 +449,8 @@ class Connection:
         ssl_key_password=None,
         ssl_verify_cert=None,
         ssl_verify_identity=None,
-        compress=None,  # not supported
+        compress=None,
+        compress_min_length=50,
         named_pipe=None,  # not supported
         passwd=None,  # deprecated
         db=None,  # deprecated
@@ -222,10 +468,23 @@ class Connection:
             # )
             password = passwd
 
-        if compress or named_pipe:
-            raise NotImplementedError(
-                "compress and named_pipe arguments are not supported"
-            )
+        if named_pipe:
+            raise NotImplementedError("named_pipe argument is not supported")
+
+        if compress is True:
+            compress = "zlib"
+        if compress == "zlib":
+            if zlib is None:
+                raise NotImplementedError("zlib module not found")
+        elif compress == "zstd":
+            if zstandard is None:
+                raise NotImplementedError("zstandard module not found")
+        elif compress:
+            raise ValueError("compress should be True, 'zlib' or 'zstd'")
+        self._compress = compress or None
+        if type(compress_min_length) is not int or compress_min_length < 0:
+            raise ValueError("compress_min_length should be an int >= 0")
+        self._compress_min_length = compress_min_length
 
         self._local_infile = bool(local_infile)
         if self._local_infile:
@@ -339,11 +598,20 @@ class Connection:
         # Need for MySQLdb compatibility.
         self.encoders = {k: v for (k, v) in conv.items() if type(k) is not int}
         self.decoders = {k: v for (k, v) in conv.items() if type(k) is int}
+        self._escapers = {}
+        self._escapers_mapping = self.encoders
         self.sql_mode = sql_mode
         self.init_command = init_command
         self.max_allowed_packet = max_allowed_packet
         self._auth_plugin_map = auth_plugin_map or {}
         self._binary_prefix = binary_prefix
+        if recv_buffer_size is not None and recv_buffer_size <= 0:
+            raise ValueError("recv_buffer_size should be > 0")
+        self._recv_buffer_size = recv_buffer_size
+        if stmt_cache_size < 1:
+            raise ValueError("stmt_cache_size should be >= 1")
+        self._stmt_cache_size = stmt_cache_size
+        self._stmt_cache = OrderedDict()
         self.server_public_key = server_public_key
 
         self._connect_attrs = {
@@ -416,6 +684,7 @@ class Connection:
         if self._sock is None:
             return
         send_data = struct.pack("<iB", 1, COMMAND.COM_QUIT)
+        self._next_comp_seq_id = 0
         try:
             self._write_bytes(send_data)
         except Exception:
@@ -437,6 +706,7 @@ class Connection:
                 pass
         self._sock = None
         self._rfile = None
+        self._rbuf = None
 
     __del__ = _force_close
 
@@ -529,6 +799,43 @@ class Connection:
         """
         return self.escape(obj, self.encoders)
 
+    def _literal_sequence(self, values):
+        """Return a tuple of literal() of each of values.
+
+        The escape function of each value type is looked up once and kept in
+        ``_escapers``; an entry is replaced when encoders no longer maps its
+        type to the same encoder.
+        """
+        encoders = self.encoders
+        if self._escapers_mapping is not encoders:
+            self._escapers = {}
+            self._escapers_mapping = encoders
+        escapers = self._escapers
+        result = []
+        append = result.append
+        for value in values:
+            value_type = type(value)
+            encoder = encoders.get(value_type)
+            entry = escapers.get(value_type)
+            if entry is None or entry[0] is not encoder:
+                entry = escapers[value_type] = (
+                    encoder,
+                    self._escaper(value_type, encoder),
+                )
+            append(entry[1](value, encoders))
+        return tuple(result)
+
+    def _escaper(self, value_type, encoder):
+        """Return a function of (value, mapping) escaping values of
+        value_type like escape()."""
+        if (
+            encoder is None
+            or encoder in (converters.escape_dict, converters.escape_sequence)
+            or issubclass(value_type, (str, bytes, bytearray))
+        ):
+            return self.escape
+        return encoder
+
     def escape_string(self, s):
         if self.server_status & SERVER_STATUS.SERVER_STATUS_NO_BACKSLASH_ESCAPES:
             return s.replace("'", "''")
@@ -553,6 +860,69 @@ class Connection:
             return cursor(self)
         return self.cursorclass(self)
 
+    def pipeline(self, queries):
+        """
+        Run several queries with one round trip.
+
+        Queries are sent back to back, without waiting for their results, and
+        the results are read in order.  Up to :data:`PIPELINE_MAX_AHEAD` bytes
+        of queries are sent ahead of the results read so far; a query is only
+        sent after the results of earlier ones are read if it would go past
+        that.  This keeps the server from blocking on sending a large result
+        while the client blocks on sending more queries.  Use it for
+        independent statements; the queries are not a transaction.
+
+        :param queries: Queries to run, e.g. built with
+            :meth:`Cursor.mogrify() <pymysql.cursors.Cursor.mogrify>`.
+        :type queries: list of str or bytes
+        :return: The result of each query, with ``rows``, ``description``,
+            ``affected_rows`` and ``insert_id``.  Only the first result set of
+            a query is kept; further ones (multiple statements, stored
+            procedures) are read and discarded.
+        :rtype: list of :class:`MySQLResult`
+
+        :raise Error: The error of the first query that failed, raised after
+            the results of all the queries have been read, so the connection
+            stays usable.
+        """
+        # (compressed sequence id, length) of the queries whose results are unread
+        pending = deque()
+        ahead = 0
+        results = []
+        errors = []
+        for sql in queries:
+            if isinstance(sql, str):
+                sql = sql.encode(self.encoding, "surrogateescape")
+            while pending and ahead + len(sql) > PIPELINE_MAX_AHEAD:
+                comp_seq_id, length = pending.popleft()
+                ahead -= length
+                self._read_pipelined_result(comp_seq_id, results, errors)
+            self._execute_command(COMMAND.COM_QUERY, sql)
+            pending.append((self._next_comp_seq_id, len(sql)))
+            ahead += len(sql)
+
+        for comp_seq_id, _ in pending:
+            self._read_pipelined_result(comp_seq_id, results, errors)
+        if errors:
+            raise errors[0]
+        return results
+
+    def _read_pipelined_result(self, comp_seq_id, results, errors):
+        """Read the results of a query sent by :meth:`pipeline`, appending the
+        first one to results, or the error to errors."""
+        # Each response is numbered from its own command.
+        self._next_seq_id = 1
+        self._next_comp_seq_id = comp_seq_id
+        try:
+            self._read_query_result()
+            results.append(self._result)
+            while self._result.has_next:
+                self.next_result()
+        except err.Error as e:
+            if self._sock is None:
+                raise
+            errors.append(e)
+
     # The following methods are INTERNAL USE ONLY (called from Cursor)
     def query(self, sql, unbuffered=False):
         # if DEBUG:
@@ -564,7 +934,63 @@ class Connection:
         return self._affected_rows
 
     def next_result(self, unbuffered=False):
-        self._affected_rows = self._read_query_result(unbuffered=unbuffered)
+        if self._result is not None:
+            result_class = type(self._result)
+        else:
+            result_class = MySQLResult
+        self._affected_rows = self._read_query_result(
+            unbuffered=unbuffered, result_class=result_class
+        )
+        return self._affected_rows
+
+    def _prepare(self, query):
+        """Return the :class:`PreparedStatement` for query, preparing it if needed.
+
+        Statements are cached per connection, keyed by query text.
+        """
+        stmt = self._stmt_cache.get(query)
+        if stmt is not None:
+            self._stmt_cache.move_to_end(query)
+            return stmt
+
+        sql, param_names = _qmark_query(query)
+        self._execute_command(
+            COMMAND.COM_STMT_PREPARE, sql.encode(self.encoding, "surrogateescape")
+        )
+        # https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_com_stmt_prepare.html
+        packet = self._read_packet()
+        statement_id, field_count, param_count = packet.read_struct("<xIHH")
+        # Parameter and column definitions are sent again with each result.
+        for _ in range(param_count):
+            self._read_packet()
+        if param_count:
+            self._read_packet()  # EOF
+        for _ in range(field_count):
+            self._read_packet()
+        if field_count:
+            self._read_packet()  # EOF
+
+        stmt = PreparedStatement(
+            statement_id, query, param_count, param_names, field_count
+        )
+        self._stmt_cache[query] = stmt
+
+        # Evict only once the new statement is prepared, so that a query the
+        # server rejects doesn't cost a cached statement.
+        while len(self._stmt_cache) > self._stmt_cache_size:
+            _, old = self._stmt_cache.popitem(last=False)
+            # COM_STMT_CLOSE has no response.
+            self._execute_command(
+                COMMAND.COM_STMT_CLOSE, struct.pack("<I", old.statement_id)
+            )
+        return stmt
+
+    def _execute_prepared(self, query, args=None):
+        """Execute query as a prepared statement with binary-encoded args."""
+        stmt = self._prepare(query)
+        payload = stmt.pack_execute(args, self.encoding)
+        self._execute_command(COMMAND.COM_STMT_EXECUTE, payload)
+        self._affected_rows = self._read_query_result(result_class=MySQLBinaryResult)
         return self._affected_rows
 
     def affected_rows(self):
@@ -630,6 +1056,9 @@ class Connection:
 
     def connect(self, sock=None):
         self._closed = False
+        self._compression = None
+        # Prepared statements belong to the server session.
+        self._stmt_cache.clear()
         try:
             if sock is None:
                 if self.unix_socket:
@@ -662,11 +1091,12 @@ class Connection:
                 sock.settimeout(None)
 
             self._sock = sock
-            self._rfile = sock.makefile("rb")
+            self._init_reader()
             self._next_seq_id = 0
 
             self._get_server_information()
             self._request_authentication()
+            self._start_compression()
 
             # Send "SET NAMES" query on init for:
             # - Ensure charaset (and collation) is set to the server.
@@ -697,6 +1127,7 @@ class Connection:
                 self.autocommit(self.autocommit_mode)
         except BaseException as e:
             self._rfile = None
+            self._rbuf = None
             if sock is not None:
                 try:
                     sock.close()
@@ -704,33 +1135,42 @@ class Connection:
                     pass
 
             if isinstance(e, (OSError, IOError)):
-                exc = err.OperationalError(
-                    CR.CR_CONN_HOST_ERROR,
-                    f"Can't connect to MySQL server on {self.host!r} ({e})",
-                )
-                # Keep original exception and traceback to investigate error.
-                exc.original_exception = e
-                exc.traceback = traceback.format_exc()
-                if DEBUG:
-                    print(exc.traceback)
-                raise exc
+                raise self._connect_error(e)
 
             # If e is neither DatabaseError or IOError, It's a bug.
             # But raising AssertionError hides original error.
             # So just reraise it.
             raise
 
+    def _connect_error(self, e):
+        """Return the error to raise for the I/O error *e* being handled
+        while connecting."""
+        exc = err.OperationalError(
+            CR.CR_CONN_HOST_ERROR,
+            f"Can't connect to MySQL server on {self.host!r} ({e})",
+        )
+        # Keep original exception and traceback to investigate error.
+        exc.original_exception = e
+        exc.traceback = traceback.format_exc()
+        if DEBUG:
+            print(exc.traceback)
+        return exc
+
     def write_packet(self, payload):
         """Writes an entire "mysql packet" in its entirety to the network
         adding its length and sequence number.
         """
         # Internal note: when you build packet manually and calls _write_bytes()
         # directly, you should set self._next_seq_id properly.
+        self._write_bytes(self._frame_packet(payload))
+
+    def _frame_packet(self, payload):
+        """Add the header to *payload* and advance the sequence number."""
         data = _pack_int24(len(payload)) + bytes([self._next_seq_id]) + payload
         if DEBUG:
             dump_packet(data)
-        self._write_bytes(data)
         self._next_seq_id = (self._next_seq_id + 1) % 256
+        return data
 
     def _read_packet(self, packet_type=MysqlPacket):
         """Read an entire "mysql packet" in its entirety from the network
@@ -739,43 +1179,180 @@ class Connection:
         :raise OperationalError: If the connection to the MySQL server is lost.
         :raise InternalError: If the packet sequence number is wrong.
         """
-        buff = bytearray()
+        buff = []
         while True:
-            packet_header = self._read_bytes(4)
-            # if DEBUG: dump_packet(packet_header)
-
-            btrl, btrh, packet_number = struct.unpack("<HBB", packet_header)
-            bytes_to_read = btrl + (btrh << 16)
-            if packet_number != self._next_seq_id:
-                self._force_close()
-                if packet_number == 0:
-                    # MariaDB sends error packet with seqno==0 when shutdown
-                    raise err.OperationalError(
-                        CR.CR_SERVER_LOST,
-                        "Lost connection to MySQL server during query",
-                    )
-                raise err.InternalError(
-                    "Packet sequence number wrong - got %d expected %d"
-                    % (packet_number, self._next_seq_id)
-                )
-            self._next_seq_id = (self._next_seq_id + 1) % 256
-
+            bytes_to_read = self._parse_packet_header(self._read_bytes(4))
             recv_data = self._read_bytes(bytes_to_read)
             if DEBUG:
                 dump_packet(recv_data)
-            buff += recv_data
+            buff.append(recv_data)
             # https://dev.mysql.com/doc/internals/en/sending-more-than-16mbyte.html
             if bytes_to_read < MAX_PACKET_LEN:
                 break
+        return self._make_packet(buff, packet_type)
+
+    def _parse_packet_header(self, packet_header):
+        """Check the sequence number of a packet header and return the length
+        of the payload following it.
 
-        packet = packet_type(bytes(buff), self.encoding)
+        :raise OperationalError: If the server is shutting down.
+        :raise InternalError: If the packet sequence number is wrong.
+        """
+        # if DEBUG: dump_packet(packet_header)
+        btrl, btrh, packet_number = struct.unpack("<HBB", packet_header)
+        bytes_to_read = btrl + (btrh << 16)
+        # Packet numbers inside compressed packets are not checked, like the
+        # server does; _read_compressed_packet checks their own numbers.
+        if packet_number != self._next_seq_id and self._compression is None:
+            self._force_close()
+            if packet_number == 0:
+                # MariaDB sends error packet with seqno==0 when shutdown
+                raise err.OperationalError(
+                    CR.CR_SERVER_LOST,
+                    "Lost connection to MySQL server during query",
+                )
+            raise err.InternalError(
+                "Packet sequence number wrong - got %d expected %d"
+                % (packet_number, self._next_seq_id)
+            )
+        self._next_seq_id = (packet_number + 1) % 256
+        return bytes_to_read
+
+    def _make_packet(self, buff, packet_type):
+        """Return the packet whose payload was read in the chunks of *buff*,
+        raising the error it carries if it's an error packet."""
+        if len(buff) == 1:
+            # Single packet payload; use it as is, without copying.
+            data = buff[0]
+        else:
+            data = b"".join(buff)
+        packet = packet_type(data, self.encoding)
         if packet.is_error_packet():
             if self._result is not None and self._result.unbuffered_active is True:
                 self._result.unbuffered_active = False
             packet.raise_for_error()
         return packet
 
+    def _init_reader(self):
+        if self._recv_buffer_size:
+            self._rfile = None
+            self._rbuf = memoryview(b"")
+            self._rbuf_pos = 0
+            self._rbuf_base = None
+        else:
+            self._rfile = self._sock.makefile("rb")
+            self._rbuf = None
+
+    def _start_compression(self):
+        """Switch to the compressed protocol if it was negotiated.
+
+        https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_basic_compression.html
+        """
+        if self.client_flag & CLIENT.ZSTD_COMPRESSION_ALGORITHM:
+            compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL)
+            decompressor = zstandard.ZstdDecompressor()
+
+            def decompress(data, length):
+                return decompressor.decompress(data, max_output_size=length)
+
+            self._compression = (compressor.compress, decompress)
+        elif self.client_flag & CLIENT.COMPRESS:
+
+            def decompress(data, length):
+                return zlib.decompress(data)
+
+            self._compression = (zlib.compress, decompress)
+        else:
+            return
+        self._zbuf = memoryview(b"")
+        self._zbuf_pos = 0
+        self._next_comp_seq_id = 0
+
     def _read_bytes(self, num_bytes):
+        if self._compression is not None:
+            return self._read_decompressed_bytes(num_bytes)
+        return self._read_socket_bytes(num_bytes)
+
+    def _read_decompressed_bytes(self, num_bytes):
+        """Return the next num_bytes of the stream carried by compressed packets."""
+        zbuf = self._zbuf
+        pos = self._zbuf_pos
+        if len(zbuf) - pos >= num_bytes:
+            self._zbuf_pos = pos + num_bytes
+            return zbuf[pos : pos + num_bytes]
+
+        chunks = [zbuf[pos:]] if pos < len(zbuf) else []
+        available = len(zbuf) - pos
+        while available < num_bytes:
+            chunk = self._read_compressed_packet()
+            chunks.append(chunk)
+            available += len(chunk)
+        if len(chunks) == 1:
+            zbuf = memoryview(chunks[0])
+        else:
+            zbuf = memoryview(b"".join(chunks))
+        self._zbuf = zbuf
+        self._zbuf_pos = num_bytes
+        return zbuf[:num_bytes]
+
+    def _read_compressed_packet(self):
+        header = self._read_socket_bytes(7)
+        low, high, packet_number, ulow, uhigh = struct.unpack("<HBBHB", header)
+        if packet_number != self._next_comp_seq_id:
+            self._force_close()
+            raise err.InternalError(
+                "Compressed packet sequence number wrong - got %d expected %d"
+                % (packet_number, self._next_comp_seq_id)
+            )
+        self._next_comp_seq_id = (packet_number + 1) % 256
+
+        payload = self._read_socket_bytes(low + (high << 16))
+        length = ulow + (uhigh << 16)
+        if not length:
+            # Sent uncompressed
+            return payload
+        try:
+            data = self._compression[1](payload, length)
+        except Exception as e:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_LOST, f"Can't decompress packet from MySQL server ({e})"
+            )
+        if len(data) != length:
+            self._force_close()
+            raise err.OperationalError(
+                CR.CR_SERVER_LOST, "Malformed compressed packet from MySQL server"
+            )
+        return data
+
+    def _compress_packets(self, data):
+        """Wrap the packets in data into compressed packets."""
+        compress = self._compression[0]
+        min_length = self._compress_min_length
+        frames = []
+        for start in range(0, len(data), MAX_PACKET_LEN):
+            chunk = data[start : start + MAX_PACKET_LEN]
+            length = len(chunk)
+            if length >= min_length:
+                compressed = compress(chunk)
+                if len(compressed) < length:
+                    chunk = compressed
+                else:
+                    length = 0
+            else:
+                length = 0
+            frames.append(
+                _pack_int24(len(chunk))
+                + bytes([self._next_comp_seq_id])
+                + _pack_int24(length)
+            )
+            frames.append(chunk)
+            self._next_comp_seq_id = (self._next_comp_seq_id + 1) % 256
+        return b"".join(frames)
+
+    def _read_socket_bytes(self, num_bytes):
+        if self._rbuf is not None:
+            return self._read_bytes_from_buffer(num_bytes)
         self._sock.settimeout(self._read_timeout)
         while True:
             try:
@@ -800,7 +1377,63 @@ class Connection:
             )
         return data
 
+    def _read_bytes_from_buffer(self, num_bytes):
+        """Return the next num_bytes as a memoryview slice of the receive buffer.
+
+        When the buffer runs short, the unread tail is moved to the front of the
+        buffer, which is filled again by ``recv_into()``.  If slices returned
+        earlier are still alive, for example the rows of a buffered result which
+        is still being read, a new buffer is allocated instead so that they are
+        never overwritten.  Reads larger than ``recv_buffer_size`` get a buffer
+        of their own.
+        """
+        rbuf = self._rbuf
+        pos = self._rbuf_pos
+        if len(rbuf) - pos >= num_bytes:
+            self._rbuf_pos = pos + num_bytes
+            return rbuf[pos : pos + num_bytes]
+
+        end = len(rbuf) - pos
+        tail = bytes(rbuf[pos:])
+        # Drop our own view, so that only slices held elsewhere pin the buffer.
+        self._rbuf = rbuf = None
+        base = self._rbuf_base
+        size = self._recv_buffer_size
+        if num_bytes > size:
+            base = bytearray(num_bytes)
+        elif base is None or _buffer_in_use(base):
+            base = self._rbuf_base = bytearray(size)
+        buf = memoryview(base)
+        buf[:end] = tail
+        self._sock.settimeout(self._read_timeout)
+        while end < num_bytes:
+            try:
+                received = self._sock.recv_into(buf[end:])
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                self._force_close()
+                raise err.OperationalError(
+                    CR.CR_SERVER_LOST,
+                    f"Lost connection to MySQL server during query ({e})",
+                )
+            except BaseException:
+                # Don't convert unknown exception to MySQLError.
+                self._force_close()
+                raise
+            if not received:
+                self._force_close()
+                raise err.OperationalError(
+                    CR.CR_SERVER_LOST, "Lost connection to MySQL server during query"
+                )
+            end += received
+        self._rbuf = buf[:end]
+        self._rbuf_pos = num_bytes
+        return buf[:num_bytes]
+
     def _write_bytes(self, data):
+        if self._compression is not None:
+            data = self._compress_packets(data)
         self._sock.settimeout(self._write_timeout)
         try:
             self._sock.sendall(data)
@@ -810,18 +1443,20 @@ class Connection:
                 CR.CR_SERVER_GONE_ERROR, f"MySQL server has gone away ({e!r})"
             )
 
-    def _read_query_result(self, unbuffered=False):
+    def _read_query_result(self, unbuffered=False, result_class=None):
         self._result = None
+        if result_class is None:
+            result_class = MySQLResult
         if unbuffered:
             try:
-                result = MySQLResult(self)
+                result = result_class(self)
                 result.init_unbuffered_query()
             except:
                 result.unbuffered_active = False
                 result.connection = None
                 raise
         else:
-            result = MySQLResult(self)
+            result = result_class(self)
             result.read()
         self._result = result
         if result.server_status is not None:
@@ -852,36 +1487,109 @@ class Connection:
                 self.next_result()
             self._result = None
 
+        packet = self._command_packets(command, sql)
+        self._next_comp_seq_id = 0
+        self._write_bytes(packet)
+
+    def _command_packets(self, command, sql):
+        """Return the packets sending *command* with the argument *sql*, and
+        set the sequence number expected for the response."""
         if isinstance(sql, str):
             sql = sql.encode(self.encoding)
 
         packet_size = min(MAX_PACKET_LEN, len(sql) + 1)  # +1 is for command
 
         # tiny optimization: build first packet manually instead of
-        # calling self..write_packet()
+        # calling self._frame_packet()
         prelude = struct.pack("<iB", packet_size, command)
         packet = prelude + sql[: packet_size - 1]
-        self._write_bytes(packet)
         if DEBUG:
             dump_packet(packet)
         self._next_seq_id = 1
 
         if packet_size < MAX_PACKET_LEN:
-            return
+            return packet
 
+        packets = [packet]
         sql = sql[packet_size - 1 :]
         while True:
             packet_size = min(MAX_PACKET_LEN, len(sql))
-            self.write_packet(sql[:packet_size])
+            packets.append(self._frame_packet(sql[:packet_size]))
             sql = sql[packet_size:]
             if not sql and packet_size < MAX_PACKET_LEN:
                 break
+        return b"".join(packets)
 
     def _request_authentication(self):
+        data_init = self._handshake_response_prelude()
+
+        if self.ssl and self.server_capabilities & CLIENT.SSL:
+            self.write_packet(data_init)
+
+            self._sock = self.ctx.wrap_socket(self._sock, server_hostname=self.host)
+            self._init_reader()
+            self._secure = True
+
+        self.write_packet(self._handshake_response(data_init))
+        _auth.run_steps(self, self._auth_steps(self._read_packet()))
+
+        if DEBUG:
+            print("Succeed to auth")
+
+    def _auth_steps(self, auth_packet):
+        """Finish authenticating from the server's reply to the handshake
+        response.
+
+        Like the exchanges of :mod:`pymysql._auth`, this is a generator run by
+        :func:`pymysql._auth.run_steps` or its asyncio counterpart.
+        """
+        # if authentication method isn't accepted the first byte
+        # will have the octet 254
+        if auth_packet.is_auth_switch_request():
+            if DEBUG:
+                print("received auth switch")
+            # https://dev.mysql.com/doc/internals/en/connection-phase-packets.html#packet-Protocol::AuthSwitchRequest
+            auth_packet.read_uint8()  # 0xfe packet identifier
+            plugin_name = auth_packet.read_string()
+            if (
+                self.server_capabilities & CLIENT.PLUGIN_AUTH
+                and plugin_name is not None
+            ):
+                return (yield from self._process_auth_steps(plugin_name, auth_packet))
+            else:
+                raise err.OperationalError("received unknown auth switch request")
+        elif auth_packet.is_extra_auth_data():
+            if DEBUG:
+                print("received extra data")
+            # https://dev.mysql.com/doc/internals/en/successful-authentication.html
+            if self._auth_plugin_name == "caching_sha2_password":
+                return (
+                    yield from _auth.caching_sha2_password_steps(self, auth_packet)
+                )
+            elif self._auth_plugin_name == "sha256_password":
+                return (yield from _auth.sha256_password_steps(self, auth_packet))
+            else:
+                raise err.OperationalError(
+                    "Received extra packet for auth method %r", self._auth_plugin_name
+                )
+        return auth_packet
+
+    def _handshake_response_prelude(self):
+        """Set the client flags and return the fixed-length start of the
+        handshake response, which is also the SSL request packet."""
         # https://dev.mysql.com/doc/internals/en/connection-phase-packets.html#packet-Protocol::HandshakeResponse
         if int(self.server_version.split(".", 1)[0]) >= 5:
             self.client_flag |= CLIENT.MULTI_RESULTS
 
+        self.client_flag &= ~(CLIENT.COMPRESS | CLIENT.ZSTD_COMPRESSION_ALGORITHM)
+        if self._compress == "zlib" and self.server_capabilities & CLIENT.COMPRESS:
+            self.client_flag |= CLIENT.COMPRESS
+        elif (
+            self._compress == "zstd"
+            and self.server_capabilities & CLIENT.ZSTD_COMPRESSION_ALGORITHM
+        ):
+            self.client_flag |= CLIENT.ZSTD_COMPRESSION_ALGORITHM
+
         if self.user is None:
             raise ValueError("Did not specify a username")
 
@@ -889,17 +1597,12 @@ class Connection:
         if isinstance(self.user, str):
             self.user = self.user.encode(self.encoding)
 
-        data_init = struct.pack(
+        return struct.pack(
             "<iIB23s", self.client_flag, MAX_PACKET_LEN, charset_id, b""
         )
 
-        if self.ssl and self.server_capabilities & CLIENT.SSL:
-            self.write_packet(data_init)
-
-            self._sock = self.ctx.wrap_socket(self._sock, server_hostname=self.host)
-            self._rfile = self._sock.makefile("rb")
-            self._secure = True
-
+    def _handshake_response(self, data_init):
+        """Return the handshake response packet starting with *data_init*."""
         data = data_init + self.user + b"\0"
 
         authresp = b""
@@ -953,41 +1656,12 @@ class Connection:
                 connect_attrs += _lenenc_int(len(v)) + v
             data += _lenenc_int(len(connect_attrs)) + connect_attrs
 
-        self.write_packet(data)
-        auth_packet = self._read_packet()
+        if self.client_flag & CLIENT.ZSTD_COMPRESSION_ALGORITHM:
+            data += struct.pack("B", ZSTD_COMPRESSION_LEVEL)
 
-        # if authentication method isn't accepted the first byte
-        # will have the octet 254
-        if auth_packet.is_auth_switch_request():
-            if DEBUG:
-                print("received auth switch")
-            # https://dev.mysql.com/doc/internals/en/connection-phase-packets.html#packet-Protocol::AuthSwitchRequest
-            auth_packet.read_uint8()  # 0xfe packet identifier
-            plugin_name = auth_packet.read_string()
-            if (
-                self.server_capabilities & CLIENT.PLUGIN_AUTH
-                and plugin_name is not None
-            ):
-                auth_packet = self._process_auth(plugin_name, auth_packet)
-            else:
-                raise err.OperationalError("received unknown auth switch request")
-        elif auth_packet.is_extra_auth_data():
-            if DEBUG:
-                print("received extra data")
-            # https://dev.mysql.com/doc/internals/en/successful-authentication.html
-            if self._auth_plugin_name == "caching_sha2_password":
-                auth_packet = _auth.caching_sha2_password_auth(self, auth_packet)
-            elif self._auth_plugin_name == "sha256_password":
-                auth_packet = _auth.sha256_password_auth(self, auth_packet)
-            else:
-                raise err.OperationalError(
-                    "Received extra packet for auth method %r", self._auth_plugin_name
-                )
-
-        if DEBUG:
-            print("Succeed to auth")
+        return data
 
-    def _process_auth(self, plugin_name, auth_packet):
+    def _process_auth_steps(self, plugin_name, auth_packet):
         handler = self._get_auth_plugin_handler(plugin_name)
         if handler:
             try:
@@ -1000,9 +1674,9 @@ class Connection:
                         f" not loaded: - {type(handler)!r} missing authenticate method",
                     )
         if plugin_name == b"caching_sha2_password":
-            return _auth.caching_sha2_password_auth(self, auth_packet)
+            return (yield from _auth.caching_sha2_password_steps(self, auth_packet))
         elif plugin_name == b"sha256_password":
-            return _auth.sha256_password_auth(self, auth_packet)
+            return (yield from _auth.sha256_password_steps(self, auth_packet))
         elif plugin_name == b"mysql_native_password":
             data = _auth.scramble_native_password(self.password, auth_packet.read_all())
         elif plugin_name == b"client_ed25519":
@@ -1024,12 +1698,12 @@ class Connection:
                 prompt = pkt.read_all()
 
                 if prompt == b"Password: ":
-                    self.write_packet(self.password + b"\0")
+                    data = self.password + b"\0"
                 elif handler:
                     resp = "no response - TypeError within plugin.prompt method"
                     try:
                         resp = handler.prompt(echo, prompt)
-                        self.write_packet(resp + b"\0")
+                        data = resp + b"\0"
                     except AttributeError:
                         raise err.OperationalError(
                             CR.CR_AUTH_PLUGIN_CANNOT_LOAD,
@@ -1047,8 +1721,7 @@ class Connection:
                         CR.CR_AUTH_PLUGIN_CANNOT_LOAD,
                         f"Authentication plugin '{plugin_name}' not configured",
                     )
-                pkt = self._read_packet()
-                pkt.check_error()
+                pkt = yield data
                 if pkt.is_ok_packet() or last:
                     break
             return pkt
@@ -1058,10 +1731,7 @@ class Connection:
                 "Authentication plugin '%s' not configured" % plugin_name,
             )
 
-        self.write_packet(data)
-        pkt = self._read_packet()
-        pkt.check_error()
-        return pkt
+        return (yield data)
 
     def _get_auth_plugin_handler(self, plugin_name):
         plugin_class = self._auth_plugin_map.get(plugin_name)
@@ -1094,8 +1764,10 @@ class Connection:
         return self.protocol_version
 
     def _get_server_information(self):
+        self._parse_server_information(self._read_packet())
+
+    def _parse_server_information(self, packet):
         i = 0
-        packet = self._read_packet()
         data = packet.get_all_data()
 
         self.protocol_version = data[i]
@@ -1325,17 +1997,187 @@ class MySQLResult:
 
     def _read_rowdata_packet(self):
         """Read a rowdata packet for each data row in the result set."""
-        rows = []
+        payloads = []
         while True:
             packet = self.connection._read_packet()
             if self._check_packet_is_eof(packet):
                 self.connection = None  # release reference to kill cyclic reference.
                 break
-            rows.append(self._read_row_from_packet(packet))
+            payloads.append(packet.get_payload())
 
+        rows = self._read_rows_from_payloads(payloads)
         self.affected_rows = len(rows)
         self.rows = tuple(rows)
 
+    def _read_rows_from_payloads(self, payloads):
+        """Decode the payloads of all rowdata packets of a result in one pass.
+
+        This is the batch counterpart of :meth:`_read_row_from_packet` and
+        returns the same row tuples.  Length coded strings are parsed inline
+        instead of through :class:`MysqlPacket` method calls, and the per-column
+        decode plan from :meth:`_set_fields` is used.  Payloads may be bytes or
+        memoryview slices of the receive buffer; the latter are decoded in place.
+        """
+        if DEBUG:
+            return [
+                self._read_row_from_packet(MysqlPacket(data, None)) for data in payloads
+            ]
+
+        bytes_plan = self._row_plan
+        buffer_plan = self._row_plan_buffer
+        rows = []
+        append = rows.append
+        for data in payloads:
+            if type(data) is bytes:
+                plan, decode = bytes_plan, bytes.decode
+            else:
+                plan, decode = buffer_plan, str
+            end = len(data)
+            pos = 0
+            row = []
+            for encoding, converter in plan:
+                if pos >= end:
+                    # No more columns in this row
+                    # See https://github.com/PyMySQL/PyMySQL/pull/434
+                    break
+                length = data[pos]
+                pos += 1
+                if length >= NULL_COLUMN:
+                    if length == UNSIGNED_SHORT_COLUMN:
+                        size = 2
+                    elif length == UNSIGNED_INT24_COLUMN:
+                        size = 3
+                    elif length == UNSIGNED_INT64_COLUMN:
+                        size = 8
+                    else:
+                        row.append(None)
+                        continue
+                    length = int.from_bytes(data[pos : pos + size], "little")
+                    pos += size
+                value = data[pos : pos + length]
+                pos += length
+                if pos > end:
+                    # Truncated packet; the packet reader raises the error.
+                    row = self._read_row_from_packet(MysqlPacket(data, None))
+                    break
+                if encoding is not None:
+                    value = decode(value, encoding)
+                if converter is not None:
+                    value = converter(value)
+                row.append(value)
+            append(tuple(row))
+        return rows
+
+    def _read_columns_unbuffered(self, size):
+        """Read up to size rows of an unbuffered result, column by column.
+
+        Returns the list built by :meth:`_read_columns_from_payloads`, or None
+        when no rows are left.
+        """
+        if not self.unbuffered_active:
+            return None
+
+        payloads = []
+        while len(payloads) < size:
+            packet = self.connection._read_packet()
+            if self._check_packet_is_eof(packet):
+                self.unbuffered_active = False
+                self.connection = None
+                break
+            payloads.append(packet.get_payload())
+
+        self.rows = None
+        if not payloads:
+            return None
+        self.affected_rows = len(payloads)
+        return self._read_columns_from_payloads(payloads)
+
+    def _read_columns_from_payloads(self, payloads):
+        """Decode the payloads of rowdata packets into one sequence per column.
+
+        Values are decoded like in :meth:`_read_rows_from_payloads`, but no
+        tuple is built per row.  Columns whose converter is ``int`` or
+        ``float`` are returned as :class:`array.array` (typecode ``q``, ``Q``
+        for unsigned BIGINT, or ``d``) unless they hold a NULL in this batch;
+        the other columns are lists.
+        """
+        plan = self._row_plan
+        columns = [[] for _ in plan]
+        if DEBUG:
+            for data in payloads:
+                row = self._read_row_from_packet(MysqlPacket(data, None))
+                row += (None,) * (len(columns) - len(row))
+                for column, value in zip(columns, row):
+                    column.append(value)
+        else:
+            bytes_targets = [
+                (column.append, encoding, converter)
+                for column, (encoding, converter) in zip(columns, plan)
+            ]
+            buffer_targets = [
+                (column.append, encoding, converter)
+                for column, (encoding, converter) in zip(
+                    columns, self._row_plan_buffer
+                )
+            ]
+            for data in payloads:
+                if type(data) is bytes:
+                    targets, decode = bytes_targets, bytes.decode
+                else:
+                    targets, decode = buffer_targets, str
+                end = len(data)
+                pos = 0
+                for append, encoding, converter in targets:
+                    if pos >= end:
+                        # No more columns in this row; keep columns aligned.
+                        append(None)
+                        continue
+                    length = data[pos]
+                    pos += 1
+                    if length >= NULL_COLUMN:
+                        if length == UNSIGNED_SHORT_COLUMN:
+                            size = 2
+                        elif length == UNSIGNED_INT24_COLUMN:
+                            size = 3
+                        elif length == UNSIGNED_INT64_COLUMN:
+                            size = 8
+                        else:
+                            append(None)
+                            continue
+                        length = int.from_bytes(data[pos : pos + size], "little")
+                        pos += size
+                    value = data[pos : pos + length]
+                    pos += length
+                    if pos > end:
+                        # Truncated packet; the packet reader raises the error.
+                        self._read_row_from_packet(MysqlPacket(data, None))
+                    if encoding is not None:
+                        value = decode(value, encoding)
+                    if converter is not None:
+                        value = converter(value)
+                    append(value)
+
+        for i, (field, (encoding, converter)) in enumerate(zip(self.fields, plan)):
+            if encoding is not None or None in columns[i]:
+                continue
+            if converter is int:
+                if (
+                    field.type_code == FIELD_TYPE.LONGLONG
+                    and field.flags & FLAG.UNSIGNED
+                ):
+                    typecode = "Q"
+                else:
+                    typecode = "q"
+            elif converter is float:
+                typecode = "d"
+            else:
+                continue
+            try:
+                columns[i] = array.array(typecode, columns[i])
+            except OverflowError:
+                pass
+        return columns
+
     def _read_row_from_packet(self, packet):
         row = []
         for encoding, converter in self.converters:
@@ -1357,15 +2199,24 @@ class MySQLResult:
 
     def _get_descriptions(self):
         """Read a column descriptor packet for each column in the result."""
-        self.fields = []
+        fields = [
+            self.connection._read_packet(FieldDescriptorPacket)
+            for _ in range(self.field_count)
+        ]
+        eof_packet = self.connection._read_packet()
+        assert eof_packet.is_eof_packet(), "Protocol error, expecting EOF"
+        self._set_fields(fields)
+
+    def _set_fields(self, fields):
+        """Build the description and decode plans from the column descriptors."""
+        self.fields = fields
         self.converters = []
+        self._row_plan = []
         use_unicode = self.connection.use_unicode
         conn_encoding = self.connection.encoding
         description = []
 
-        for i in range(self.field_count):
-            field = self.connection._read_packet(FieldDescriptorPacket)
-            self.fields.append(field)
+        for field in fields:
             description.append(field.description())
             field_type = field.type_code
             if use_unicode:
@@ -1393,12 +2244,210 @@ class MySQLResult:
             if DEBUG:
                 print(f"DEBUG: field={field}, converter={converter}")
             self.converters.append((encoding, converter))
+            if encoding == "ascii" and converter in _BYTES_CONVERTERS:
+                # int() and float() parse ASCII bytes directly.
+                self._row_plan.append((None, converter))
+            else:
+                self._row_plan.append((encoding, converter))
+        self._row_plan_buffer = [_buffer_step(*step) for step in self._row_plan]
 
-        eof_packet = self.connection._read_packet()
-        assert eof_packet.is_eof_packet(), "Protocol error, expecting EOF"
         self.description = tuple(description)
 
 
+# Binary protocol column kinds of MySQLBinaryResult.
+_BINARY_LENENC = 0
+_BINARY_INT = 1
+_BINARY_DOUBLE = 2
+_BINARY_FLOAT = 3
+_BINARY_DATETIME = 4
+_BINARY_DATE = 5
+_BINARY_TIME = 6
+
+_BINARY_INT_SIZES = {
+    FIELD_TYPE.TINY: 1,
+    FIELD_TYPE.SHORT: 2,
+    FIELD_TYPE.YEAR: 2,
+    FIELD_TYPE.INT24: 4,
+    FIELD_TYPE.LONG: 4,
+    FIELD_TYPE.LONGLONG: 8,
+}
+
+_BINARY_TEMPORAL_KINDS = {
+    FIELD_TYPE.DATETIME: _BINARY_DATETIME,
+    FIELD_TYPE.TIMESTAMP: _BINARY_DATETIME,
+    FIELD_TYPE.DATE: _BINARY_DATE,
+    FIELD_TYPE.NEWDATE: _BINARY_DATE,
+    FIELD_TYPE.TIME: _BINARY_TIME,
+}
+
+_LENENC_INT_SIZES = {
+    UNSIGNED_SHORT_COLUMN: 2,
+    UNSIGNED_INT24_COLUMN: 3,
+    UNSIGNED_INT64_COLUMN: 8,
+}
+
+_unpack_float = struct.Struct("<f").unpack_from
+_unpack_double = struct.Struct("<d").unpack_from
+
+
+def _float32(data, pos):
+    """Unpack a FLOAT column as the shortest decimal which rounds to it.
+
+    This is what the text protocol sends, e.g. 1.1 instead of 1.100000023841858.
+    """
+    value = _unpack_float(data, pos)[0]
+    for precision in (6, 7, 8, 9):
+        short = float("%.*g" % (precision, value))
+        if struct.unpack("<f", struct.pack("<f", short))[0] == value:
+            return short
+    return value
+
+
+def _unpack_binary_datetime(data, pos, kind, scale):
+    """Unpack a DATE, DATETIME or TIMESTAMP column.
+
+    Values which are not valid dates (like 0000-00-00) are returned as str,
+    as the text protocol converters do.
+    """
+    length = data[pos]
+    year = month = day = hour = minute = second = microsecond = 0
+    if length >= 4:
+        year, month, day = struct.unpack_from("<HBB", data, pos + 1)
+    if length >= 7:
+        hour, minute, second = data[pos + 5], data[pos + 6], data[pos + 7]
+    if length >= 11:
+        microsecond = struct.unpack_from("<I", data, pos + 8)[0]
+    pos += 1 + length
+    try:
+        if kind == _BINARY_DATE:
+            return datetime.date(year, month, day), pos
+        return (
+            datetime.datetime(year, month, day, hour, minute, second, microsecond),
+            pos,
+        )
+    except ValueError:
+        text = f"{year:04d}-{month:02d}-{day:02d}"
+        if kind != _BINARY_DATE:
+            text += f" {hour:02d}:{minute:02d}:{second:02d}"
+            if scale:
+                text += f".{microsecond:06d}"[: scale + 1]
+        return text, pos
+
+
+def _unpack_binary_time(data, pos):
+    """Unpack a TIME column as a timedelta."""
+    length = data[pos]
+    value = datetime.timedelta(0)
+    if length >= 8:
+        negative, days, hour, minute, second = struct.unpack_from(
+            "<BIBBB", data, pos + 1
+        )
+        microsecond = 0
+        if length >= 12:
+            microsecond = struct.unpack_from("<I", data, pos + 9)[0]
+        value = datetime.timedelta(
+            days=days,
+            hours=hour,
+            minutes=minute,
+            seconds=second,
+            microseconds=microsecond,
+        )
+        if negative:
+            value = -value
+    return value, pos + 1 + length
+
+
+class MySQLBinaryResult(MySQLResult):
+    """Result of a prepared statement, whose rows use the binary protocol.
+
+    Columns sent as length coded strings (strings, DECIMAL, JSON, BIT, ...)
+    are decoded and converted like in text results.  Integer, floating point,
+    date and time columns are unpacked straight into Python objects, so
+    converters from ``conv`` are not applied to them.
+    """
+
+    def _set_fields(self, fields):
+        super()._set_fields(fields)
+        plan = []
+        for field, (encoding, converter) in zip(self.fields, self.converters):
+            type_code = field.type_code
+            if type_code in _BINARY_INT_SIZES:
+                signed = not field.flags & FLAG.UNSIGNED
+                plan.append((_BINARY_INT, _BINARY_INT_SIZES[type_code], signed))
+            elif type_code == FIELD_TYPE.DOUBLE:
+                plan.append((_BINARY_DOUBLE, None, None))
+            elif type_code == FIELD_TYPE.FLOAT:
+                plan.append((_BINARY_FLOAT, None, None))
+            elif type_code in _BINARY_TEMPORAL_KINDS:
+                plan.append((_BINARY_TEMPORAL_KINDS[type_code], field.scale, None))
+            else:
+                plan.append((_BINARY_LENENC, encoding, converter))
+        self._binary_plan = plan
+        self._binary_plan_buffer = [
+            (kind, *_buffer_step(a, b)) if kind == _BINARY_LENENC else (kind, a, b)
+            for kind, a, b in plan
+        ]
+
+    def _read_row_from_packet(self, packet):
+        return self._read_rows_from_payloads([packet.get_payload()])[0]
+
+    def _read_rows_from_payloads(self, payloads):
+        """Decode binary protocol rows.
+
+        https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_binary_resultset.html
+        """
+        bytes_plan = self._binary_plan
+        buffer_plan = self._binary_plan_buffer
+        # Packet header (0x00), then a NULL bitmap with an offset of 2 bits.
+        null_bitmap = [
+            (1 + (i + 2) // 8, 1 << ((i + 2) % 8)) for i in range(len(bytes_plan))
+        ]
+        start = 1 + (len(bytes_plan) + 9) // 8
+        rows = []
+        append = rows.append
+        for data in payloads:
+            if type(data) is bytes:
+                plan, decode = bytes_plan, bytes.decode
+            else:
+                plan, decode = buffer_plan, str
+            pos = start
+            row = []
+            for (kind, a, b), (byte, bit) in zip(plan, null_bitmap):
+                if data[byte] & bit:
+                    row.append(None)
+                elif kind == _BINARY_LENENC:
+                    length = data[pos]
+                    pos += 1
+                    if length >= NULL_COLUMN:
+                        size = _LENENC_INT_SIZES[length]
+                        length = int.from_bytes(data[pos : pos + size], "little")
+                        pos += size
+                    value = data[pos : pos + length]
+                    pos += length
+                    if a is not None:
+                        value = decode(value, a)
+                    if b is not None:
+                        value = b(value)
+                    row.append(value)
+                elif kind == _BINARY_INT:
+                    row.append(int.from_bytes(data[pos : pos + a], "little", signed=b))
+                    pos += a
+                elif kind == _BINARY_DOUBLE:
+                    row.append(_unpack_double(data, pos)[0])
+                    pos += 8
+                elif kind == _BINARY_FLOAT:
+                    row.append(_float32(data, pos))
+                    pos += 4
+                elif kind == _BINARY_TIME:
+                    value, pos = _unpack_binary_time(data, pos)
+                    row.append(value)
+                else:
+                    value, pos = _unpack_binary_datetime(data, pos, kind, a)
+                    row.append(value)
+            append(tuple(row))
+        return rows
+
+
 class LoadLocalFile:
     def __init__(self, filename, connection):
         self.filename = filename
@@ -20,6 +20,7 @@ PS_MULTI_RESULTS = 1 << 18
 PLUGIN_AUTH = 1 << 19
 CONNECT_ATTRS = 1 << 20
 PLUGIN_AUTH_LENENC_CLIENT_DATA = 1 << 21
+ZSTD_COMPRESSION_ALGORITHM = 1 << 26
 CAPABILITIES = (
     LONG_PASSWORD
     | LONG_FLAG
@@ -1,6 +1,7 @@
 import re
 import warnings
 from . import err
+from .constants import CLIENT
 
 
 #: Regular expression for :meth:`Cursor.executemany`.
@@ -31,6 +32,13 @@ class Cursor:
     #: Default value of max_allowed_packet is 1048576.
     max_stmt_length = 1024000
 
+    #: Whether :meth:`executemany` batches statements which aren't multiple-row
+    #: INSERT or REPLACE into multi-statement queries.
+    #:
+    #: The connection must be created with ``CLIENT.MULTI_STATEMENTS`` in
+    #: ``client_flag``.
+    batch_statements = False
+
     def __init__(self, connection):
         self.connection = connection
         self.warning_count = 0
@@ -41,6 +49,7 @@ class Cursor:
         self._executed = None
         self._result = None
         self._rows = None
+        self.rowcounts = None
 
     def close(self):
         """
@@ -99,9 +108,9 @@ class Cursor:
 
     def _escape_args(self, args, conn):
         if isinstance(args, (tuple, list)):
-            return tuple(conn.literal(arg) for arg in args)
+            return conn._literal_sequence(args)
         elif isinstance(args, dict):
-            return {key: conn.literal(val) for (key, val) in args.items()}
+            return dict(zip(args, conn._literal_sequence(args.values())))
         else:
             # If it's not a dictionary let's try escaping it anyways.
             # Worst case it will throw a Value error
@@ -169,6 +178,18 @@ class Cursor:
         This method improves performance on multiple-row INSERT and
         REPLACE. Otherwise it is equivalent to looping over args with
         execute().
+
+        When :attr:`batch_statements` is set, other statements are batched
+        too: as many statements as fit in :attr:`max_stmt_length` are sent in
+        one query, separated by ``;`` on a line of its own, and their results
+        are read back with :meth:`nextset`.  When a statement fails, the
+        server doesn't run the statements after it in the same query.
+
+        After the call, :attr:`rowcounts` holds the affected rows of each
+        statement (each result, when query itself has several statements).
+        If a statement failed, it holds those of the statements which were run
+        before it.  It is None when INSERT or REPLACE rows were
+        merged into multiple-row statements.
         """
         if not args:
             return
@@ -188,12 +209,35 @@ class Cursor:
                 self._get_db().encoding,
             )
 
-        self.rowcount = sum(self.execute(query, arg) for arg in args)
+        conn = self._get_db()
+        if self._check_batch_statements(conn):
+            return self._do_execute_many_statements(
+                query, args, self.max_stmt_length, conn.encoding
+            )
+
+        rowcounts = []
+        try:
+            for arg in args:
+                rowcounts.append(self.execute(query, arg))
+        finally:
+            # execute() resets it; set even if a statement failed
+            self.rowcounts = rowcounts
+        self.rowcount = sum(rowcounts)
         return self.rowcount
 
     def _do_execute_many(
         self, prefix, values, postfix, args, max_stmt_length, encoding
     ):
+        rows = 0
+        for sql in self._insert_batches(
+            prefix, values, postfix, args, max_stmt_length, encoding
+        ):
+            rows += self.execute(sql)
+        self.rowcount = rows
+        return rows
+
+    def _insert_batches(self, prefix, values, postfix, args, max_stmt_length, encoding):
+        """Yield multiple-row INSERT statements holding all of args."""
         conn = self._get_db()
         escape = self._escape_args
         if isinstance(prefix, str):
@@ -206,20 +250,70 @@ class Cursor:
         if isinstance(v, str):
             v = v.encode(encoding, "surrogateescape")
         sql += v
-        rows = 0
         for arg in args:
             v = values % escape(arg, conn)
             if isinstance(v, str):
                 v = v.encode(encoding, "surrogateescape")
             if len(sql) + len(v) + len(postfix) + 1 > max_stmt_length:
-                rows += self.execute(sql + postfix)
+                yield sql + postfix
                 sql = bytearray(prefix)
             else:
                 sql += b","
             sql += v
-        rows += self.execute(sql + postfix)
-        self.rowcount = rows
-        return rows
+        yield sql + postfix
+
+    def _check_batch_statements(self, conn):
+        """Return :attr:`batch_statements`, checking that conn allows it."""
+        if not self.batch_statements:
+            return False
+        if not conn.client_flag & CLIENT.MULTI_STATEMENTS:
+            raise err.ProgrammingError(
+                "batch_statements requires a connection created with "
+                "CLIENT.MULTI_STATEMENTS in client_flag"
+            )
+        return True
+
+    def _do_execute_many_statements(self, query, args, max_stmt_length, encoding):
+        rowcounts = []
+        try:
+            for sql in self._statement_batches(
+                query, args, max_stmt_length, encoding
+            ):
+                self._execute_statements(sql, rowcounts)
+        finally:
+            # execute() resets it; set even if a statement failed
+            self.rowcounts = rowcounts
+        self.rowcount = sum(rowcounts)
+        return self.rowcount
+
+    def _statement_batches(self, query, args, max_stmt_length, encoding):
+        """Yield multi-statement queries running query once for each of args."""
+        query = query.rstrip()
+        if query.endswith(";"):
+            query = query[:-1]
+        sql = bytearray()
+        for arg in args:
+            stmt = self.mogrify(query, arg)
+            if isinstance(stmt, str):
+                stmt = stmt.encode(encoding, "surrogateescape")
+            if sql:
+                # the newline before ";" ends a trailing "-- " or "#"
+                # comment of the previous statement, which would otherwise
+                # hide the separator and the statements after it
+                if len(sql) + len(stmt) + 3 > max_stmt_length:
+                    yield sql
+                    sql = bytearray()
+                else:
+                    sql += b"\n;\n"
+            sql += stmt
+        yield sql
+
+    def _execute_statements(self, sql, rowcounts):
+        """Execute several statements at once, appending the rowcount of each
+        to rowcounts."""
+        rowcounts.append(self.execute(bytes(sql)))
+        while self.nextset():
+            rowcounts.append(self.rowcount)
 
     def callproc(self, procname, args=()):
         """Execute stored procedure procname with args.
@@ -332,6 +426,7 @@ class Cursor:
         self.description = None
         self.lastrowid = None
         self._rows = None
+        self.rowcounts = None
 
     def _do_get_result(self):
         conn = self._get_db()
@@ -401,11 +496,78 @@ class DictCursorMixin:
             return None
         return self.dict_type(zip(self._fields, row))
 
+    def _conv_columns(self, columns):
+        return self.dict_type(zip(self._fields, columns))
+
 
 class DictCursor(DictCursorMixin, Cursor):
     """A cursor which returns results as a dictionary"""
 
 
+class PreparedCursor(Cursor):
+    """
+    Cursor which executes queries as server-side prepared statements.
+
+    Queries use the same ``%s`` / ``%(name)s`` placeholders as :class:`Cursor`.
+    Each query is prepared once per connection with COM_STMT_PREPARE and kept
+    in the connection's statement cache (see the ``stmt_cache_size`` argument
+    of :class:`~pymysql.connections.Connection`).  Arguments are sent in the
+    binary protocol instead of being escaped into the query text, and result
+    rows are decoded from the binary protocol.
+
+    A placeholder can only stand for a single value; sequences such as the
+    ones :class:`Cursor` expands for ``IN %s`` are not supported.
+    """
+
+    def execute(self, query, args=None):
+        """Execute a query as a prepared statement.
+
+        :param query: Query to execute.
+        :type query: str
+
+        :param args: Parameters used with query. (optional)
+        :type args: tuple, list or dict
+
+        :return: Number of affected rows.
+        :rtype: int
+        """
+        while self.nextset():
+            pass
+
+        conn = self._get_db()
+        self._clear_result()
+        conn._execute_prepared(query, args)
+        self._do_get_result()
+        self._executed = query
+        return self.rowcount
+
+    def executemany(self, query, args):
+        """Run the prepared query for each item of args.
+
+        The statement is prepared once; only the parameters are sent for
+        each execution.
+
+        :return: Number of rows affected, if any.
+        :rtype: int or None
+        """
+        if not args:
+            return
+
+        rowcounts = []
+        try:
+            for arg in args:
+                rowcounts.append(self.execute(query, arg))
+        finally:
+            # execute() resets it; set even if a statement failed
+            self.rowcounts = rowcounts
+        self.rowcount = sum(rowcounts)
+        return self.rowcount
+
+
+class PreparedDictCursor(DictCursorMixin, PreparedCursor):
+    """A prepared statement cursor which returns results as a dictionary"""
+
+
 class SSCursor(Cursor):
     """
     Unbuffered Cursor, mainly useful for queries that return a lot of data,
@@ -481,6 +643,33 @@ class SSCursor(Cursor):
         """
         return iter(self.fetchone, None)
 
+    def _conv_columns(self, columns):
+        return columns
+
+    def fetch_columns(self, size=None):
+        """Fetch up to size rows as one sequence per column.
+
+        Rows are decoded straight into their columns, without building a
+        tuple per row.  INT and DOUBLE columns (and any column converted with
+        ``int`` or ``float``, e.g. DECIMAL with a ``conv`` mapping it to
+        float) come back as :class:`array.array`, unless the batch holds a
+        NULL for them; other columns are lists.  With
+        :class:`SSDictCursor`, a dict of column name to column is returned.
+
+        :param size: Maximum number of rows to read. (default: arraysize)
+        :return: The columns, or None when no rows are left.
+        """
+        self._check_executed()
+        if size is None:
+            size = self.arraysize
+
+        columns = self._result._read_columns_unbuffered(size)
+        if columns is None:
+            self.warning_count = self._result.warning_count
+            return None
+        self.rownumber += self._result.affected_rows
+        return self._conv_columns(columns)
+
     def fetchmany(self, size=None):
         """Fetch many."""
         self._check_executed()
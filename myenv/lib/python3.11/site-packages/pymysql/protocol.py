@@ -5,6 +5,7 @@ from .charset import MBLENGTH
 from .constants import FIELD_TYPE, SERVER_STATUS
 from . import err
 
+import re
 import struct
 import sys
 
@@ -17,6 +18,8 @@ UNSIGNED_SHORT_COLUMN = 252
 UNSIGNED_INT24_COLUMN = 253
 UNSIGNED_INT64_COLUMN = 254
 
+_NUL = re.compile(b"\0")
+
 
 def dump_packet(data):  # pragma: no cover
     def printable(data):
@@ -48,6 +51,10 @@ class MysqlPacket:
     """Representation of a MySQL response packet.
 
     Provides an interface for reading/parsing the packet results.
+
+    The payload may be ``bytes`` or a ``memoryview`` slice of the connection's
+    receive buffer.  Either way the packet is parsed in place and the methods
+    returning parts of the payload return ``bytes``.
     """
 
     __slots__ = ("_position", "_data")
@@ -57,6 +64,11 @@ class MysqlPacket:
         self._data = data
 
     def get_all_data(self):
+        return bytes(self._data)
+
+    def get_payload(self):
+        """Return the payload as it was read, ``bytes`` or a ``memoryview``,
+        without copying it."""
         return self._data
 
     def read(self, size):
@@ -72,7 +84,7 @@ class MysqlPacket:
                 self.dump()
             raise AssertionError(error)
         self._position += size
-        return result
+        return bytes(result)
 
     def read_all(self):
         """Read all remaining data in the packet.
@@ -81,7 +93,7 @@ class MysqlPacket:
         """
         result = self._data[self._position :]
         self._position = None  # ensure no subsequent read()
-        return result
+        return bytes(result)
 
     def advance(self, length):
         """Advance the cursor in data buffer 'length' bytes."""
@@ -107,7 +119,7 @@ class MysqlPacket:
         No error checking is done.  If requesting outside end of buffer
         an empty string (or string shorter than 'length') may be returned!
         """
-        return self._data[position : (position + length)]
+        return bytes(self._data[position : (position + length)])
 
     def read_uint8(self):
         result = self._data[self._position]
@@ -135,10 +147,16 @@ class MysqlPacket:
         return result
 
     def read_string(self):
-        end_pos = self._data.find(b"\0", self._position)
+        data = self._data
+        if type(data) is bytes:
+            end_pos = data.find(b"\0", self._position)
+        else:
+            # memoryview has no find(); re searches any buffer in place
+            match = _NUL.search(data, self._position)
+            end_pos = match.start() if match is not None else -1
         if end_pos < 0:
             return None
-        result = self._data[self._position : end_pos]
+        result = bytes(data[self._position : end_pos])
         self._position = end_pos + 1
         return result
 
@@ -216,7 +234,7 @@ class MysqlPacket:
         errno = self.read_uint16()
         if DEBUG:
             print("errno =", errno)
-        err.raise_mysql_exception(self._data)
+        err.raise_mysql_exception(self.get_all_data())
 
     def dump(self):
         dump_packet(self._data)
@@ -230,7 +248,8 @@ class FieldDescriptorPacket(MysqlPacket):
     """
 
     def __init__(self, data, encoding):
-        MysqlPacket.__init__(self, data, encoding)
+        # Field descriptors outlive the read; don't pin the receive buffer.
+        MysqlPacket.__init__(self, bytes(data), encoding)
         self._parse_field_descriptor(encoding)
 
     def _parse_field_descriptor(self, encoding):
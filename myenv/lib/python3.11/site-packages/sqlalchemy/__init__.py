@@ -45,6 +45,7 @@ from .engine import TwoPhaseTransaction as TwoPhaseTransaction
 from .engine import TypeCompiler as TypeCompiler
 from .engine import URL as URL
 from .inspection import inspect as inspect
+from .pool import AffinityQueuePool as AffinityQueuePool
 from .pool import AssertionPool as AssertionPool
 from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
 from .pool import (
@@ -188,6 +189,7 @@ from .sql.expression import select as select
 from .sql.expression import Selectable as Selectable
 from .sql.expression import SelectBase as SelectBase
 from .sql.expression import SQLColumnExpression as SQLColumnExpression
+from .sql.expression import statement_template as statement_template
 from .sql.expression import StatementLambdaElement as StatementLambdaElement
 from .sql.expression import Subquery as Subquery
 from .sql.expression import table as table
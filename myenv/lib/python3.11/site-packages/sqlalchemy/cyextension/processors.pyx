@@ -51,6 +51,30 @@ def str_to_date(value):
         value = date_cls.fromisoformat(value)
     return value
 
+def bytes_to_int(value):
+    if value is None:
+        return None
+    return int.from_bytes(value, "big")
+
+def timedelta_to_time(value):
+    cdef long seconds, minutes
+    if value is None:
+        return None
+    seconds = value.seconds
+    minutes = seconds // 60
+    return time_cls(
+        minutes // 60, minutes % 60, seconds - minutes * 60, value.microseconds
+    )
+
+def str_to_set(value):
+    if value is None:
+        return None
+    elif PyUnicode_Check(value):
+        return {elem for elem in value.split(",") if elem}
+    else:
+        value.discard("")
+        return value
+
 
 
 cdef class DecimalResultProcessor:
@@ -66,3 +90,36 @@ cdef class DecimalResultProcessor:
             return None
         else:
             return self.type_(self.format_ % value)
+
+
+cdef class BitmaskSetResultProcessor:
+    cdef dict bitmap
+
+    def __cinit__(self, dict bitmap):
+        self.bitmap = bitmap
+
+    def process(self, object value):
+        cdef object n, bit
+        cdef set result
+        if value is None:
+            return None
+        n = int(value)
+        result = set()
+        while n:
+            bit = n & -n
+            result.add(self.bitmap[bit])
+            n ^= bit
+        return result
+
+
+cdef class JSONResultProcessor:
+    cdef object deserializer
+
+    def __cinit__(self, deserializer):
+        self.deserializer = deserializer
+
+    def process(self, object value):
+        if value is None:
+            return None
+        else:
+            return self.deserializer(value)
@@ -15,6 +15,7 @@ from . import mariadbconnector  # noqa
 from . import mysqlconnector  # noqa
 from . import mysqldb  # noqa
 from . import pymysql  # noqa
+from . import pymysql_async  # noqa
 from . import pyodbc  # noqa
 from .base import BIGINT
 from .base import BINARY
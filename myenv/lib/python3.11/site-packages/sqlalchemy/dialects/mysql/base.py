@@ -2729,6 +2729,104 @@ class MySQLDialect(default.DefaultDialect):
     def _get_default_schema_name(self, connection):
         return connection.exec_driver_sql("SELECT DATABASE()").scalar()
 
+    def get_replica_lag(self, connection):
+        if (self._is_mysql and self.server_version_info >= (8, 0, 22)) or (
+            self.is_mariadb and self.server_version_info >= (10, 5, 1)
+        ):
+            stmt = "SHOW REPLICA STATUS"
+        else:
+            stmt = "SHOW SLAVE STATUS"
+
+        row = connection.exec_driver_sql(stmt).mappings().first()
+        if row is None:
+            return None
+
+        for key in ("Seconds_Behind_Source", "Seconds_Behind_Master"):
+            if key in row:
+                lag = row[key]
+                # NULL when the replication threads aren't running
+                return float(lag) if lag is not None else float("inf")
+        return None
+
+    def estimate_row_count(self, connection, statement):
+        if not isinstance(statement, sql.Select):
+            # compound selects and others are counted exactly
+            return None
+
+        try:
+            compiled = statement.compile(
+                dialect=self, compile_kwargs={"literal_binds": True}
+            )
+        except exc.CompileError:
+            # parameters of types which can't be rendered inline
+            return None
+
+        # ORM statements gain criteria only when compiled, such as the
+        # discriminator of single table inheritance or those of
+        # with_loader_criteria(), so look at the statement as compiled
+        table = self._plain_table_select(compiled.compile_state.statement)
+        if table is not None:
+            # the same statistics EXPLAIN would report for a full scan,
+            # without planning the statement
+            return connection.scalar(
+                sql.text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = :schema AND TABLE_NAME = :name"
+                ),
+                {
+                    "schema": table.schema
+                    or connection.dialect.default_schema_name,
+                    "name": table.name,
+                },
+            )
+
+        rows = (
+            connection.exec_driver_sql("EXPLAIN %s" % compiled)
+            .mappings()
+            .all()
+        )
+        if not rows:
+            return None
+
+        # rows of the outermost query block are joined in a nested loop,
+        # so that the number of rows produced is the product of the rows
+        # examined for each table and the fraction passing the conditions
+        block = rows[0]["id"]
+        estimate = 1.0
+        for row in rows:
+            if row["id"] != block:
+                continue
+            if row["rows"] is None:
+                if "Impossible" in (row["Extra"] or ""):
+                    return 0
+                return None
+            filtered = row.get("filtered")
+            estimate *= float(row["rows"])
+            if filtered is not None:
+                estimate *= float(filtered) / 100
+        return int(round(estimate))
+
+    def _plain_table_select(self, statement):
+        """Return the Table selected from if the statement selects all of
+        its rows, else None."""
+
+        if not isinstance(statement, sql.Select):
+            return None
+        if (
+            statement.whereclause is not None
+            or statement._group_by_clauses
+            or statement._having_criteria
+            or statement._distinct
+            or statement._limit_clause is not None
+            or statement._offset_clause is not None
+            or statement._setup_joins
+        ):
+            return None
+        froms = statement.get_final_froms()
+        if len(froms) == 1 and isinstance(froms[0], sa_schema.Table):
+            return froms[0]
+        return None
+
     @reflection.cache
     def has_table(self, connection, table_name, schema=None, **kw):
         self._ensure_has_table_connection(connection)
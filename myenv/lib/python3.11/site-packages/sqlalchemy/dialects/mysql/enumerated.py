@@ -13,6 +13,7 @@ from .types import _StringType
 from ... import exc
 from ... import sql
 from ... import util
+from ...engine import processors
 from ...sql import sqltypes
 
 
@@ -171,23 +172,19 @@ class SET(_StringType):
 
     def result_processor(self, dialect, coltype):
         if self.retrieve_as_bitwise:
+            return processors.bitmask_to_set_processor_factory(self._bitmap)
 
-            def process(value):
-                if value is not None:
-                    value = int(value)
-
-                    return set(util.map_bits(self._bitmap.__getitem__, value))
-                else:
-                    return None
-
+        super_convert = super().result_processor(dialect, coltype)
+        if super_convert is None:
+            # MySQLdb returns a string, which is parsed; a set from
+            # mysql-connector-python has its blank element removed
+            return processors.str_to_set
         else:
-            super_convert = super().result_processor(dialect, coltype)
 
             def process(value):
                 if isinstance(value, str):
                     # MySQLdb returns a string, let's parse
-                    if super_convert:
-                        value = super_convert(value)
+                    value = super_convert(value)
                     return set(re.findall(r"[^,]+", value))
                 else:
                     # mysql-connector-python does a naive
@@ -6,7 +6,10 @@
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 # mypy: ignore-errors
 
+import json
+
 from ... import types as sqltypes
+from ...engine import processors
 
 
 class JSON(sqltypes.JSON):
@@ -30,7 +33,14 @@ class JSON(sqltypes.JSON):
 
     """
 
-    pass
+    def result_processor(self, dialect, coltype):
+        string_process = self._str_impl.result_processor(dialect, coltype)
+        if string_process is not None:
+            return super().result_processor(dialect, coltype)
+
+        return processors.json_processor_factory(
+            dialect._json_deserializer or json.loads
+        )
 
 
 class _FormatTypeMixin:
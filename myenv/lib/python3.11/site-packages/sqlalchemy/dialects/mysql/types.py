@@ -7,10 +7,9 @@
 # mypy: ignore-errors
 
 
-import datetime
-
 from ... import exc
 from ... import util
+from ...engine import processors
 from ...sql import sqltypes
 
 
@@ -381,17 +380,7 @@ class BIT(sqltypes.TypeEngine):
 
         """
 
-        def process(value):
-            if value is not None:
-                v = 0
-                for i in value:
-                    if not isinstance(i, int):
-                        i = ord(i)  # convert byte to int on Python 2
-                    v = v << 8 | i
-                return v
-            return value
-
-        return process
+        return processors.bytes_to_int
 
 
 class TIME(sqltypes.TIME):
@@ -419,24 +408,8 @@ class TIME(sqltypes.TIME):
         self.fsp = fsp
 
     def result_processor(self, dialect, coltype):
-        time = datetime.time
-
-        def process(value):
-            # convert from a timedelta value
-            if value is not None:
-                microseconds = value.microseconds
-                seconds = value.seconds
-                minutes = seconds // 60
-                return time(
-                    minutes // 60,
-                    minutes % 60,
-                    seconds - minutes * 60,
-                    microsecond=microseconds,
-                )
-            else:
-                return None
-
-        return process
+        # convert from a timedelta value
+        return processors.timedelta_to_time
 
 
 class TIMESTAMP(sqltypes.TIMESTAMP):
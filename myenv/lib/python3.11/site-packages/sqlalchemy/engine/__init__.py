@@ -56,6 +56,8 @@ from .result import TupleResult as TupleResult
 from .row import BaseRow as BaseRow
 from .row import Row as Row
 from .row import RowMapping as RowMapping
+from .routing import ReplicaRouter as ReplicaRouter
+from .stats import EngineStats as EngineStats
 from .url import make_url as make_url
 from .url import URL as URL
 from .util import connection_memoize as connection_memoize
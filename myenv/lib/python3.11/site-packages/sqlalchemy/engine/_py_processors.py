@@ -23,7 +23,9 @@ from decimal import Decimal
 import typing
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Optional
+from typing import Set
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -134,3 +136,64 @@ def str_to_date(value: Optional[str]) -> Optional[datetime.date]:
     else:
         dt_value = None
     return dt_value
+
+
+def bytes_to_int(value: Optional[bytes]) -> Optional[int]:
+    if value is None:
+        return None
+    else:
+        return int.from_bytes(value, "big")
+
+
+def timedelta_to_time(
+    value: Optional[datetime.timedelta],
+) -> Optional[datetime.time]:
+    if value is None:
+        return None
+    seconds = value.seconds
+    minutes = seconds // 60
+    return time_cls(
+        minutes // 60,
+        minutes % 60,
+        seconds - minutes * 60,
+        value.microseconds,
+    )
+
+
+def str_to_set(value: Optional[Union[str, Set[str]]]) -> Optional[Set[str]]:
+    if value is None:
+        return None
+    elif isinstance(value, str):
+        return {elem for elem in value.split(",") if elem}
+    else:
+        value.discard("")
+        return value
+
+
+def bitmask_to_set_processor_factory(
+    bitmap: Dict[Any, Any]
+) -> Callable[[Optional[Union[int, str]]], Optional[Set[Any]]]:
+    def process(value: Optional[Union[int, str]]) -> Optional[Set[Any]]:
+        if value is None:
+            return None
+        n = int(value)
+        result = set()
+        while n:
+            bit = n & -n
+            result.add(bitmap[bit])
+            n ^= bit
+        return result
+
+    return process
+
+
+def json_processor_factory(
+    deserializer: Callable[[Any], Any]
+) -> Callable[[Optional[Any]], Any]:
+    def process(value: Optional[Any]) -> Any:
+        if value is None:
+            return None
+        else:
+            return deserializer(value)
+
+    return process
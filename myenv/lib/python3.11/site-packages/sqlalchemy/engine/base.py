@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import contextlib
 import sys
+import time
 import typing
 from typing import Any
 from typing import Callable
@@ -34,6 +35,7 @@ from .interfaces import ExceptionContext
 from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .interfaces import IsolationLevel
+from .stats import EngineStats
 from .util import _distill_params_20
 from .util import _distill_raw_params
 from .util import TransactionalContext
@@ -1629,6 +1631,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             "compiled_cache", self.engine._compiled_cache
         )
 
+        stats = self.engine.stats
+        if stats is not None:
+            start = time.perf_counter()
+
         compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
             dialect=dialect,
             compiled_cache=compiled_cache,
@@ -1637,6 +1643,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             schema_translate_map=schema_translate_map,
             linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
         )
+        if stats is not None:
+            stats._record_compile(cache_hit, time.perf_counter() - start)
+
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -2949,6 +2958,13 @@ class Engine(
     url: URL
     hide_parameters: bool
 
+    stats: Optional[EngineStats] = None
+    """An :class:`.EngineStats` object collecting compiled cache and
+    connection pool statistics, present when the engine was created with
+    :paramref:`_sa.create_engine.collect_stats`; None otherwise.
+
+    """
+
     def __init__(
         self,
         pool: Pool,
@@ -2959,6 +2975,7 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        collect_stats: bool = False,
     ):
         self.pool = pool
         self.url = url
@@ -2973,11 +2990,16 @@ class Engine(
             )
         else:
             self._compiled_cache = None
+        if collect_stats:
+            self.stats = EngineStats(self)
+            pool._stats = self.stats.pool
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
 
     def _lru_size_alert(self, cache: util.LRUCache[Any, Any]) -> None:
+        if self.stats is not None:
+            self.stats.compiled_cache_evictions += len(cache) - cache.capacity
         if self._should_log_info():
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
@@ -3007,7 +3029,7 @@ class Engine(
         .. versionadded:: 1.4
 
         """
-        if self._compiled_cache:
+        if self._compiled_cache is not None:
             self._compiled_cache.clear()
 
     def update_execution_options(self, **opt: Any) -> None:
@@ -3200,6 +3222,8 @@ class Engine(
         if close:
             self.pool.dispose()
         self.pool = self.pool.recreate()
+        if self.stats is not None:
+            self.pool._stats = self.stats.pool
         self.dispatch.engine_disposed(self)
 
     @contextlib.contextmanager
@@ -3307,6 +3331,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[CompiledCacheType]
+    stats: Optional[EngineStats]
     dialect: Dialect
     pool: Pool
     url: URL
@@ -3322,6 +3347,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self.stats = proxied.stats
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
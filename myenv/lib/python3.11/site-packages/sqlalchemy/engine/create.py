@@ -72,14 +72,18 @@ def create_engine(
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
     pool_logging_name: str = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_ping_interval: float = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
     pool_timeout: float = ...,
     pool_use_lifo: bool = ...,
+    pool_warmup: int = ...,
     plugins: List[str] = ...,
     query_cache_size: int = ...,
+    collect_stats: bool = ...,
     use_insertmanyvalues: bool = ...,
     **kwargs: Any,
 ) -> Engine: ...
@@ -173,6 +177,16 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
         additional keyword arguments.  See the example
         at :ref:`custom_dbapi_args`.
 
+    :param collect_stats=False: if True, the engine collects counters
+     describing its compiled cache and connection pool, including cache
+     hits, misses and evictions, time spent compiling, connection checkout
+     wait times, overflow connections and invalidations.  These are
+     available from the :attr:`_engine.Engine.stats` attribute as an
+     :class:`.EngineStats` object, which can also pass a snapshot of its
+     counters to a callable such as an exporter for a metrics system
+     using :meth:`.EngineStats.export`.  Counters are maintained without
+     locking and add very little overhead to each execution.
+
     :param creator: a callable which returns a DBAPI connection.
         This creation function will be passed to the underlying
         connection pool and will be used to create all new database
@@ -425,6 +439,11 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_min_idle=0: number of idle connections which
+        :class:`.QueuePool` keeps open from a background thread, so that
+        checkouts seldom need to wait for a new connection to be
+        established.  See :paramref:`.QueuePool.min_idle`.
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -435,6 +454,13 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_interval: number of seconds; when used with
+        :paramref:`_sa.create_engine.pool_pre_ping`, connections which
+        were returned to the pool within this many seconds are not pinged
+        upon checkout, and :class:`.QueuePool` pings connections that
+        have been idle for longer from a background thread instead.
+        See :paramref:`_pool.Pool.pre_ping_interval`.
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -488,6 +514,10 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects`
 
+    :param pool_warmup=0: number of connections which :class:`.QueuePool`
+        opens from a background thread as soon as the engine is created.
+        See :paramref:`.QueuePool.warmup`.
+
     :param plugins: string list of plugin names to load.  See
         :class:`.CreateEnginePlugin` for background.
 
@@ -765,6 +795,11 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             pool, "connect", first_connect, _once_unless_exception=True
         )
 
+    # pool warmup and maintenance make connections from a background
+    # thread, which should only happen once the connect event handlers
+    # above are in place
+    pool._start_maintenance()
+
     dialect_cls.engine_created(engine)
     if entrypoint is not dialect_cls:
         entrypoint.engine_created(engine)
@@ -827,6 +862,7 @@ def create_pool_from_url(
     poolclass: Optional[Type[Pool]] = ...,
     logging_name: str = ...,
     pre_ping: bool = ...,
+    pre_ping_interval: float = ...,
     size: int = ...,
     recycle: int = ...,
     reset_on_return: Optional[_ResetStyleArgType] = ...,
@@ -870,6 +906,9 @@ _pool_translate_kwargs = immutabledict(
         "events": "pool_events",  # deprecated
         "reset_on_return": "pool_reset_on_return",
         "pre_ping": "pool_pre_ping",
+        "pre_ping_interval": "pool_pre_ping_interval",
         "use_lifo": "pool_use_lifo",
+        "min_idle": "pool_min_idle",
+        "warmup": "pool_warmup",
     }
 )
@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+from array import array
 import collections
 import functools
 import operator
@@ -1378,6 +1379,25 @@ def null_dml_result() -> IteratorResult[Any]:
     return it
 
 
+def _column_buffer(values: Sequence[Any]) -> Sequence[Any]:
+    """Return the values of one result column as an ``array.array`` if
+    they are all ``int`` or all ``float``, else as a list."""
+
+    types = set(map(type, values))
+    try:
+        if types == _int_types:
+            return array("q", values)
+        elif types == _float_types:
+            return array("d", values)
+    except OverflowError:
+        pass
+    return list(values)
+
+
+_int_types = {int}
+_float_types = {float}
+
+
 class CursorResult(Result[_T]):
     """A Result that is representing state from a DBAPI cursor.
 
@@ -2140,6 +2160,86 @@ class CursorResult(Result[_T]):
     def _raw_row_iterator(self):
         return self._fetchiter_impl()
 
+    def _columnar(self, rows: List[Any]) -> List[Sequence[Any]]:
+        if self._unique_filter_state:
+            raise exc.InvalidRequestError(
+                "Columnar fetching can't be combined with unique()"
+            )
+
+        metadata = self._metadata
+        if not rows:
+            return [[] for _ in metadata._keys]
+
+        columns: Sequence[Any] = list(zip(*rows))
+        if self.context._num_sentinel_cols:
+            columns = columns[: -self.context._num_sentinel_cols]
+
+        processors = metadata._effective_processors
+        tf = metadata._tuplefilter
+        if tf:
+            columns = tf(columns)
+            if processors:
+                processors = tf(processors)
+
+        if processors:
+            return [
+                _column_buffer(list(map(proc, column)) if proc else column)
+                for proc, column in zip(processors, columns)
+            ]
+        else:
+            return [_column_buffer(column) for column in columns]
+
+    def columnar(self) -> List[Sequence[Any]]:
+        """Return all remaining rows as a list of columns.
+
+        Each element of the returned list contains the values of one
+        column of the result, in the order of :meth:`.CursorResult.keys`,
+        with result processors applied to the column as a whole.  No
+        :class:`.Row` objects are created, making this method well suited
+        to fetching large results whose columns are consumed in bulk,
+        such as for aggregation.
+
+        A column whose values are all Python ``int`` or all ``float`` is
+        returned as an ``array.array`` of typecode ``"q"`` or ``"d"``;
+        any other column, including one that contains ``None``, is
+        returned as a list.
+
+        The result object is closed after this method is called.
+        Filtering applied with :meth:`.Result.columns` is honored;
+        :meth:`.Result.unique` is not supported.
+
+        .. seealso::
+
+            :meth:`.CursorResult.partitions_columnar`
+
+        """
+        return self._columnar(self._fetchall_impl())
+
+    def partitions_columnar(
+        self, size: Optional[int] = None
+    ) -> Iterator[List[Sequence[Any]]]:
+        """Iterate through batches of rows of the size given, each
+        returned as a list of columns.
+
+        Each batch has the form returned by :meth:`.CursorResult.columnar`.
+        As with :meth:`.Result.partitions`, all batches except the last
+        contain ``size`` rows, no empty batches are yielded, and the
+        result is closed when the iterator is fully consumed.
+
+        :param size: maximum number of rows in each batch.  If None,
+         makes use of the value set by :meth:`_engine.Result.yield_per`,
+         or the DBAPI's default fetch size.
+
+        """
+        if size is None:
+            size = self._yield_per
+
+        while True:
+            rows = self._fetchmany_impl(size)
+            if not rows:
+                break
+            yield self._columnar(rows)
+
     def merge(self, *others: Result[Any]) -> MergedResult[Any]:
         merged_result = super().merge(*others)
         if self.context._has_rowcount:
@@ -744,6 +744,12 @@ class DefaultDialect(Dialect):
             cursor.close()
         return True
 
+    def get_replica_lag(self, connection):
+        return None
+
+    def estimate_row_count(self, connection, statement):
+        return None
+
     def create_xid(self):
         """Create a random two-phase transaction ID.
 
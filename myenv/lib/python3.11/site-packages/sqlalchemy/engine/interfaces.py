@@ -66,6 +66,7 @@ if TYPE_CHECKING:
     from ..sql.schema import Column
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import SchemaItem
+    from ..sql.selectable import Select
     from ..sql.schema import Sequence as Sequence_SchemaItem
     from ..sql.sqltypes import Integer
     from ..sql.type_api import _TypeMemoDict
@@ -2014,6 +2015,37 @@ class Dialect(EventTarget):
         usable."""
         raise NotImplementedError()
 
+    def get_replica_lag(self, connection: Connection) -> Optional[float]:
+        """Return the number of seconds by which the database that the given
+        connection is connected to lags behind its replication source.
+
+        ``None`` is returned if the database is not a replica, or if the
+        dialect does not support measuring replication lag.  A value of
+        ``float("inf")`` indicates that replication is configured but not
+        running.
+
+        This is used by :class:`.ReplicaRouter` to avoid routing reads to
+        replicas which are too far behind the primary.
+
+        """
+        raise NotImplementedError()
+
+    def estimate_row_count(
+        self, connection: Connection, statement: Select[Any]
+    ) -> Optional[int]:
+        """Return the database's estimate of the number of rows the given
+        SELECT statement would return, without running it.
+
+        The estimate is taken from the optimizer's statistics, such as those
+        used to produce a query plan, and may be far from the actual count;
+        it's intended for uses such as displaying an approximate total where
+        an exact ``COUNT(*)`` would be too slow.  ``None`` is returned if the
+        dialect does not support estimating row counts, or if no estimate
+        could be made for the statement, such as for a compound select.
+
+        """
+        raise NotImplementedError()
+
     def do_set_input_sizes(
         self,
         cursor: DBAPICursor,
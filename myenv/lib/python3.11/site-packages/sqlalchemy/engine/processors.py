@@ -20,16 +20,26 @@ from ._py_processors import str_to_datetime_processor_factory  # noqa
 from ..util._has_cy import HAS_CYEXTENSION
 
 if typing.TYPE_CHECKING or not HAS_CYEXTENSION:
+    from ._py_processors import (
+        bitmask_to_set_processor_factory as bitmask_to_set_processor_factory,
+    )
+    from ._py_processors import bytes_to_int as bytes_to_int
     from ._py_processors import int_to_boolean as int_to_boolean
+    from ._py_processors import (
+        json_processor_factory as json_processor_factory,
+    )
     from ._py_processors import str_to_date as str_to_date
     from ._py_processors import str_to_datetime as str_to_datetime
+    from ._py_processors import str_to_set as str_to_set
     from ._py_processors import str_to_time as str_to_time
+    from ._py_processors import timedelta_to_time as timedelta_to_time
     from ._py_processors import (
         to_decimal_processor_factory as to_decimal_processor_factory,
     )
     from ._py_processors import to_float as to_float
     from ._py_processors import to_str as to_str
 else:
+    from sqlalchemy.cyextension import processors as _cy_processors
     from sqlalchemy.cyextension.processors import (
         DecimalResultProcessor,
     )
@@ -51,6 +61,7 @@ else:
     from sqlalchemy.cyextension.processors import (  # noqa: F401,E501
         to_str as to_str,
     )
+    from . import _py_processors
 
     def to_decimal_processor_factory(target_class, scale):
         # Note that the scale argument is not taken into account for integer
@@ -59,3 +70,34 @@ else:
         # Decimal('5.00000') whereas the C implementation will
         # return Decimal('5'). These are equivalent of course.
         return DecimalResultProcessor(target_class, "%%.%df" % scale).process
+
+    # a compiled extension built from an older processors.pyx doesn't
+    # provide the MySQL processors; use the Python version of each one
+    # that's missing
+    bytes_to_int = getattr(
+        _cy_processors, "bytes_to_int", _py_processors.bytes_to_int
+    )
+    str_to_set = getattr(
+        _cy_processors, "str_to_set", _py_processors.str_to_set
+    )
+    timedelta_to_time = getattr(
+        _cy_processors, "timedelta_to_time", _py_processors.timedelta_to_time
+    )
+
+    if hasattr(_cy_processors, "BitmaskSetResultProcessor"):
+
+        def bitmask_to_set_processor_factory(bitmap):
+            return _cy_processors.BitmaskSetResultProcessor(bitmap).process
+
+    else:
+        bitmask_to_set_processor_factory = (
+            _py_processors.bitmask_to_set_processor_factory
+        )
+
+    if hasattr(_cy_processors, "JSONResultProcessor"):
+
+        def json_processor_factory(deserializer):
+            return _cy_processors.JSONResultProcessor(deserializer).process
+
+    else:
+        json_processor_factory = _py_processors.json_processor_factory
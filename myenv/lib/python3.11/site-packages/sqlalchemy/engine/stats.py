@@ -0,0 +1,158 @@
+# engine/stats.py
+# Copyright (C) 2005-2024 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""Runtime statistics collected by an :class:`_engine.Engine`."""
+
+from __future__ import annotations
+
+import typing
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from .interfaces import CacheStats
+from ..pool import PoolStats
+from ..pool import QueuePool
+
+if typing.TYPE_CHECKING:
+    from .base import Engine
+
+
+class EngineStats:
+    """Counters describing the compiled cache and connection pool activity
+    of an :class:`_engine.Engine`.
+
+    Available as :attr:`_engine.Engine.stats` when the engine is created
+    with :paramref:`_sa.create_engine.collect_stats` set to True.
+
+    Counters are plain integers and floats that are incremented without
+    locking, so that collecting them adds very little overhead; values
+    read while other threads are executing statements are approximate.
+
+    """
+
+    __slots__ = (
+        "_engine",
+        "compiled_cache_hits",
+        "compiled_cache_misses",
+        "compiled_cache_evictions",
+        "uncached_compilations",
+        "compile_time",
+        "pool",
+    )
+
+    compiled_cache_hits: int
+    """Number of statement executions whose compiled form was found in
+    the compiled cache."""
+
+    compiled_cache_misses: int
+    """Number of statement executions which compiled a statement and
+    placed it in the compiled cache."""
+
+    compiled_cache_evictions: int
+    """Number of compiled statements removed from the compiled cache as
+    it was pruned to :paramref:`_sa.create_engine.query_cache_size`.
+
+    Evictions are counted when the engine's own cache prunes itself, so
+    they don't include entries dropped from a dictionary passed using the
+    :paramref:`.Connection.execution_options.compiled_cache` execution
+    option, whose hits and misses are otherwise counted along with those
+    of the engine's cache.  :meth:`.snapshot` reports None for evictions
+    when the engine has no cache of its own, as with a
+    :paramref:`_sa.create_engine.query_cache_size` of zero.
+
+    """
+
+    uncached_compilations: int
+    """Number of statement executions which compiled a statement that
+    could not be cached, or with caching disabled."""
+
+    compile_time: float
+    """Total number of seconds spent generating cache keys and compiling
+    statements for executions which did not hit the cache."""
+
+    pool: PoolStats
+    """Statistics for the engine's connection pool."""
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self.pool = PoolStats()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero, including those of :attr:`.pool`."""
+
+        self.compiled_cache_hits = 0
+        self.compiled_cache_misses = 0
+        self.compiled_cache_evictions = 0
+        self.uncached_compilations = 0
+        self.compile_time = 0.0
+        self.pool.reset()
+
+    def _record_compile(self, cache_hit: CacheStats, elapsed: float) -> None:
+        if cache_hit is CacheStats.CACHE_HIT:
+            self.compiled_cache_hits += 1
+            return
+        elif cache_hit is CacheStats.CACHE_MISS:
+            self.compiled_cache_misses += 1
+        else:
+            self.uncached_compilations += 1
+        self.compile_time += elapsed
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values of all counters as a dictionary.
+
+        The dictionary includes the dialect name, the size of the compiled
+        cache, and, for a :class:`.QueuePool`, the current number of
+        connections in the pool, checked out, and in overflow, alongside
+        the counters of :attr:`.pool` under the ``"pool"`` key.
+
+        """
+        engine = self._engine
+        dialect = engine.dialect
+        cache = engine._compiled_cache
+
+        pool_data = self.pool.snapshot()
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            pool_data.update(
+                size=pool.size(),
+                checkedin=pool.checkedin(),
+                checkedout=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+
+        return {
+            "dialect": "%s+%s" % (dialect.name, dialect.driver),
+            "compiled_cache_size": len(cache) if cache is not None else 0,
+            "compiled_cache_hits": self.compiled_cache_hits,
+            "compiled_cache_misses": self.compiled_cache_misses,
+            "compiled_cache_evictions": (
+                self.compiled_cache_evictions if cache is not None else None
+            ),
+            "uncached_compilations": self.uncached_compilations,
+            "compile_time": self.compile_time,
+            "pool": pool_data,
+        }
+
+    def export(
+        self, callback: Callable[[Dict[str, Any]], Any], reset: bool = False
+    ) -> None:
+        """Pass a :meth:`.snapshot` of the counters to the given callable,
+        such as a function that forwards them to a metrics system.
+
+        :param callback: callable receiving the snapshot dictionary.
+
+        :param reset: if True, counters are reset after the snapshot is
+         taken, so that each export reports the activity since the
+         previous one.
+
+        """
+        data = self.snapshot()
+        if reset:
+            self.reset()
+        callback(data)
@@ -137,6 +137,7 @@ from .state import InstanceState as InstanceState
 from .strategy_options import contains_eager as contains_eager
 from .strategy_options import defaultload as defaultload
 from .strategy_options import defer as defer
+from .strategy_options import batchload as batchload
 from .strategy_options import immediateload as immediateload
 from .strategy_options import joinedload as joinedload
 from .strategy_options import lazyload as lazyload
@@ -156,6 +157,7 @@ from .util import CascadeOptions as CascadeOptions
 from .util import LoaderCriteriaOption as LoaderCriteriaOption
 from .util import object_mapper as object_mapper
 from .util import polymorphic_union as polymorphic_union
+from .util import ReadOnlySnapshot as ReadOnlySnapshot
 from .util import was_deleted as was_deleted
 from .util import with_parent as with_parent
 from .writeonly import WriteOnlyCollection as WriteOnlyCollection
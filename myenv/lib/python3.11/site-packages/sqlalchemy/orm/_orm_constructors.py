@@ -1344,6 +1344,13 @@ def relationship(
         first accessed, using a separate SELECT statement, or identity map
         fetch for simple many-to-one references.
 
+      * ``batch`` - items should be loaded lazily when the property is
+        first accessed, as with ``select``; the items of all the instances
+        loaded by the same statement which haven't loaded the property yet
+        are loaded at the same time, using an IN clause.  Relationships
+        which join on more than one column are loaded one instance at a
+        time.
+
       * ``immediate`` - items should be loaded as the parents are loaded,
         using a separate SELECT statement, or identity map fetch for
         simple many-to-one references.
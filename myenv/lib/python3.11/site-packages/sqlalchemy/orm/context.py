@@ -144,6 +144,7 @@ class QueryContext:
         _legacy_uniquing = False
         _sa_top_level_orm_context = None
         _is_user_refresh = False
+        _readonly_entities = False
 
     def __init__(
         self,
@@ -495,6 +496,7 @@ class ORMCompileState(AbstractORMCompileState):
                 "yield_per",
                 "identity_token",
                 "sa_top_level_orm_context",
+                "readonly_entities",
             },
             execution_options,
             statement._execution_options,
@@ -67,6 +67,7 @@ if TYPE_CHECKING:
     from ..orm.decl_api import DeclarativeAttributeIntercept
     from ..orm.decl_api import DeclarativeMeta
     from ..orm.mapper import Mapper
+    from ..orm.relationships import RelationshipProperty
     from ..orm.state import InstanceState
 
 _KT = TypeVar("_KT", bound=Any)
@@ -1754,6 +1755,47 @@ class SessionEvents(event.Events[Session]):
 
         """
 
+    def n_plus_one_detected(
+        self,
+        session: Session,
+        instance: _O,
+        relationship: RelationshipProperty[Any],
+    ) -> None:
+        """Event invoked when a relationship is lazy loaded with a separate
+        SELECT statement for a second instance among those loaded by the
+        same statement, which is the pattern known as the "N+1" problem.
+
+        Detection takes place only for statements executed with the
+        ``detect_n_plus_one`` execution option, which may be set for all
+        ORM statements of a :class:`.Session` using the
+        :meth:`_orm.SessionEvents.do_orm_execute` event::
+
+            @event.listens_for(Session, "do_orm_execute")
+            def _detect(orm_execute_state):
+                if orm_execute_state.is_select:
+                    orm_execute_state.update_execution_options(
+                        detect_n_plus_one=True
+                    )
+
+        The option applies to the lazy loads of the instances loaded as
+        well.  A warning is emitted alongside the event.  The
+        ``batch_lazyload`` execution option, applied in the same way,
+        instead loads lazily loaded relationships as described for the
+        :func:`_orm.batchload` option.
+
+        The event is invoked at most once for each relationship loaded
+        by a statement.
+
+        :param session: target :class:`.Session`
+
+        :param instance: the ORM-mapped instance whose attribute is being
+         lazy loaded.
+
+        :param relationship: the :class:`.RelationshipProperty` being
+         loaded.
+
+        """
+
     def after_transaction_create(
         self, session: Session, transaction: SessionTransaction
     ) -> None:
@@ -1995,7 +2037,16 @@ class SessionEvents(event.Events[Session]):
 
         :param session: The target :class:`.Session`.
         :param flush_context: Internal :class:`.UOWTransaction` object
-         which handles the details of the flush.
+         which handles the details of the flush.  Its ``fast_insert``
+         attribute is True when the flush consisted only of pending
+         objects of a single mapper with a single table, whose only
+         relationships to be processed were many-to-one relationships
+         set to None or to persistent objects, which were inserted
+         directly, bypassing the dependency sorting of the unit of work.
+         A flush which includes updates or deletes of any objects, other
+         than collections of persistent objects the pending objects were
+         added to by a backref, always goes through the unit of work, so
+         that ``fast_insert`` is False.
 
         .. seealso::
 
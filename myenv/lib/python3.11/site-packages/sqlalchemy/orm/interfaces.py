@@ -96,6 +96,7 @@ if typing.TYPE_CHECKING:
     from .util import AliasedInsp
     from .util import ORMAdapter
     from ..engine.result import Result
+    from ..engine.result import Row
     from ..sql._typing import _ColumnExpressionArgument
     from ..sql._typing import _ColumnsClauseArgument
     from ..sql._typing import _DMLColumnArgument
@@ -500,6 +501,25 @@ class MapperProperty(
 
         """
 
+    def _create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+    ) -> Optional[Callable[[Row[Any]], Any]]:
+        """Produce a row processing function which returns the value of
+        this attribute for a :class:`.ReadOnlySnapshot`, or None if the
+        attribute isn't loaded for snapshots.
+
+        Column-based attributes are populated directly by the loading
+        process and don't make use of this method.
+
+        """
+        return None
+
     def cascade_iterator(
         self,
         type_: str,
@@ -1080,6 +1100,24 @@ class StrategizedProperty(MapperProperty[_T]):
             populators,
         )
 
+    def _create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+    ) -> Optional[Callable[[Row[Any]], Any]]:
+        loader = self._get_context_loader(context, path)
+        if loader and loader.strategy:
+            strat = self._get_strategy(loader.strategy)
+        else:
+            strat = self.strategy
+        return strat._create_readonly_row_processor(
+            context, query_entity, path, loader, mapper, result, adapter
+        )
+
     def do_init(self) -> None:
         self._strategies = {}
         self.strategy = self._get_strategy(self.strategy_key)
@@ -1465,5 +1503,22 @@ class LoaderStrategy:
 
         """
 
+    def _create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        loadopt: Optional[_LoadElement],
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+    ) -> Optional[Callable[[Row[Any]], Any]]:
+        """Produce a row processing function for a
+        :class:`.ReadOnlySnapshot`, as described at
+        :meth:`.MapperProperty._create_readonly_row_processor`.
+
+        """
+        return None
+
     def __str__(self) -> str:
         return str(self.parent_property)
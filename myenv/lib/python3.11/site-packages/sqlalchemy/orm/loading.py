@@ -951,6 +951,19 @@ def _instance_processor(
 
         path.set(compile_state.attributes, getter_key, getters)
 
+    if context.load_options._readonly_entities and refresh_state is None:
+        return _readonly_instance_processor(
+            query_entity,
+            mapper,
+            context,
+            result,
+            path,
+            adapter,
+            getters,
+            polymorphic_discriminator,
+            _polymorphic_from,
+        )
+
     cached_populators = getters["cached_populators"]
 
     populators = {key: list(value) for key, value in cached_populators.items()}
@@ -1253,6 +1266,177 @@ def _instance_processor(
     return _instance
 
 
+class _ReadOnlyCollections:
+    """Set the collections loaded by :func:`._readonly_instance_processor`
+    on their snapshots as tuples.
+
+    It's stored in ``context.post_load_paths`` along with
+    :class:`.PostLoad` objects, so that :meth:`.invoke` is called once the
+    rows of each chunk of the result are processed.
+
+    """
+
+    __slots__ = ("collected", "changed")
+
+    def __init__(self):
+        # (identity key, relationship key) ->
+        # (ids of items, items, snapshot, slot setter)
+        self.collected = {}
+        self.changed = set()
+
+    def invoke(self, context, path):
+        collected = self.collected
+        for collection_key in self.changed:
+            _, items, snapshot, set_ = collected[collection_key]
+            set_(snapshot, tuple(items))
+        self.changed.clear()
+
+
+def _readonly_instance_processor(
+    query_entity,
+    mapper,
+    context,
+    result,
+    path,
+    adapter,
+    getters,
+    polymorphic_discriminator,
+    _polymorphic_from,
+):
+    """Produce a mapper level row processor callable
+    which processes rows into :class:`.ReadOnlySnapshot` objects.
+
+    No instance state is created and the session's identity map is
+    not consulted; only column attributes present in the row and
+    relationships which are joined eager loaded are populated.
+
+    """
+
+    snapshot_cls = mapper._readonly_snapshot_class
+    new_snapshot = object.__new__
+
+    # the slot descriptors are used to populate the snapshot, as the
+    # snapshot's own __setattr__ disallows assignment
+    populators = [
+        (getattr(snapshot_cls, key).__set__, getter)
+        for key, getter in getters["cached_populators"]["quick"]
+    ]
+
+    eager = []
+    for prop in getters["todo"]:
+        eager_instance = prop._create_readonly_row_processor(
+            context, query_entity, path, mapper, result, adapter
+        )
+        if eager_instance is not None:
+            eager.append(
+                (
+                    prop.key,
+                    getattr(snapshot_cls, prop.key).__set__,
+                    prop.uselist,
+                    eager_instance,
+                )
+            )
+
+    primary_key_getter = getters["primary_key_getter"]
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    if not eager and len(path.path) == 1:
+
+        def _instance(row):
+            if is_not_primary_key(primary_key_getter(row)):
+                return None
+
+            snapshot = new_snapshot(snapshot_cls)
+            for set_, getter in populators:
+                set_(snapshot, getter(row))
+            return snapshot
+
+    else:
+        # rows which are repeated by joined eager loading refer to the
+        # same snapshot, and add to its collections; those are set on the
+        # snapshots as tuples once the rows of the chunk are processed
+        snapshots = {}
+        collections = _ReadOnlyCollections()
+        context.post_load_paths[(path.path, mapper)] = collections
+        collected = collections.collected
+        changed = collections.changed
+
+        def _instance(row):
+            identitykey = primary_key_getter(row)
+            snapshot = snapshots.get(identitykey)
+
+            if snapshot is None:
+                if is_not_primary_key(identitykey):
+                    return None
+
+                snapshot = new_snapshot(snapshot_cls)
+                for set_, getter in populators:
+                    set_(snapshot, getter(row))
+
+                for key, set_, uselist, eager_instance in eager:
+                    inst = eager_instance(row)
+                    if not uselist:
+                        set_(snapshot, inst)
+                    elif inst is None:
+                        set_(snapshot, ())
+                    else:
+                        collected[(identitykey, key)] = (
+                            {id(inst)},
+                            [inst],
+                            snapshot,
+                            set_,
+                        )
+                        changed.add((identitykey, key))
+
+                snapshots[identitykey] = snapshot
+            else:
+                for key, set_, uselist, eager_instance in eager:
+                    inst = eager_instance(row)
+                    if uselist and inst is not None:
+                        entry = collected.get((identitykey, key))
+                        if entry is None:
+                            entry = collected[(identitykey, key)] = (
+                                set(),
+                                [],
+                                snapshot,
+                                set_,
+                            )
+                        seen, items = entry[0:2]
+                        if id(inst) not in seen:
+                            seen.add(id(inst))
+                            items.append(inst)
+                            changed.add((identitykey, key))
+
+            return snapshot
+
+    if mapper.polymorphic_map and not _polymorphic_from:
+
+        def ensure_no_pk(row):
+            identitykey = primary_key_getter(row)
+            if not is_not_primary_key(identitykey):
+                return identitykey
+            else:
+                return None
+
+        _instance = _decorate_polymorphic_switch(
+            _instance,
+            context,
+            query_entity,
+            mapper,
+            result,
+            path,
+            polymorphic_discriminator,
+            adapter,
+            ensure_no_pk,
+        )
+
+    return _instance
+
+
 def _load_subclass_via_in(
     context, path, entity, polymorphic_from, option_entities
 ):
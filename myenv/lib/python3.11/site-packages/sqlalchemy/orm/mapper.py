@@ -54,6 +54,7 @@ from ._typing import _O
 from .base import _class_to_mapper
 from .base import _parse_mapper_argument
 from .base import _state_mapper
+from .base import MANYTOONE
 from .base import PassiveFlag
 from .base import state_str
 from .interfaces import _MappedAttribute
@@ -2593,6 +2594,76 @@ class Mapper(
 
         return from_obj
 
+    @HasMemoized.memoized_attribute
+    def _fast_insert_ok(self) -> bool:
+        """True if a flush consisting only of pending objects of this
+        mapper may use persistence.fast_insert_obj(), provided that
+        none of the attributes in _fast_insert_relationship_keys are
+        set on the pending objects and those in
+        _fast_insert_relationships are set only to None or persistent
+        objects."""
+
+        return (
+            self.batch
+            and not self.non_primary
+            and self.inherits is None
+            and len(self._sorted_tables) == 1
+            and self.polymorphic_on is None
+            and self.version_id_col is None
+            and not self._delete_orphans
+            and all(
+                prop.viewonly or prop.direction is MANYTOONE
+                for prop in self.relationships
+            )
+        )
+
+    @HasMemoized.memoized_attribute
+    def _fast_insert_relationship_keys(self) -> Tuple[str, ...]:
+        """Keys of the many-to-one relationships which rule out
+        persistence.fast_insert_obj() for a flush when set on a pending
+        object, which are those using post_update.   Unless set, the
+        foreign key is an ordinary column attribute and the relationship
+        has nothing to process."""
+
+        return tuple(
+            prop.key
+            for prop in self.relationships
+            if not prop.viewonly and prop.post_update
+        )
+
+    @HasMemoized.memoized_attribute
+    def _fast_insert_relationships(
+        self,
+    ) -> Tuple[Tuple[RelationshipProperty[Any], bool], ...]:
+        """The many-to-one relationships whose foreign key
+        persistence.fast_insert_obj() copies from the related object, each
+        with whether None would blank out a primary key column, which is
+        left to the unit of work to reject."""
+
+        return tuple(
+            (prop, any(r.primary_key for l, r in prop.synchronize_pairs))
+            for prop in self.relationships
+            if not prop.viewonly and not prop.post_update
+        )
+
+    @HasMemoized.memoized_attribute
+    def _fast_insert_backrefs(self) -> FrozenSet[RelationshipProperty[Any]]:
+        """The collections of other mappers which are the reverse of
+        _fast_insert_relationships.   Persistent objects changed only by
+        pending objects being added to these don't rule out
+        persistence.fast_insert_obj()."""
+
+        return frozenset(
+            rp
+            for prop, _ in self._fast_insert_relationships
+            for rp in prop._reverse_property
+            if rp.uselist and not rp.viewonly
+        )
+
+    @HasMemoized.memoized_attribute
+    def _readonly_snapshot_class(self) -> Type[orm_util.ReadOnlySnapshot]:
+        return orm_util.ReadOnlySnapshot._for_mapper(self)
+
     @HasMemoized.memoized_attribute
     def _version_id_has_server_side_value(self) -> bool:
         vid_col = self.version_id_col
@@ -120,6 +120,216 @@ def save_obj(base_mapper, states, uowtransaction, single=False):
     )
 
 
+def _fast_insert_mapper(session, states, dirty):
+    """Return the mapper of the given pending states if they may be
+    flushed using fast_insert_obj(), else None.
+
+    The dirty states may only be persistent objects to whose collections
+    some of the pending states were added by a backref.
+
+    """
+
+    if session.connection_callable:
+        return None
+
+    mapper = None
+    for state in states:
+        if mapper is None:
+            mapper = state.manager.mapper
+        elif state.manager.mapper is not mapper:
+            return None
+
+    if mapper is None or not mapper._fast_insert_ok:
+        return None
+
+    keys = mapper._fast_insert_relationship_keys
+    if keys:
+        for state in states:
+            dict_ = state.dict
+            for key in keys:
+                if key in dict_:
+                    return None
+
+    # many-to-one relationships set to an object of this session which
+    # has its key already; a pending one has to be inserted first
+    identity_map = session.identity_map
+    for prop, clears_pk in mapper._fast_insert_relationships:
+        key = prop.key
+        for state in states:
+            dict_ = state.dict
+            if key not in dict_:
+                continue
+            value = dict_[key]
+            if value is None:
+                if clears_pk:
+                    return None
+                continue
+            related = attributes.instance_state(value)
+            if (
+                related.key is None
+                or not identity_map.contains_state(related)
+                or not prop.mapper._canload(
+                    related, allow_subtypes=not prop.enable_typechecks
+                )
+            ):
+                return None
+
+    if dirty:
+        backrefs = mapper._fast_insert_backrefs
+        if not backrefs:
+            return None
+        for state in dirty:
+            props = state.manager.mapper._props
+            for key in state.committed_state:
+                if props.get(key) not in backrefs:
+                    return None
+                history = state.manager[key].impl.get_history(
+                    state, state.dict, attributes.PASSIVE_NO_INITIALIZE
+                )
+                if history.deleted or not all(
+                    attributes.instance_state(obj) in states
+                    for obj in history.added
+                ):
+                    return None
+    return mapper
+
+
+def fast_insert_obj(mapper, states, uowtransaction):
+    """Issue ``INSERT`` statements for a list of pending objects of a
+    single mapper.
+
+    This is called by Session.flush() in place of the full unit of work
+    when the flush consists only of pending objects of one mapper which
+    has a single table and no relationships that need dependency
+    processing other than many-to-one relationships set to None or to
+    persistent objects.  The foreign keys of these are copied from the
+    related objects as the unit of work does, after which parameters are
+    collected one column at a time across all objects, the statements
+    are emitted and the objects finalized as in save_obj().
+
+    """
+
+    ((table, _),) = mapper._sorted_tables.items()
+
+    connection = uowtransaction.transaction.connection(mapper)
+    states = sorted(states, key=operator.attrgetter("insert_order"))
+
+    # as ManyToOneDP.process_saves() with sync.populate() and sync.clear(),
+    # one foreign key column at a time
+    for prop, _ in mapper._fast_insert_relationships:
+        key = prop.key
+        related = [
+            (state, state.dict[key]) for state in states if key in state.dict
+        ]
+        if not related:
+            continue
+        related_mapper = prop.mapper
+        for l, r in prop.synchronize_pairs:
+            for state, value in related:
+                if value is not None:
+                    value_state = attributes.instance_state(value)
+                    value = related_mapper._get_state_attr_by_column(
+                        value_state,
+                        value_state.dict,
+                        l,
+                        passive=attributes.PASSIVE_OFF,
+                    )
+                mapper._set_state_attr_by_column(state, state.dict, r, value)
+
+    if mapper.dispatch.before_insert:
+        for state in states:
+            mapper.dispatch.before_insert(mapper, connection, state)
+
+    dicts = [state.dict for state in states]
+
+    # detect pending instances which conflict with a persistent instance,
+    # as in _organize_states_for_save(); without deletes in the flush,
+    # these can't be a "row switch"
+    identity_map = uowtransaction.session.identity_map
+    if identity_map:
+        pk_keys = mapper._pk_attr_keys_by_table[table]
+        for state, dict_ in zip(states, dicts):
+            if not pk_keys.issubset(dict_):
+                continue
+            instance_key = mapper._identity_key_from_state(state)
+            if instance_key in identity_map:
+                existing = attributes.instance_state(
+                    identity_map[instance_key]
+                )
+                if not uowtransaction.was_already_deleted(existing):
+                    util.warn(
+                        "New instance %s with identity key %s conflicts "
+                        "with persistent instance %s"
+                        % (state_str(state), instance_key, state_str(existing))
+                    )
+
+    params = [{} for dict_ in dicts]
+    value_params = {}
+
+    eval_none = mapper._insert_cols_evaluating_none[table]
+    for propkey, col in mapper._propkey_to_col[table].items():
+        colkey = col.key
+        evaluates_none = col in eval_none
+        for idx, dict_ in enumerate(dicts):
+            if propkey not in dict_:
+                continue
+            value = dict_[propkey]
+            if value is None:
+                if evaluates_none:
+                    params[idx][colkey] = value
+            elif hasattr(value, "__clause_element__") or isinstance(
+                value, sql.ClauseElement
+            ):
+                value_params.setdefault(idx, {})[col] = (
+                    value.__clause_element__()
+                    if hasattr(value, "__clause_element__")
+                    else value
+                )
+            else:
+                params[idx][colkey] = value
+
+    # explicit None for columns without a default, as in
+    # _collect_insert_commands()
+    for colkey in mapper._insert_cols_as_none[table]:
+        for idx, row in enumerate(params):
+            if colkey not in row and (
+                idx not in value_params
+                or colkey not in {c.key for c in value_params[idx]}
+            ):
+                row[colkey] = None
+
+    pk_keys = mapper._pk_keys_by_table[table]
+    if mapper.base_mapper._prefer_eager_defaults(connection.dialect, table):
+        server_default_keys = mapper._server_default_col_keys[table]
+    else:
+        server_default_keys = None
+
+    insert = [
+        (
+            state,
+            dict_,
+            row,
+            mapper,
+            connection,
+            value_params.get(idx, util.EMPTY_DICT),
+            pk_keys.issubset(row),
+            server_default_keys is None or server_default_keys.issubset(row),
+        )
+        for idx, (state, dict_, row) in enumerate(zip(states, dicts, params))
+    ]
+
+    _emit_insert_statements(mapper, uowtransaction, mapper, table, insert)
+
+    _finalize_insert_update_commands(
+        mapper,
+        uowtransaction,
+        (
+            (state, dict_, mapper, connection, False)
+            for state, dict_ in zip(states, dicts)
+        ),
+    )
+
+
 def post_update(base_mapper, states, uowtransaction, post_update_cols):
     """Issue UPDATE statements on behalf of a relationship() which
     specifies post_update.
@@ -1734,6 +1734,10 @@ class Query(
         ``yield_per=<value>`` - equivalent to using
         :meth:`_orm.Query.yield_per`
 
+        ``readonly_entities=True`` - entities are returned as
+        :class:`_orm.ReadOnlySnapshot` objects rather than as mapped
+        instances tracked by the :class:`_orm.Session`
+
         Note that the ``stream_results`` execution option is enabled
         automatically if the :meth:`~sqlalchemy.orm.query.Query.yield_per()`
         method or execution option is used.
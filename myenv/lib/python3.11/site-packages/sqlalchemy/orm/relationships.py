@@ -154,6 +154,7 @@ _LazyLoadArgumentType = Literal[
     "subquery",
     "raise",
     "raise_on_sql",
+    "batch",
     "noload",
     "immediate",
     "write_only",
@@ -41,6 +41,7 @@ from . import descriptor_props
 from . import exc
 from . import identity
 from . import loading
+from . import persistence
 from . import query
 from . import state as statelib
 from ._typing import _O
@@ -4401,57 +4402,79 @@ class Session(_SessionClassMethods, EventTarget):
         else:
             objset = None
 
-        # store objects whose fate has been decided
-        processed = set()
+        # a flush of only pending objects of a single mapper without
+        # dependencies can skip the unit of work
+        if objset is None and not deleted:
+            fast_insert_mapper = persistence._fast_insert_mapper(
+                self, new, dirty
+            )
+        else:
+            fast_insert_mapper = None
 
-        # put all saves/updates into the flush context.  detect top-level
-        # orphans and throw them into deleted.
-        if objset:
-            proc = new.union(dirty).intersection(objset).difference(deleted)
+        if fast_insert_mapper is not None:
+            flush_context.fast_insert = True
         else:
-            proc = new.union(dirty).difference(deleted)
+            # store objects whose fate has been decided
+            processed = set()
+
+            # put all saves/updates into the flush context.  detect top-level
+            # orphans and throw them into deleted.
+            if objset:
+                proc = (
+                    new.union(dirty).intersection(objset).difference(deleted)
+                )
+            else:
+                proc = new.union(dirty).difference(deleted)
 
-        for state in proc:
-            is_orphan = _state_mapper(state)._is_orphan(state)
+            for state in proc:
+                is_orphan = _state_mapper(state)._is_orphan(state)
 
-            is_persistent_orphan = is_orphan and state.has_identity
+                is_persistent_orphan = is_orphan and state.has_identity
 
-            if (
-                is_orphan
-                and not is_persistent_orphan
-                and state._orphaned_outside_of_session
-            ):
-                self._expunge_states([state])
+                if (
+                    is_orphan
+                    and not is_persistent_orphan
+                    and state._orphaned_outside_of_session
+                ):
+                    self._expunge_states([state])
+                else:
+                    _reg = flush_context.register_object(
+                        state, isdelete=is_persistent_orphan
+                    )
+                    assert _reg, "Failed to add object to the flush context!"
+                    processed.add(state)
+
+            # put all remaining deletes into the flush context.
+            if objset:
+                proc = deleted.intersection(objset).difference(processed)
             else:
-                _reg = flush_context.register_object(
-                    state, isdelete=is_persistent_orphan
-                )
+                proc = deleted.difference(processed)
+            for state in proc:
+                _reg = flush_context.register_object(state, isdelete=True)
                 assert _reg, "Failed to add object to the flush context!"
-                processed.add(state)
 
-        # put all remaining deletes into the flush context.
-        if objset:
-            proc = deleted.intersection(objset).difference(processed)
-        else:
-            proc = deleted.difference(processed)
-        for state in proc:
-            _reg = flush_context.register_object(state, isdelete=True)
-            assert _reg, "Failed to add object to the flush context!"
-
-        if not flush_context.has_work:
-            return
+            if not flush_context.has_work:
+                return
 
         flush_context.transaction = transaction = self._autobegin_t()._begin()
         try:
             self._warn_on_events = True
             try:
-                flush_context.execute()
+                if fast_insert_mapper is not None:
+                    persistence.fast_insert_obj(
+                        fast_insert_mapper, new, flush_context
+                    )
+                else:
+                    flush_context.execute()
             finally:
                 self._warn_on_events = False
 
             self.dispatch.after_flush(self, flush_context)
 
-            flush_context.finalize_flush_changes()
+            if fast_insert_mapper is not None:
+                self._register_persistent(new.union(dirty))
+            else:
+                flush_context.finalize_flush_changes()
 
             if not objects and self.identity_map._modified:
                 len_ = len(self.identity_map._modified)
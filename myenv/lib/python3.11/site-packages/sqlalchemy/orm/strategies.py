@@ -53,8 +53,12 @@ from .. import inspect
 from .. import log
 from .. import sql
 from .. import util
+from ..sql import operators
 from ..sql import util as sql_util
 from ..sql import visitors
+from ..sql.elements import BinaryExpression
+from ..sql.elements import BindParameter
+from ..sql.elements import BooleanClauseList
 from ..sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from ..sql.selectable import Select
 
@@ -670,6 +674,7 @@ class NoLoader(AbstractRelationshipLoader):
 @relationships.RelationshipProperty.strategy_for(lazy="raise")
 @relationships.RelationshipProperty.strategy_for(lazy="raise_on_sql")
 @relationships.RelationshipProperty.strategy_for(lazy="baked_select")
+@relationships.RelationshipProperty.strategy_for(lazy="batch")
 class LazyLoader(
     AbstractRelationshipLoader, util.MemoizedSlots, log.Identified
 ):
@@ -692,8 +697,12 @@ class LazyLoader(
         "_simple_lazy_clause",
         "_raise_always",
         "_raise_on_sql",
+        "_batch",
+        "_batch_clause",
     )
 
+    _batch_chunksize = 500
+
     _lazywhere: ColumnElement[bool]
     _bind_to_col: Dict[str, ColumnElement[Any]]
     _rev_lazywhere: ColumnElement[bool]
@@ -707,6 +716,7 @@ class LazyLoader(
         super().__init__(parent, strategy_key)
         self._raise_always = self.strategy_opts["lazy"] == "raise"
         self._raise_on_sql = self.strategy_opts["lazy"] == "raise_on_sql"
+        self._batch = self.strategy_opts["lazy"] == "batch"
 
         self.is_aliased_class = inspect(self.entity).is_aliased_class
 
@@ -795,6 +805,68 @@ class LazyLoader(
             _deferred_history=_deferred_history,
         )
 
+    def _memoized_attr__batch_clause(self):
+        # a lazy clause which compares a single column of the related
+        # table to a single value from the parent can load the related
+        # items of many parents at once using IN; returns the related
+        # column, the parent column, and any remaining criteria, or None
+        # for clauses such as those of composite keys which are always
+        # loaded per parent
+        lazywhere = self._lazywhere
+        if (
+            isinstance(lazywhere, BooleanClauseList)
+            and lazywhere.operator is operators.and_
+        ):
+            clauses = lazywhere.clauses
+        else:
+            clauses = [lazywhere]
+
+        batch_col = parent_col = None
+        criteria = []
+        for clause in clauses:
+            if (
+                isinstance(clause, BinaryExpression)
+                and clause.operator is operators.eq
+            ):
+                for bind, col in (
+                    (clause.left, clause.right),
+                    (clause.right, clause.left),
+                ):
+                    if (
+                        isinstance(bind, BindParameter)
+                        and bind.key in self._bind_to_col
+                    ):
+                        if batch_col is not None or isinstance(
+                            col, BindParameter
+                        ):
+                            return None
+                        batch_col = col
+                        parent_col = self._bind_to_col[bind.key]
+                        break
+                else:
+                    criteria.append(clause)
+                continue
+
+            if any(
+                isinstance(elem, BindParameter)
+                and elem.key in self._bind_to_col
+                for elem in visitors.iterate(clause)
+            ):
+                return None
+            criteria.append(clause)
+
+        if batch_col is None:
+            return None
+
+        return (
+            sql_util._deep_annotate(batch_col, {"_orm_adapt": True}),
+            parent_col,
+            [
+                sql_util._deep_annotate(crit, {"_orm_adapt": True})
+                for crit in criteria
+            ],
+        )
+
     def _memoized_attr__simple_lazy_clause(self):
         lazywhere = sql_util._deep_annotate(
             self._lazywhere, {"_orm_adapt": True}
@@ -873,6 +945,7 @@ class LazyLoader(
         extra_options=(),
         alternate_effective_path=None,
         execution_options=util.EMPTY_DICT,
+        lazyload_group=None,
     ):
         if not state.key and (
             (
@@ -974,6 +1047,7 @@ class LazyLoader(
             extra_options,
             alternate_effective_path,
             execution_options,
+            lazyload_group,
         )
 
     def _get_ident_for_use_get(self, session, state, passive):
@@ -1003,6 +1077,7 @@ class LazyLoader(
         extra_options,
         alternate_effective_path,
         execution_options,
+        lazyload_group=None,
     ):
         strategy_options = util.preloaded.orm_strategy_options
 
@@ -1061,10 +1136,34 @@ class LazyLoader(
 
         stmt._compile_options += {"_current_path": effective_path}
 
+        if (
+            lazyload_group is not None
+            and lazyload_group.batch
+            and not pending
+            and not passive
+            & (
+                PassiveFlag.LOAD_AGAINST_COMMITTED
+                | PassiveFlag.DEFERRED_HISTORY_LOAD
+            )
+        ):
+            value = self._emit_batched_lazyload(
+                session,
+                state,
+                stmt,
+                load_options,
+                execution_options,
+                lazyload_group,
+            )
+            if value is not LoaderCallableStatus.PASSIVE_NO_RESULT:
+                return value
+
         if use_get:
             if self._raise_on_sql and not passive & PassiveFlag.NO_RAISE:
                 self._invoke_raise_load(state, passive, "raise_on_sql")
 
+            if lazyload_group is not None:
+                lazyload_group._lazyload_emitted(self, session, state)
+
             return loading.load_on_pk_identity(
                 session,
                 stmt,
@@ -1127,6 +1226,9 @@ class LazyLoader(
 
         stmt._where_criteria = (lazy_clause,)
 
+        if lazyload_group is not None:
+            lazyload_group._lazyload_emitted(self, session, state)
+
         result = session.execute(
             stmt, params, execution_options=execution_options
         )
@@ -1149,6 +1251,93 @@ class LazyLoader(
             else:
                 return None
 
+    def _emit_batched_lazyload(
+        self,
+        session,
+        state,
+        stmt,
+        load_options,
+        execution_options,
+        lazyload_group,
+    ):
+        batch_clause = self._batch_clause
+        if batch_clause is None:
+            return LoaderCallableStatus.PASSIVE_NO_RESULT
+
+        batch_col, parent_col, criteria = batch_clause
+        key = self.key
+
+        # gather the parent value of each instance loaded alongside this
+        # one which has yet to load the attribute
+        values = {}
+        for sibling in lazyload_group.states:
+            if sibling is not state and (
+                sibling.session_id != state.session_id
+                or not sibling.key
+                or key in sibling.dict
+                or sibling.obj() is None
+            ):
+                continue
+            value = sibling.manager.mapper._get_state_attr_by_column(
+                sibling,
+                sibling.dict,
+                parent_col,
+                passive=PassiveFlag.PASSIVE_NO_FETCH,
+            )
+            if value not in _none_set:
+                values[sibling] = value
+
+        lazyload_group.states = [
+            sibling
+            for sibling in lazyload_group.states
+            if sibling not in values
+            and key not in sibling.dict
+            and sibling.obj() is not None
+        ]
+
+        if state not in values or len(values) < 2:
+            if state in values:
+                lazyload_group.states.append(state)
+            return LoaderCallableStatus.PASSIVE_NO_RESULT
+
+        stmt = stmt.add_columns(batch_col)
+        if criteria:
+            stmt = stmt.where(*criteria)
+        if self._order_by:
+            stmt = stmt.order_by(*self._order_by)
+
+        execution_options = util.EMPTY_DICT.merge_with(
+            execution_options, {"_sa_orm_load_options": load_options}
+        )
+
+        related = collections.defaultdict(list)
+        distinct_values = list(dict.fromkeys(values.values()))
+        chunksize = self._batch_chunksize
+        for start in range(0, len(distinct_values), chunksize):
+            result = session.execute(
+                stmt.where(
+                    batch_col.in_(distinct_values[start : start + chunksize])
+                ),
+                execution_options=execution_options,
+            )
+            for obj, value in result.unique():
+                related[value].append(obj)
+
+        retval = None
+        for sibling, value in values.items():
+            if self.uselist:
+                loaded = list(related.get(value, ()))
+            else:
+                loaded = related[value][0] if value in related else None
+
+            if sibling is state:
+                retval = loaded
+            else:
+                sibling.manager[key].impl.set_committed_value(
+                    sibling, sibling.dict, loaded
+                )
+        return retval
+
     def create_row_processor(
         self,
         context,
@@ -1178,7 +1367,58 @@ class LazyLoader(
                 populators,
             )
 
-        if not self.is_class_level or (loadopt and loadopt._extra_criteria):
+        execution_options = context.query._execution_options.merge_with(
+            context.execution_options
+        )
+        batch = self._batch or execution_options.get("batch_lazyload", False)
+        detect = execution_options.get("detect_n_plus_one", False)
+
+        if (batch or detect) and not (
+            self._raise_always or self._raise_on_sql
+        ):
+            # set up a per-instance lazyloader shared among all the
+            # instances loaded here, which loads the attribute for all
+            # of them at once, and/or reports when the attribute is
+            # lazy loaded for more than one of them.
+            lazyload_group = _LazyLoadGroup(
+                batch,
+                detect,
+                {
+                    opt: execution_options[opt]
+                    for opt in ("batch_lazyload", "detect_n_plus_one")
+                    if opt in execution_options
+                },
+            )
+            set_lazy_callable = (
+                InstanceState._instance_level_callable_processor
+            )(
+                mapper.class_manager,
+                _LazyLoadGroupAttribute(
+                    key,
+                    self,
+                    loadopt,
+                    (
+                        loadopt._generate_extra_criteria(context)
+                        if loadopt and loadopt._extra_criteria
+                        else None
+                    ),
+                    lazyload_group,
+                ),
+                key,
+            )
+            reset = context.populate_existing or mapper.always_refresh
+
+            def set_group_lazy_callable(state, dict_, row):
+                if reset:
+                    state._reset(dict_, key)
+                if batch:
+                    lazyload_group.states.append(state)
+                set_lazy_callable(state, dict_, row)
+
+            populators["new"].append((self.key, set_group_lazy_callable))
+        elif not self.is_class_level or (
+            loadopt and loadopt._extra_criteria
+        ):
             # we are not the primary manager for this attribute
             # on this class - set up a
             # per-instance lazyloader, which will override the
@@ -1273,6 +1513,72 @@ class LoadLazyAttribute:
         )
 
 
+class _LazyLoadGroup:
+    """The instances loaded by one statement which share a
+    :class:`._LazyLoadGroupAttribute` for a relationship."""
+
+    __slots__ = ("batch", "detect", "execution_options", "states", "emitted")
+
+    def __init__(self, batch, detect, execution_options):
+        self.batch = batch
+        self.detect = detect
+        self.execution_options = execution_options
+        self.states = []
+        self.emitted = 0
+
+    def _lazyload_emitted(self, strategy, session, state):
+        if not self.detect:
+            return
+        self.emitted += 1
+        if self.emitted == 2:
+            prop = strategy.parent_property
+            util.warn(
+                "Relationship %s was lazy loaded with a separate SELECT "
+                "for more than one of the instances loaded by the same "
+                "statement, which is an N+1 query pattern; consider "
+                "loading it with selectinload(), or with batchload() "
+                "or lazy='batch'" % prop
+            )
+            session.dispatch.n_plus_one_detected(session, state.obj(), prop)
+
+
+class _LazyLoadGroupAttribute(LoadLazyAttribute):
+    """per-instance loader used by LazyLoader for batched lazy loading
+    and N+1 detection.
+
+    The group is not serialized; an unpickled instance loads the
+    attribute individually.
+
+    """
+
+    lazyload_group = None
+
+    def __init__(
+        self, key, initiating_strategy, loadopt, extra_criteria, lazyload_group
+    ):
+        super().__init__(key, initiating_strategy, loadopt, extra_criteria)
+        self.lazyload_group = lazyload_group
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        lazyload_group = self.lazyload_group
+        if lazyload_group is None:
+            return super().__call__(state, passive)
+
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._strategies[self.strategy_key]
+
+        return strategy._load_for_state(
+            state,
+            passive,
+            loadopt=self.loadopt,
+            extra_criteria=self.extra_criteria,
+            execution_options=lazyload_group.execution_options,
+            lazyload_group=lazyload_group,
+        )
+
+
 class PostLoader(AbstractRelationshipLoader):
     """A relationship loader that emits a second SELECT statement."""
 
@@ -1348,6 +1654,29 @@ class PostLoader(AbstractRelationshipLoader):
 
         return effective_path, True, execution_options, recursion_depth
 
+    def _create_readonly_row_processor(
+        self, context, query_entity, path, loadopt, mapper, result, adapter
+    ):
+        if not context.compile_state.compile_options._enable_eagerloads:
+            return None
+
+        _, run_loader, _, _ = self._setup_for_recursion(
+            context, path, loadopt, self.join_depth
+        )
+        if not run_loader:
+            return None
+
+        # snapshots have no state for a second SELECT to populate; rather
+        # than leave the attribute unloaded, which would only surface as
+        # AttributeError when it's accessed, refuse the combination
+        raise sa_exc.InvalidRequestError(
+            "Relationship %s is loaded using lazy=%r, which emits a "
+            "separate SELECT statement and can't be used with the "
+            "readonly_entities execution option; use joinedload() to "
+            "include it in the snapshots, or lazyload() to leave it out"
+            % (self.parent_property, self.strategy_opts["lazy"])
+        )
+
 
 @relationships.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(PostLoader):
@@ -2783,6 +3112,32 @@ class JoinedLoader(AbstractRelationshipLoader):
                 populators,
             )
 
+    def _create_readonly_row_processor(
+        self, context, query_entity, path, loadopt, mapper, result, adapter
+    ):
+        if not context.compile_state.compile_options._enable_eagerloads:
+            return None
+
+        if self.uselist:
+            context.loaders_require_uniquing = True
+
+        our_path = path[self.parent_property]
+
+        eager_adapter = self._create_eager_adapter(
+            context, result, adapter, our_path, loadopt
+        )
+        if eager_adapter is False:
+            return None
+
+        return loading._instance_processor(
+            query_entity,
+            self.mapper,
+            context,
+            result,
+            our_path[self.entity],
+            eager_adapter,
+        )
+
     def _create_collection_loader(self, context, key, _instance, populators):
         def load_collection_from_joined_new_row(state, dict_, row):
             # note this must unconditionally clear out any existing collection.
@@ -445,6 +445,28 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         """
         return self._set_relationship_strategy(attr, {"lazy": "select"})
 
+    def batchload(self, attr: _AttrType) -> Self:
+        """Indicate that the given attribute should be loaded using
+        batched "lazy" loading.
+
+        As with :func:`.lazyload`, the attribute is loaded when first
+        accessed; the related items of all the instances loaded by the
+        same statement that haven't loaded the attribute yet are loaded
+        at the same time, using one SELECT statement with an IN clause
+        for every 500 instances.
+
+        This function is part of the :class:`_orm.Load` interface and supports
+        both method-chained and standalone operation.
+
+        .. seealso::
+
+            :ref:`loading_toplevel`
+
+            :ref:`lazy_loading`
+
+        """
+        return self._set_relationship_strategy(attr, {"lazy": "batch"})
+
     def immediateload(
         self,
         attr: _AttrType,
@@ -2455,6 +2477,11 @@ def lazyload(*keys: _AttrType) -> _AbstractLoad:
     return _generate_from_keys(Load.lazyload, keys, False, {})
 
 
+@loader_unbound_fn
+def batchload(*keys: _AttrType) -> _AbstractLoad:
+    return _generate_from_keys(Load.batchload, keys, False, {})
+
+
 @loader_unbound_fn
 def immediateload(
     *keys: _AttrType, recursion_depth: Optional[int] = None
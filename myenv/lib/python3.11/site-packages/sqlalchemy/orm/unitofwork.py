@@ -206,6 +206,11 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # True when the flush consisted only of pending objects of one
+        # mapper, which were inserted directly rather than through the
+        # flush actions above
+        self.fast_insert = False
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -1770,6 +1770,129 @@ class Bundle(
         return proc
 
 
+class ReadOnlySnapshot:
+    """Base class for the read-only snapshots of mapped instances
+    returned by ORM statements executed with the ``readonly_entities``
+    execution option.
+
+    E.g.::
+
+        stmt = (
+            select(User)
+            .options(joinedload(User.addresses))
+            .execution_options(readonly_entities=True)
+        )
+        for user in session.scalars(stmt).unique():
+            print(user.name, [address.email for address in user.addresses])
+
+    A subclass of :class:`.ReadOnlySnapshot` is generated for each mapped
+    class, with a ``__slots__`` entry for each column and relationship
+    attribute, available under the attribute's key.  Snapshots are not instances of the mapped class and are
+    not associated with a :class:`.Session`; no instance state or
+    attribute instrumentation is set up for them, they are not placed
+    in the identity map, and they are not affected by expiration.
+    This makes loading them significantly faster than loading mapped
+    instances, and suits results which are only read, such as those
+    which are serialized and returned by a web service.
+
+    Attributes of a snapshot can't be assigned.  Columns which are not
+    loaded by the statement, such as deferred columns, and relationships
+    which are not loaded using :func:`_orm.joinedload`, raise
+    ``AttributeError`` when accessed, as snapshots can't load anything
+    further.  Relationships which would be loaded by a separate SELECT
+    statement, using :func:`_orm.selectinload`, :func:`_orm.subqueryload`
+    or :func:`_orm.immediateload` or the equivalent ``lazy`` setting,
+    can't be loaded into snapshots, and executing the statement raises
+    :class:`.InvalidRequestError`; apply :func:`_orm.lazyload` to such
+    relationships to leave them out.  Collections are loaded as tuples,
+    regardless of the collection class configured for the relationship.
+    Within a single result, each identity is represented by one snapshot.
+
+    """
+
+    __slots__ = ()
+
+    _sa_mapper: Mapper[Any]
+    _sa_keys: Tuple[str, ...] = ()
+
+    @classmethod
+    def _for_mapper(cls, mapper: Mapper[Any]) -> Type[ReadOnlySnapshot]:
+        if mapper.inherits is not None:
+            base = mapper.inherits._readonly_snapshot_class
+        else:
+            base = cls
+
+        keys = tuple(prop.key for prop in mapper.column_attrs) + tuple(
+            prop.key for prop in mapper.relationships
+        )
+
+        # keys which can't be slot names, as they aren't identifiers or
+        # would be name-mangled, are stored in a slot of a generated name,
+        # whose descriptor is then also placed under the key
+        slots = {}
+        for idx, key in enumerate(keys):
+            if key in base._sa_keys:
+                continue
+            if key.isidentifier() and not key.startswith("__"):
+                slots[key] = key
+            else:
+                slots[key] = "_sa_slot_%d" % idx
+
+        snapshot_cls = type(
+            "%sSnapshot" % mapper.class_.__name__,
+            (base,),
+            {
+                "__slots__": tuple(slots.values()),
+                "__module__": mapper.class_.__module__,
+                "_sa_mapper": mapper,
+                "_sa_keys": keys,
+            },
+        )
+        for key, slot in slots.items():
+            if key != slot:
+                setattr(snapshot_cls, key, snapshot_cls.__dict__[slot])
+        return snapshot_cls
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("%s is read-only" % type(self).__name__)
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError("%s is read-only" % type(self).__name__)
+
+    def __getattr__(self, key: str) -> Any:
+        # only invoked for attributes which were not loaded
+        if key in self._sa_keys:
+            raise AttributeError(
+                "Attribute '%s' was not loaded for %s"
+                % (key, type(self).__name__)
+            )
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (type(self).__name__, key)
+        )
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Return a dictionary of the attributes which were loaded."""
+
+        d = {}
+        for key in self._sa_keys:
+            try:
+                d[key] = object.__getattribute__(self, key)
+            except AttributeError:
+                pass
+        return d
+
+    def __repr__(self) -> str:
+        loaded = self._asdict()
+        return "%s(%s)" % (
+            type(self).__name__,
+            ", ".join(
+                "%s=%r" % (prop.key, loaded[prop.key])
+                for prop in self._sa_mapper.column_attrs
+                if prop.key in loaded
+            ),
+        )
+
+
 def _orm_annotate(element: _SA, exclude: Optional[Any] = None) -> _SA:
     """Deep copy the given ClauseElement, annotating each element with the
     "_orm_adapt" flag.
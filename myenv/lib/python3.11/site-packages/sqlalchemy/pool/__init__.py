@@ -30,9 +30,11 @@ from .base import ManagesConnection as ManagesConnection
 from .base import Pool as Pool
 from .base import PoolProxiedConnection as PoolProxiedConnection
 from .base import PoolResetState as PoolResetState
+from .base import PoolStats as PoolStats
 from .base import reset_commit as reset_commit
 from .base import reset_none as reset_none
 from .base import reset_rollback as reset_rollback
+from .impl import AffinityQueuePool as AffinityQueuePool
 from .impl import AssertionPool as AssertionPool
 from .impl import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
 from .impl import (
@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import deque
 import dataclasses
 from enum import Enum
@@ -47,6 +48,119 @@ if TYPE_CHECKING:
     from ..sql._typing import _InfoType
 
 
+class PoolStats:
+    """Counters describing the checkout and connection activity of a
+    :class:`_pool.Pool`.
+
+    Collection is enabled for the pool of an :class:`_engine.Engine`
+    created with :paramref:`_sa.create_engine.collect_stats`, and the
+    object is available as ``engine.stats.pool``.  Counters are
+    incremented without locking and are therefore approximate while
+    other threads are using the pool.
+
+    """
+
+    __slots__ = (
+        "checkouts",
+        "checkout_wait_total",
+        "checkout_wait_histogram",
+        "checkout_timeouts",
+        "connects",
+        "connect_time_total",
+        "overflow_connects",
+        "invalidations",
+        "soft_invalidations",
+    )
+
+    checkout_wait_buckets: Tuple[float, ...] = (
+        0.0001,
+        0.001,
+        0.01,
+        0.1,
+        1.0,
+        10.0,
+    )
+    """Upper bounds, in seconds, of the buckets of
+    :attr:`.checkout_wait_histogram`; a final bucket counts the waits
+    longer than the last bound."""
+
+    checkouts: int
+    """Number of connections checked out from the pool."""
+
+    checkout_wait_total: float
+    """Total number of seconds spent waiting for the pool to produce a
+    connection, including the time spent connecting."""
+
+    checkout_wait_histogram: List[int]
+    """Number of checkouts per bucket of :attr:`.checkout_wait_buckets`."""
+
+    checkout_timeouts: int
+    """Number of checkouts which failed as no connection became available
+    within the pool's timeout."""
+
+    connects: int
+    """Number of new DBAPI connections established."""
+
+    connect_time_total: float
+    """Total number of seconds spent establishing new DBAPI connections."""
+
+    overflow_connects: int
+    """Number of connections created beyond the ``pool_size`` of a
+    :class:`.QueuePool`."""
+
+    invalidations: int
+    """Number of connections invalidated."""
+
+    soft_invalidations: int
+    """Number of connections soft-invalidated, so that they are recycled
+    on next checkout."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_histogram = [0] * (
+            len(self.checkout_wait_buckets) + 1
+        )
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.connect_time_total = 0.0
+        self.overflow_connects = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+
+    def _record_checkout(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_total += elapsed
+        self.checkout_wait_histogram[
+            bisect_left(self.checkout_wait_buckets, elapsed)
+        ] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values of all counters as a dictionary."""
+
+        return {
+            "checkouts": self.checkouts,
+            "checkout_wait_total": self.checkout_wait_total,
+            "checkout_wait_histogram": dict(
+                zip(
+                    self.checkout_wait_buckets + (float("inf"),),
+                    self.checkout_wait_histogram,
+                )
+            ),
+            "checkout_timeouts": self.checkout_timeouts,
+            "connects": self.connects,
+            "connect_time_total": self.connect_time_total,
+            "overflow_connects": self.overflow_connects,
+            "invalidations": self.invalidations,
+            "soft_invalidations": self.soft_invalidations,
+        }
+
+
 @dataclasses.dataclass(frozen=True)
 class PoolResetState:
     """describes the state of a DBAPI connection as it is being passed to
@@ -165,6 +279,7 @@ class Pool(log.Identified, event.EventTarget):
     _creator_arg: Union[_CreatorFnType, _CreatorWRecFnType]
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
+    _stats: Optional[PoolStats] = None
 
     def __init__(
         self,
@@ -176,6 +291,7 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        pre_ping_interval: float = 0,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
     ):
         """
@@ -273,6 +389,21 @@ class Pool(log.Identified, event.EventTarget):
 
          .. versionadded:: 1.2
 
+        :param pre_ping_interval: when used with
+         :paramref:`_pool.Pool.pre_ping`, a number of seconds within which
+         a connection that was last returned to the pool is considered
+         to be alive, so that the "ping" is skipped upon checkout.   A
+         connection checked out again after a longer idle period is
+         pinged as usual.  Defaults to zero, meaning every checkout is
+         pinged.
+
+         :class:`.QueuePool` additionally starts a background thread when
+         this parameter is set, which pings connections that have been
+         idle in the pool for longer than this interval and replaces
+         those which are disconnected, invalidated or past the
+         :paramref:`_pool.Pool.recycle` time, so that checkouts seldom
+         need to do so.
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -284,6 +415,7 @@ class Pool(log.Identified, event.EventTarget):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self._pre_ping_interval = pre_ping_interval
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -448,6 +580,16 @@ class Pool(log.Identified, event.EventTarget):
         """
         return _ConnectionFairy._checkout(self)
 
+    def _start_maintenance(self) -> None:
+        """Start background maintenance of the pool, for those pools
+        that perform it.
+
+        Called by :func:`_sa.create_engine` once the engine's connect
+        event handlers have been established; pools otherwise start it
+        upon first checkout.
+
+        """
+
     def _return_conn(self, record: ConnectionPoolEntry) -> None:
         """Given a _ConnectionRecord, return it to the :class:`_pool.Pool`.
 
@@ -618,6 +760,16 @@ class ConnectionPoolEntry(ManagesConnection):
 
     __slots__ = ()
 
+    connect_duration: float
+    """The number of seconds taken to establish the current DBAPI
+    connection.
+
+    This value is set before the :meth:`.PoolEvents.connect` event is
+    emitted, so that a handler for that event may record connection
+    latency.
+
+    """
+
     @property
     def in_use(self) -> bool:
         """Return True the connection is currently checked out"""
@@ -653,6 +805,7 @@ class _ConnectionRecord(ConnectionPoolEntry):
         "finalize_callback",
         "fresh",
         "starttime",
+        "connect_duration",
         "dbapi_connection",
         "__weakref__",
         "__dict__",
@@ -662,11 +815,13 @@ class _ConnectionRecord(ConnectionPoolEntry):
     fresh: bool
     fairy_ref: Optional[weakref.ref[_ConnectionFairy]]
     starttime: float
+    connect_duration: float
 
     def __init__(self, pool: Pool, connect: bool = True):
         self.fresh = False
         self.fairy_ref = None
         self.starttime = 0
+        self.connect_duration = 0
         self.dbapi_connection = None
 
         self.__pool = pool
@@ -695,6 +850,7 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return self.dbapi_connection
 
     _soft_invalidate_time: float = 0
+    _checkin_time: float = 0
 
     @util.ro_memoized_property
     def info(self) -> _InfoType:
@@ -706,7 +862,16 @@ class _ConnectionRecord(ConnectionPoolEntry):
 
     @classmethod
     def checkout(cls, pool: Pool) -> _ConnectionFairy:
-        if TYPE_CHECKING:
+        stats = pool._stats
+        if stats is not None:
+            start = time.perf_counter()
+            try:
+                rec = cast(_ConnectionRecord, pool._do_get())
+            except exc.TimeoutError:
+                stats.checkout_timeouts += 1
+                raise
+            stats._record_checkout(time.perf_counter() - start)
+        elif TYPE_CHECKING:
             rec = cast(_ConnectionRecord, pool._do_get())
         else:
             rec = pool._do_get()
@@ -769,6 +934,7 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
 
+        self._checkin_time = time.time()
         pool._return_conn(self)
 
     @property
@@ -789,11 +955,16 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        stats = self.__pool._stats
         if soft:
+            if stats is not None:
+                stats.soft_invalidations += 1
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
             )
         else:
+            if stats is not None:
+                stats.invalidations += 1
             self.__pool.dispatch.invalidate(self.dbapi_connection, self, e)
         if e is not None:
             self.__pool.logger.info(
@@ -894,6 +1065,10 @@ class _ConnectionRecord(ConnectionPoolEntry):
         try:
             self.starttime = time.time()
             self.dbapi_connection = connection = pool._invoke_creator(self)
+            self.connect_duration = time.time() - self.starttime
+            if pool._stats is not None:
+                pool._stats.connects += 1
+                pool._stats.connect_time_total += self.connect_duration
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
         except BaseException as e:
@@ -1291,7 +1466,20 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if (
+                        not connection_is_fresh
+                        and pool._pre_ping_interval
+                        and time.time()
+                        - fairy._connection_record._checkin_time
+                        < pool._pre_ping_interval
+                    ):
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was recently checked in, "
+                                "skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    elif not connection_is_fresh:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
@@ -355,6 +355,29 @@ class PoolEvents(event.Events[Pool]):
 
         """
 
+    def maintenance(self, pool: Pool, idle: int) -> None:
+        """Called after the background maintenance thread of a
+        :class:`.QueuePool` has completed a pass over the pool.
+
+        The thread is started when the pool is configured with
+        :paramref:`.QueuePool.min_idle`, :paramref:`.QueuePool.warmup` or
+        :paramref:`_pool.Pool.pre_ping_interval`.  The event is also
+        emitted once connections requested by
+        :paramref:`.QueuePool.warmup` have been opened.  It is emitted
+        from the maintenance thread.
+
+        Along with the :attr:`.ConnectionPoolEntry.connect_duration`
+        value available within the :meth:`.connect` event, this allows
+        the idle connection count and connection latency of a pool to be
+        collected as metrics.
+
+        :param pool: the :class:`_pool.Pool`.
+
+        :param idle: the number of connections idle in the pool, as
+         reported by ``checkedin()``.
+
+        """
+
     def close_detached(self, dbapi_connection: DBAPIConnection) -> None:
         """Called when a detached DBAPI connection is closed.
 
@@ -12,13 +12,16 @@
 from __future__ import annotations
 
 import threading
+import time
 import traceback
 import typing
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import Union
@@ -77,6 +80,8 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        min_idle: int = 0,
+        warmup: int = 0,
         **kw: Any,
     ):
         r"""
@@ -127,6 +132,23 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param min_idle: The number of idle connections the pool should
+          keep open.  When nonzero, a background thread opens new
+          connections whenever fewer than this number are idle in the
+          pool, so that a burst of checkouts does not need to wait for
+          connections to be established.  Limited to ``pool_size``, and
+          to the number of connections allowed by ``max_overflow``.
+          Defaults to zero.
+
+          .. seealso::
+
+            :meth:`.PoolEvents.maintenance`
+
+        :param warmup: The number of connections to open in the background
+          as soon as the pool is created, before any connection has been
+          requested.  Defaults to zero, in which case connections are
+          opened on demand, apart from those maintained by ``min_idle``.
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -141,6 +163,164 @@ class QueuePool(Pool):
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
 
+        if (min_idle or warmup) and self._is_asyncio:
+            raise exc.ArgumentError(
+                "min_idle and warmup are not supported by %s"
+                % self.__class__.__name__
+            )
+        self._min_idle = min_idle
+        self._warmup = warmup
+        self._maintenance_wakeup = threading.Event()
+        self._maintenance_started = not (
+            min_idle or warmup or (self._pre_ping and self._pre_ping_interval)
+        )
+        self._needs_maintenance = not self._maintenance_started
+        # connections taken out of the pool or being opened by maintenance;
+        # they count as neither checked in nor checked out
+        self._maintaining = 0
+        # incremented by dispose(), so that maintenance under way closes
+        # the connections it holds rather than returning them to the pool
+        self._dispose_gen = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        if not self._maintenance_started:
+            self._start_maintenance()
+        return Pool.connect(self)
+
+    def _start_maintenance(self) -> None:
+        with self._overflow_lock:
+            if self._maintenance_started:
+                return
+            self._maintenance_started = True
+
+        if self._is_asyncio:
+            return
+
+        # the thread refers to the pool weakly, and exits once the pool
+        # is garbage collected
+        thread = threading.Thread(
+            target=_run_pool_maintenance,
+            args=(
+                weakref.ref(self),
+                self._pre_ping_interval or self._maintenance_interval,
+                self._maintenance_wakeup,
+            ),
+            name="sqlalchemy pool maintenance",
+            daemon=True,
+        )
+        thread.start()
+
+    _maintenance_interval = 1.0
+
+    def _maintain(self) -> None:
+        """Ping, recycle or reconnect connections that are idle in the
+        pool, and open new ones up to ``min_idle``, so that checkouts
+        don't have to."""
+
+        generation = self._dispose_gen
+        now = time.time()
+        interval = self._pre_ping_interval if self._pre_ping else 0
+        recycle = self._recycle
+
+        def is_due(record: _ConnectionRecord) -> bool:
+            return (
+                (interval and now - record._checkin_time >= interval)
+                or (recycle > -1 and now - record.starttime > recycle)
+                or record._is_hard_or_soft_invalidated()
+            )
+
+        records = self._idle_for_maintenance(is_due)
+        with self._overflow_lock:
+            if generation == self._dispose_gen:
+                self._maintaining += len(records)
+        for record in records:
+            try:
+                self._maintain_connection(record)
+            finally:
+                self._return_maintained(record, generation)
+
+        if self._min_idle:
+            self._fill_idle(self._min_idle, generation)
+
+        if self.dispatch.maintenance:
+            self.dispatch.maintenance(self, self.checkedin())
+
+    def _fill_idle(self, count: int, generation: int) -> None:
+        if self._pool.maxsize:
+            count = min(count, self._pool.maxsize)
+
+        while self.checkedin() < count:
+            with self._overflow_lock:
+                if generation != self._dispose_gen or (
+                    self._max_overflow > -1
+                    and self._overflow >= self._max_overflow
+                ):
+                    # disposed, or every connection allowed is already open
+                    break
+                self._overflow += 1
+                self._maintaining += 1
+                if self._stats is not None and self._overflow > 0:
+                    self._stats.overflow_connects += 1
+            try:
+                record = cast(_ConnectionRecord, self._create_connection())
+            except Exception:
+                with self._overflow_lock:
+                    if generation == self._dispose_gen:
+                        self._overflow -= 1
+                        self._maintaining -= 1
+                self.logger.error(
+                    "Exception opening connection during pool maintenance",
+                    exc_info=True,
+                )
+                break
+            record._checkin_time = time.time()
+            self._return_maintained(record, generation)
+
+    def _return_maintained(
+        self, record: ConnectionPoolEntry, generation: int
+    ) -> None:
+        """Return a connection held by maintenance to the pool, or close it
+        if the pool was disposed since maintenance took or opened it."""
+
+        with self._overflow_lock:
+            if generation == self._dispose_gen:
+                self._maintaining -= 1
+                try:
+                    self._pool.put(record, False)
+                    return
+                except sqla_queue.Full:
+                    self._overflow -= 1
+        record.close()
+
+    def _idle_for_maintenance(
+        self, is_due: Callable[[_ConnectionRecord], bool]
+    ) -> List[_ConnectionRecord]:
+        return cast(
+            "List[_ConnectionRecord]",
+            self._pool.get_matching(is_due),  # type: ignore[arg-type]
+        )
+
+    def _maintain_connection(self, record: _ConnectionRecord) -> None:
+        try:
+            # applies recycle and invalidation exactly as a checkout would
+            dbapi_connection = record.get_connection()
+            if self._pre_ping and not record.fresh:
+                if not self._dialect._do_ping_w_event(dbapi_connection):
+                    self.logger.info(
+                        "Pool maintenance ping failed on connection %r, "
+                        "reconnecting",
+                        dbapi_connection,
+                    )
+                    record.invalidate()
+                    record.get_connection()
+        except Exception as err:
+            self.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+            record.invalidate(err)
+        else:
+            record._checkin_time = time.time()
+
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         try:
             self._pool.put(record, False)
@@ -173,6 +353,8 @@ class QueuePool(Pool):
                 )
 
         if self._inc_overflow():
+            if self._min_idle:
+                self._maintenance_wakeup.set()
             try:
                 return self._create_connection()
             except:
@@ -185,10 +367,14 @@ class QueuePool(Pool):
     def _inc_overflow(self) -> bool:
         if self._max_overflow == -1:
             self._overflow += 1
+            if self._stats is not None and self._overflow > 0:
+                self._stats.overflow_connects += 1
             return True
         with self._overflow_lock:
             if self._overflow < self._max_overflow:
                 self._overflow += 1
+                if self._stats is not None and self._overflow > 0:
+                    self._stats.overflow_connects += 1
                 return True
             else:
                 return False
@@ -203,13 +389,16 @@ class QueuePool(Pool):
 
     def recreate(self) -> QueuePool:
         self.logger.info("Pool recreating")
-        return self.__class__(
+        pool = self.__class__(
             self._creator,
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            warmup=self._warmup,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
@@ -217,8 +406,24 @@ class QueuePool(Pool):
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
+        # event handlers are already established on the shared dispatch
+        pool._start_maintenance()
+        return pool
 
     def dispose(self) -> None:
+        if self._needs_maintenance:
+            # stop the maintenance thread, so that it doesn't open new
+            # connections; it is started again if the pool is used further
+            wakeup = self._maintenance_wakeup
+            self._maintenance_wakeup = threading.Event()
+            self._maintenance_started = False
+            wakeup.set()
+
+        with self._overflow_lock:
+            self._dispose_gen += 1
+            self._maintaining = 0
+            self._overflow = 0 - self.size()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -226,7 +431,6 @@ class QueuePool(Pool):
             except sqla_queue.Empty:
                 break
 
-        self._overflow = 0 - self.size()
         self.logger.info("Pool disposed. %s", self.status())
 
     def status(self) -> str:
@@ -252,10 +456,263 @@ class QueuePool(Pool):
         return self._pool.qsize()
 
     def overflow(self) -> int:
-        return self._overflow if self._pool.maxsize else 0
+        if not self._pool.maxsize:
+            return 0
+        return self._overflow - self._maintaining
 
     def checkedout(self) -> int:
-        return self._pool.maxsize - self._pool.qsize() + self._overflow
+        return (
+            self._pool.maxsize
+            - self._pool.qsize()
+            + self._overflow
+            - self._maintaining
+        )
+
+
+class AffinityQueuePool(QueuePool):
+    """A :class:`.QueuePool` which gives each thread first claim on the
+    connection it most recently returned.
+
+    Each thread that returns a connection to the pool places it in a slot
+    local to that thread, if that slot is empty, rather than in the shared
+    queue.  The next checkout on the same thread takes the connection back
+    out of its slot without acquiring any lock.  The shared queue, which
+    synchronizes on a single ``threading.Condition``, is only consulted
+    when the thread's own slot is empty, so that applications which run
+    many threads, each of which checks out one connection at a time, see
+    far less contention on checkout and checkin than with
+    :class:`.QueuePool`.
+
+    A thread whose slot is empty and which finds the shared queue empty
+    will take an idle connection from another thread's slot before it
+    opens a new connection, so that idle connections are never stranded
+    in a slot.  While any thread is waiting for a connection to become
+    available, returned connections go to the shared queue.
+
+    The arguments accepted are the same as those of :class:`.QueuePool`.
+    Connections returned while the pool has overflowed always go to the
+    shared queue, so that connections beyond ``pool_size`` are discarded
+    as with :class:`.QueuePool`.  :meth:`.Pool.status`, ``checkedin()``
+    and ``checkedout()`` include the connections held in slots.
+
+    The :class:`.AffinityQueuePool` class **is not compatible** with
+    asyncio and :func:`_asyncio.create_async_engine`.
+
+    """
+
+    _is_asyncio = False  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        use_lifo: bool = False,
+        min_idle: int = 0,
+        warmup: int = 0,
+        **kw: Any,
+    ):
+        self._local = threading.local()
+        self._slots: List[
+            Tuple[weakref.ref[threading.Thread], List[ConnectionPoolEntry]]
+        ] = []
+        self._slots_lock = threading.Lock()
+        self._waiters = 0
+        QueuePool.__init__(
+            self,
+            creator,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            timeout=timeout,
+            use_lifo=use_lifo,
+            min_idle=min_idle,
+            warmup=warmup,
+            **kw,
+        )
+
+    def _local_slot(self) -> List[ConnectionPoolEntry]:
+        try:
+            return self._local.slot  # type: ignore[no-any-return]
+        except AttributeError:
+            slot: List[ConnectionPoolEntry] = []
+            self._local.slot = slot
+            with self._slots_lock:
+                self._slots.append(
+                    (weakref.ref(threading.current_thread()), slot)
+                )
+            return slot
+
+    def _steal(self) -> Optional[ConnectionPoolEntry]:
+        with self._slots_lock:
+            for ref, slot in self._slots:
+                try:
+                    return slot.pop()
+                except IndexError:
+                    pass
+
+            # forget about empty slots of threads which have exited
+            self._slots[:] = [
+                (ref, slot)
+                for ref, slot in self._slots
+                if slot or _thread_is_alive(ref)
+            ]
+        return None
+
+    def _idle_for_maintenance(
+        self, is_due: Callable[[_ConnectionRecord], bool]
+    ) -> List[_ConnectionRecord]:
+        records = QueuePool._idle_for_maintenance(self, is_due)
+        with self._slots_lock:
+            for ref, slot in self._slots:
+                try:
+                    if not is_due(cast(_ConnectionRecord, slot[-1])):
+                        continue
+                    records.append(cast(_ConnectionRecord, slot.pop()))
+                except IndexError:
+                    # the owning thread took it meanwhile
+                    pass
+        return records
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        # while the pool is overflowed, connections go back to the shared
+        # queue, which will discard those beyond pool_size
+        if self._waiters or (self._pool.maxsize and self._overflow > 0):
+            QueuePool._do_return_conn(self, record)
+            return
+
+        slot = self._local_slot()
+        if slot:
+            QueuePool._do_return_conn(self, record)
+            return
+
+        slot.append(record)
+
+        if self._waiters:
+            # a thread started waiting after the check above; it will
+            # either have taken the connection from our slot already,
+            # or is waiting on the shared queue
+            try:
+                record = slot.pop()
+            except IndexError:
+                pass
+            else:
+                QueuePool._do_return_conn(self, record)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        try:
+            return self._local_slot().pop()
+        except IndexError:
+            pass
+
+        try:
+            return self._pool.get(False)
+        except sqla_queue.Empty:
+            pass
+
+        record = self._steal()
+        if record is not None:
+            return record
+
+        if self._inc_overflow():
+            return self._create_overflow_connection()
+
+        return self._wait_for_connection()
+
+    def _create_overflow_connection(self) -> ConnectionPoolEntry:
+        if self._min_idle:
+            self._maintenance_wakeup.set()
+        try:
+            return self._create_connection()
+        except:
+            with util.safe_reraise():
+                self._dec_overflow()
+            raise
+
+    def _wait_for_connection(self) -> ConnectionPoolEntry:
+        with self._overflow_lock:
+            self._waiters += 1
+        try:
+            record = self._steal()
+            if record is not None:
+                return record
+
+            if self._inc_overflow():
+                return self._create_overflow_connection()
+
+            try:
+                return self._pool.get(True, self._timeout)
+            except sqla_queue.Empty:
+                pass
+        finally:
+            with self._overflow_lock:
+                self._waiters -= 1
+
+        raise exc.TimeoutError(
+            "AffinityQueuePool limit of size %d overflow %d reached, "
+            "connection timed out, timeout %0.2f"
+            % (self.size(), self.overflow(), self._timeout),
+            code="3o7r",
+        )
+
+    def dispose(self) -> None:
+        with self._slots_lock:
+            for ref, slot in self._slots:
+                while slot:
+                    try:
+                        conn = slot.pop()
+                    except IndexError:
+                        break
+                    conn.close()
+
+        QueuePool.dispose(self)
+
+    def checkedin(self) -> int:
+        return self._pool.qsize() + sum(
+            len(slot) for ref, slot in self._slots
+        )
+
+    def checkedout(self) -> int:
+        return (
+            self._pool.maxsize
+            - self.checkedin()
+            + self._overflow
+            - self._maintaining
+        )
+
+
+def _thread_is_alive(ref: weakref.ref[threading.Thread]) -> bool:
+    thread = ref()
+    return thread is not None and thread.is_alive()
+
+
+def _run_pool_maintenance(
+    pool_ref: weakref.ref[QueuePool],
+    interval: float,
+    wakeup: threading.Event,
+) -> None:
+    pool = pool_ref()
+    if pool is not None and pool._warmup:
+        pool._fill_idle(pool._warmup, pool._dispose_gen)
+        if pool.dispatch.maintenance:
+            pool.dispatch.maintenance(pool, pool.checkedin())
+    del pool
+
+    while True:
+        # woken early when a checkout had to open a new connection
+        wakeup.wait(interval)
+        wakeup.clear()
+        pool = pool_ref()
+        if pool is None or pool._maintenance_wakeup is not wakeup:
+            # pool was garbage collected or disposed
+            return
+        try:
+            pool._maintain()
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+        del pool
 
 
 class AsyncAdaptedQueuePool(QueuePool):
@@ -317,6 +774,7 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -380,6 +838,7 @@ class SingletonThreadPool(Pool):
             recycle=self._recycle,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             _dispatch=self.dispatch,
@@ -481,6 +940,7 @@ class StaticPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -555,6 +1015,7 @@ class AssertionPool(Pool):
             self._creator,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
@@ -86,6 +86,7 @@ from .expression import select as select
 from .expression import Selectable as Selectable
 from .expression import SelectLabelStyle as SelectLabelStyle
 from .expression import SQLColumnExpression as SQLColumnExpression
+from .expression import statement_template as statement_template
 from .expression import StatementLambdaElement as StatementLambdaElement
 from .expression import Subquery as Subquery
 from .expression import table as table
@@ -152,6 +152,7 @@ from .selectable import TableValuedAlias as TableValuedAlias
 from .selectable import TextAsFrom as TextAsFrom
 from .selectable import TextualSelect as TextualSelect
 from .selectable import Values as Values
+from .template import statement_template as statement_template
 from .visitors import Visitable as Visitable
 
 nullsfirst = nulls_first
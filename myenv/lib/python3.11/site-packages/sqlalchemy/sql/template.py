@@ -0,0 +1,134 @@
+# sql/template.py
+# Copyright (C) 2005-2024 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+"""Statement templates, which are statements constructed and cache-keyed
+once, then executed many times with different parameter values.
+
+"""
+from __future__ import annotations
+
+import inspect
+from typing import Any
+from typing import Callable
+from typing import overload
+from typing import TypeVar
+
+from . import coercions
+from . import roles
+from .base import Executable
+from .elements import BindParameter
+from .. import exc
+
+_E = TypeVar("_E", bound=Executable)
+
+
+@overload
+def statement_template(statement: _E) -> _E: ...
+
+
+@overload
+def statement_template(statement: Callable[..., _E]) -> _E: ...
+
+
+def statement_template(statement: Any) -> Any:
+    """Produce a statement that is constructed and cache-keyed once, to be
+    executed repeatedly with different parameter values.
+
+    Statements which are constructed anew for each execution need to
+    have their cache key generated by traversing the whole statement
+    each time, before the compiled form can be retrieved from the
+    compiled cache.  A statement object that's used repeatedly only
+    generates its cache key once; :func:`.statement_template` prepares
+    such a statement up front and checks that it is fit for this use.
+
+    The function may be used as a decorator; the decorated function is
+    called once, with a :func:`.bindparam` named after each of its
+    arguments, and the statement it returns takes the function's place::
+
+        from sqlalchemy import statement_template
+
+        @statement_template
+        def posts_by_author(author_id, limit):
+            return (
+                select(Post)
+                .where(Post.author_id == author_id)
+                .options(selectinload(Post.comments))
+                .order_by(Post.id.desc())
+                .limit(limit)
+            )
+
+        posts = session.scalars(
+            posts_by_author, {"author_id": 5, "limit": 10}
+        ).all()
+
+    A statement that already makes use of :func:`.bindparam` may also be
+    passed directly::
+
+        posts_by_author = statement_template(
+            select(Post).where(Post.author_id == bindparam("author_id"))
+        )
+
+    Any construct that can be executed may be used, including ORM-enabled
+    statements with loader options.  Unlike :func:`_sql.lambda_stmt`, no
+    Python code is analyzed and no closure variables are tracked: the
+    function is called once, and literal values within it are fixed in
+    the statement for all executions, so that values which need to vary
+    must be parameters.
+
+    An :class:`.ArgumentError` is raised if the statement can't be
+    cached, or if one of the function's arguments does not appear in the
+    statement, which usually indicates it was used in Python logic rather
+    than in a SQL expression.
+
+    As with any statement, the returned object is immutable; generative
+    methods such as :meth:`_sql.Select.where` produce a new statement
+    which is not part of the template.
+
+    .. seealso::
+
+        :ref:`sql_caching`
+
+        :func:`_sql.lambda_stmt`
+
+    """
+
+    if callable(statement) and not isinstance(statement, Executable):
+        names = [
+            param.name
+            for param in inspect.signature(statement).parameters.values()
+            if param.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
+            )
+        ]
+        slots = {name: BindParameter(name, required=True) for name in names}
+        stmt = statement(**slots)
+    else:
+        names = []
+        stmt = statement
+
+    stmt = coercions.expect(roles.StatementRole, stmt)
+
+    key = stmt._generate_cache_key()
+    if key is None:
+        raise exc.ArgumentError(
+            "Statement %r can't be used as a template, as it includes "
+            "constructs which are not cacheable" % stmt
+        )
+
+    present = {bind.key for bind in key.bindparams}
+    missing = [name for name in names if name not in present]
+    if missing:
+        raise exc.ArgumentError(
+            "Statement template parameter(s) %s are not used in the "
+            "statement; template parameters may only be used within SQL "
+            "expressions" % ", ".join(repr(name) for name in missing)
+        )
+
+    return stmt
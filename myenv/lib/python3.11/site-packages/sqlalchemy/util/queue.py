@@ -27,8 +27,10 @@ from time import time as _time
 import typing
 from typing import Any
 from typing import Awaitable
+from typing import Callable
 from typing import Deque
 from typing import Generic
+from typing import List
 from typing import Optional
 from typing import TypeVar
 
@@ -82,6 +84,9 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def get_matching(self, fn: Callable[[_T], bool]) -> List[_T]:
+        raise NotImplementedError()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -212,6 +217,27 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def get_matching(self, fn: Callable[[_T], bool]) -> List[_T]:
+        """Remove and return all items for which ``fn`` returns True,
+        without blocking.
+
+        The remaining items keep their order.
+        """
+
+        with self.not_full:
+            matched = []
+            remaining = []
+            for item in self.queue:
+                if fn(item):
+                    matched.append(item)
+                else:
+                    remaining.append(item)
+            if matched:
+                self.queue.clear()
+                self.queue.extend(remaining)
+                self.not_full.notify(len(matched))
+            return matched
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -0,0 +1,12 @@
+import os
+import sys
+
+# The packages under test are the ones installed in the committed virtualenv.
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "myenv", "lib", "python3.11", "site-packages"
+    ),
+)
+# The stand-in MySQL server of the benchmarks.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
@@ -0,0 +1,107 @@
+"""CursorResult.columnar() and partitions_columnar()."""
+
+import array
+import datetime
+import decimal
+
+import pytest
+
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Numeric
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import TypeDecorator
+
+
+class Upper(TypeDecorator):
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return value.upper() if value is not None else None
+
+
+metadata = MetaData()
+
+t = Table(
+    "t",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("x", Float),
+    Column("price", Numeric(10, 2)),
+    Column("created", DateTime),
+    Column("name", Upper),
+)
+
+START = datetime.datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            t.insert(),
+            [
+                {
+                    "id": i,
+                    "x": i / 2,
+                    "price": decimal.Decimal(i) / 4,
+                    "created": START + datetime.timedelta(days=i),
+                    "name": None if i == 3 else f"n{i}",
+                }
+                for i in range(10)
+            ],
+        )
+        yield conn
+
+
+def test_columnar(conn):
+    ids, x, price, created, name = conn.execute(select(t).order_by(t.c.id)).columnar()
+
+    assert ids == array.array("q", range(10))
+    assert x == array.array("d", [i / 2 for i in range(10)])
+    # result processors are applied
+    assert price == [decimal.Decimal(i) / 4 for i in range(10)]
+    assert created == [START + datetime.timedelta(days=i) for i in range(10)]
+    assert name[:4] == ["N0", "N1", "N2", None]
+
+
+def test_same_as_rows(conn):
+    rows = conn.execute(select(t).order_by(t.c.id)).all()
+    columns = conn.execute(select(t).order_by(t.c.id)).columnar()
+    assert [tuple(row) for row in zip(*columns)] == [tuple(row) for row in rows]
+
+
+def test_filtered_columns(conn):
+    result = conn.execute(select(t).order_by(t.c.id)).columns("name", "id")
+    name, ids = result.columnar()
+    assert name[-1] == "N9"
+    assert list(ids) == list(range(10))
+
+
+def test_partitions_columnar(conn):
+    result = conn.execute(select(t.c.id, t.c.name).order_by(t.c.id))
+    batches = list(result.partitions_columnar(4))
+
+    assert [list(ids) for ids, _ in batches] == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9],
+    ]
+    assert batches[0][1] == ["N0", "N1", "N2", None]
+    # the cursor is released, as with partitions()
+    assert result.cursor is None
+
+
+def test_empty(conn):
+    assert conn.execute(select(t).where(t.c.id < 0)).columnar() == [[]] * 5
+    result = conn.execute(select(t).where(t.c.id < 0))
+    assert list(result.partitions_columnar(4)) == []
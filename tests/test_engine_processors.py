@@ -0,0 +1,239 @@
+"""The result processors of the MySQL BIT, TIME, SET and JSON types, compiled
+and in Python, checked against the per-value closures these types used to
+return."""
+
+import datetime
+import importlib.util
+import json
+import re
+import sys
+import types
+
+import pytest
+
+from sqlalchemy import util
+from sqlalchemy.engine import _py_processors
+from sqlalchemy.engine import processors
+from sqlalchemy.util._has_cy import HAS_CYEXTENSION
+
+if HAS_CYEXTENSION:
+    from sqlalchemy.cyextension import processors as cy_processors
+else:
+    cy_processors = None
+
+
+# the closures returned by result_processor() before the processors were
+# added; bitmap and deserializer stand for the type's and dialect's
+
+
+def old_bit(value):
+    if value is not None:
+        v = 0
+        for i in value:
+            if not isinstance(i, int):
+                i = ord(i)
+            v = v << 8 | i
+        return v
+    return value
+
+
+def old_time(value):
+    if value is not None:
+        microseconds = value.microseconds
+        seconds = value.seconds
+        minutes = seconds // 60
+        return datetime.time(
+            minutes // 60,
+            minutes % 60,
+            seconds - minutes * 60,
+            microsecond=microseconds,
+        )
+    else:
+        return None
+
+
+def old_set(value):
+    if isinstance(value, str):
+        return set(re.findall(r"[^,]+", value))
+    else:
+        if value is not None:
+            value.discard("")
+        return value
+
+
+def old_bitmask_factory(bitmap):
+    def process(value):
+        if value is not None:
+            return set(util.map_bits(bitmap.__getitem__, int(value)))
+        else:
+            return None
+
+    return process
+
+
+def old_json_factory(deserializer):
+    def process(value):
+        if value is None:
+            return None
+        return deserializer(value)
+
+    return process
+
+
+OLD = types.SimpleNamespace(
+    bytes_to_int=old_bit,
+    timedelta_to_time=old_time,
+    str_to_set=old_set,
+    bitmask_to_set_processor_factory=old_bitmask_factory,
+    json_processor_factory=old_json_factory,
+)
+
+
+def _cython():
+    if cy_processors is None or not hasattr(cy_processors, "bytes_to_int"):
+        pytest.skip("compiled extension without the MySQL processors")
+    return types.SimpleNamespace(
+        bytes_to_int=cy_processors.bytes_to_int,
+        timedelta_to_time=cy_processors.timedelta_to_time,
+        str_to_set=cy_processors.str_to_set,
+        bitmask_to_set_processor_factory=lambda bitmap: (
+            cy_processors.BitmaskSetResultProcessor(bitmap).process
+        ),
+        json_processor_factory=lambda deserializer: (
+            cy_processors.JSONResultProcessor(deserializer).process
+        ),
+    )
+
+
+@pytest.fixture(params=["python", "cython", "selected"])
+def impl(request):
+    if request.param == "python":
+        return _py_processors
+    elif request.param == "cython":
+        return _cython()
+    else:
+        return processors
+
+
+def _outcome(fn, value):
+    try:
+        return fn(value)
+    except Exception as err:
+        return type(err)
+
+
+def _check(old, new, values):
+    for value in values:
+        # str_to_set() changes the sets it's given, so each gets a copy
+        old_value = set(value) if isinstance(value, set) else value
+        new_value = set(value) if isinstance(value, set) else value
+        assert _outcome(new, new_value) == _outcome(old, old_value), value
+
+
+def test_bit(impl):
+    values = [None, b"", b"\x00", b"\x01", b"\xff\x00", b"\x01\x02\x03\x04\x05"]
+    _check(OLD.bytes_to_int, impl.bytes_to_int, values)
+    assert impl.bytes_to_int(b"\x01\x00") == 256
+
+
+def test_time(impl):
+    values = [
+        None,
+        datetime.timedelta(0),
+        datetime.timedelta(hours=23, minutes=59, seconds=59, microseconds=999999),
+        datetime.timedelta(seconds=5, microseconds=1),
+        datetime.timedelta(days=-1, hours=3),
+        datetime.timedelta(seconds=-1),
+        datetime.timedelta(days=2, hours=1),
+    ]
+    _check(OLD.timedelta_to_time, impl.timedelta_to_time, values)
+    assert impl.timedelta_to_time(
+        datetime.timedelta(hours=1, microseconds=5)
+    ) == datetime.time(1, 0, 0, 5)
+
+
+def test_set(impl):
+    values = [
+        None,
+        "",
+        "a",
+        "a,b",
+        ",a,,b,",
+        "a,a",
+        # as returned by mysql-connector-python
+        set(),
+        {""},
+        {"a", "", "b"},
+    ]
+    _check(OLD.str_to_set, impl.str_to_set, values)
+    assert impl.str_to_set(",a,,b,") == {"a", "b"}
+
+
+def test_bitmask_set(impl):
+    bitmap = {"a": 1, "b": 2, "c": 4, 1: "a", 2: "b", 4: "c"}
+    old = OLD.bitmask_to_set_processor_factory(bitmap)
+    new = impl.bitmask_to_set_processor_factory(bitmap)
+    # unknown bits raise KeyError in all versions
+    _check(old, new, [None, 0, 1, 5, 7, "6", b"3", 8, 9, -1])
+    assert new(5) == {"a", "c"}
+
+
+def test_json(impl):
+    deserializer = json.loads
+    old = OLD.json_processor_factory(deserializer)
+    new = impl.json_processor_factory(deserializer)
+    _check(old, new, [None, "null", '{"a": [1, 2]}', b'{"a": "\xc3\xa9"}', b"x"])
+    assert new(b'"\xc3\xa9"') == "é"
+
+
+@pytest.mark.skipif(not HAS_CYEXTENSION, reason="no compiled extension")
+def test_fallback_to_python(monkeypatch):
+    """A compiled extension built before the MySQL processors were added
+    gets the Python version of each of them."""
+
+    old_extension = types.ModuleType("sqlalchemy.cyextension.processors")
+    for name in (
+        "DecimalResultProcessor",
+        "int_to_boolean",
+        "str_to_date",
+        "str_to_datetime",
+        "str_to_time",
+        "to_float",
+        "to_str",
+    ):
+        setattr(old_extension, name, getattr(cy_processors, name))
+
+    import sqlalchemy.cyextension
+
+    monkeypatch.setitem(sys.modules, old_extension.__name__, old_extension)
+    monkeypatch.setattr(sqlalchemy.cyextension, "processors", old_extension)
+
+    # a separate copy of engine/processors.py, so that the module in use is
+    # left as it is
+    spec = importlib.util.spec_from_file_location(
+        "sqlalchemy.engine._processors_fallback", processors.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.bytes_to_int is _py_processors.bytes_to_int
+    assert module.str_to_set is _py_processors.str_to_set
+    assert module.timedelta_to_time is _py_processors.timedelta_to_time
+    assert (
+        module.bitmask_to_set_processor_factory
+        is _py_processors.bitmask_to_set_processor_factory
+    )
+    assert module.json_processor_factory is _py_processors.json_processor_factory
+    assert module.str_to_date is cy_processors.str_to_date
+
+    assert module.bitmask_to_set_processor_factory({1: "a"})(1) == {"a"}
+    assert module.json_processor_factory(json.loads)(b"[1]") == [1]
+
+
+@pytest.mark.skipif(not HAS_CYEXTENSION, reason="no compiled extension")
+def test_compiled_selected():
+    if not hasattr(cy_processors, "bytes_to_int"):
+        pytest.skip("compiled extension without the MySQL processors")
+    assert processors.bytes_to_int is cy_processors.bytes_to_int
+    assert processors.str_to_set is cy_processors.str_to_set
+    assert processors.timedelta_to_time is cy_processors.timedelta_to_time
@@ -0,0 +1,176 @@
+"""ReplicaRouter choosing between a primary and replica engines."""
+
+import sqlite3
+import time
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import exc
+from sqlalchemy import text
+from sqlalchemy.engine import ReplicaRouter
+from sqlalchemy.pool import QueuePool
+
+
+def _engine(path):
+    return create_engine(f"sqlite:///{path}", poolclass=QueuePool)
+
+
+def _broken_engine():
+    def creator():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    return create_engine("sqlite://", creator=creator, poolclass=QueuePool)
+
+
+@pytest.fixture
+def primary(tmp_path):
+    return _engine(tmp_path / "primary.db")
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    return [_engine(tmp_path / f"replica{i}.db") for i in range(2)]
+
+
+def _database(conn):
+    return conn.engine.url.database.rsplit("/", 1)[-1]
+
+
+def test_writes_go_to_primary(primary, replicas):
+    router = ReplicaRouter(primary, replicas)
+    assert router.get_engine() is primary
+    with router.connect() as conn:
+        assert conn.engine is primary
+
+
+def test_least_outstanding(primary, replicas):
+    router = ReplicaRouter(primary, replicas)
+
+    # ties rotate among replicas
+    engines = [router.get_engine(readonly=True) for _ in range(4)]
+    assert set(engines[:2]) == set(replicas)
+    assert engines[2:] == engines[:2]
+
+    with replicas[0].connect():
+        assert [router.get_engine(readonly=True) for _ in range(3)] == [
+            replicas[1]
+        ] * 3
+
+        with router.connect(readonly=True) as conn:
+            assert conn.engine is replicas[1]
+            with replicas[1].connect():
+                # replicas[1] has two connections checked out
+                assert router.get_engine(readonly=True) is replicas[0]
+
+
+def test_outstanding_counts(primary, replicas):
+    router = ReplicaRouter(primary, replicas[:1])
+    (state,) = router._states
+
+    first = router.connect(readonly=True)
+    second = router.connect(readonly=True)
+    assert state.outstanding == 2
+    first.close()
+    assert state.outstanding == 1
+    second.close()
+    assert state.outstanding == 0
+
+    # invalidated connections are checked in as well
+    conn = router.connect(readonly=True)
+    conn.invalidate()
+    conn.close()
+    assert state.outstanding == 0
+
+
+def test_failed_replica_excluded(primary, replicas):
+    broken = _broken_engine()
+    router = ReplicaRouter(primary, [broken, replicas[0]], retry_interval=0.2)
+
+    for _ in range(3):
+        with router.connect(readonly=True) as conn:
+            # another replica is used rather than the primary
+            assert conn.engine is replicas[0]
+    assert router._states[0].down_until > time.monotonic()
+    assert router.get_engine(readonly=True) is replicas[0]
+
+    with replicas[0].connect():
+        # still excluded, although replicas[0] is busier
+        assert router.get_engine(readonly=True) is replicas[0]
+        time.sleep(0.25)
+        assert router.get_engine(readonly=True) is broken
+
+
+def test_all_replicas_failed(primary):
+    router = ReplicaRouter(
+        primary, [_broken_engine(), _broken_engine()], retry_interval=0
+    )
+    with router.connect(readonly=True) as conn:
+        assert conn.engine is primary
+
+
+def test_handle_error_on_disconnect(primary, replicas, monkeypatch):
+    router = ReplicaRouter(primary, replicas[:1])
+
+    with router.connect(readonly=True) as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("select * from missing"))
+    # not a disconnect
+    assert router.get_engine(readonly=True) is replicas[0]
+
+    monkeypatch.setattr(
+        replicas[0].dialect, "is_disconnect", lambda e, conn, cursor: True
+    )
+    with router.connect(readonly=True) as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("select * from missing"))
+    assert router.get_engine(readonly=True) is primary
+
+
+def test_max_lag(primary, replicas):
+    lags = {replicas[0]: 10.0, replicas[1]: 1.0}
+    checks = []
+
+    def lag_fn(conn):
+        checks.append(conn.engine)
+        return lags[conn.engine]
+
+    router = ReplicaRouter(
+        primary, replicas, max_lag=5, lag_fn=lag_fn, lag_check_interval=0.2
+    )
+    assert [router.get_engine(readonly=True) for _ in range(3)] == [
+        replicas[1]
+    ] * 3
+    assert sorted(checks, key=replicas.index) == replicas
+
+    # measured again once lag_check_interval has passed
+    lags[replicas[1]] = 6.0
+    assert router.get_engine(readonly=True) is replicas[1]
+    time.sleep(0.25)
+    assert router.get_engine(readonly=True) is primary
+    assert len(checks) == 4
+
+    # unknown lag doesn't rule out a replica
+    lags[replicas[1]] = None
+    time.sleep(0.25)
+    assert router.get_engine(readonly=True) is replicas[1]
+
+
+def test_lag_fn_error(primary, replicas):
+    fail = [True]
+
+    def lag_fn(conn):
+        if fail[0]:
+            1 / 0
+        return 0.0
+
+    router = ReplicaRouter(
+        primary, replicas[:1], max_lag=5, lag_fn=lag_fn, lag_check_interval=0.2
+    )
+    with router.connect(readonly=True) as conn:
+        assert conn.engine is primary
+    assert router.get_engine(readonly=True) is primary
+
+    fail[0] = False
+    time.sleep(0.25)
+    assert router.get_engine(readonly=True) is replicas[0]
@@ -0,0 +1,86 @@
+"""Engine statistics collected with create_engine(collect_stats=True)."""
+
+from sqlalchemy import column
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+
+def _statement(i):
+    return select(column("x")).select_from(text(f"(select {i} as x)"))
+
+
+def test_hits_and_misses():
+    engine = create_engine("sqlite://", collect_stats=True)
+    stats = engine.stats
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            conn.execute(_statement(1))
+        conn.execute(_statement(2))
+        conn.exec_driver_sql("select 1")
+
+    assert stats.compiled_cache_hits == 2
+    assert stats.compiled_cache_misses == 2
+    assert stats.compiled_cache_evictions == 0
+    assert stats.compile_time > 0
+
+
+def test_evictions():
+    engine = create_engine("sqlite://", collect_stats=True, query_cache_size=2)
+
+    with engine.connect() as conn:
+        for i in range(4):
+            conn.execute(_statement(i))
+
+        # pruned back to the cache size once it grew past size * 1.5
+        assert len(engine._compiled_cache) == 2
+        assert engine.stats.compiled_cache_evictions == 2
+
+        conn.execute(_statement(3))
+    assert engine.stats.compiled_cache_hits == 1
+    assert engine.stats.compiled_cache_misses == 4
+
+
+def test_uncached():
+    engine = create_engine("sqlite://", collect_stats=True, query_cache_size=0)
+
+    with engine.connect() as conn:
+        conn.execute(_statement(1))
+        conn.execute(_statement(1))
+
+    assert engine.stats.uncached_compilations == 2
+    assert engine.stats.compiled_cache_hits == 0
+    assert engine.stats.snapshot()["compiled_cache_evictions"] is None
+
+
+def test_export():
+    engine = create_engine(
+        "sqlite://", collect_stats=True, poolclass=QueuePool, pool_size=3
+    )
+
+    with engine.connect() as conn:
+        conn.execute(_statement(1))
+        conn.execute(_statement(1))
+
+    exported = []
+    engine.stats.export(exported.append, reset=True)
+    (data,) = exported
+    assert data["dialect"] == "sqlite+pysqlite"
+    assert data["compiled_cache_size"] == 1
+    assert data["compiled_cache_hits"] == 1
+    assert data["compiled_cache_misses"] == 1
+    assert data["compiled_cache_evictions"] == 0
+    assert data["pool"]["checkouts"] == 1
+    assert data["pool"]["connects"] == 1
+    assert data["pool"]["size"] == 3
+    assert data["pool"]["checkedin"] == 1
+    assert data["pool"]["checkedout"] == 0
+
+    # counters start over after a reset
+    engine.stats.export(exported.append)
+    assert exported[1]["compiled_cache_hits"] == 0
+    assert exported[1]["compiled_cache_misses"] == 0
+    assert exported[1]["pool"]["checkouts"] == 0
+    assert exported[1]["compiled_cache_size"] == 1
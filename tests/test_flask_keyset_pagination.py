@@ -0,0 +1,150 @@
+"""Keyset pagination with SQLAlchemy.keyset_paginate()."""
+
+import base64
+import datetime
+import decimal
+
+import pytest
+import sqlalchemy as sa
+from flask import Flask
+from flask.json.tag import TaggedJSONSerializer
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.pagination import _decode_cursor
+from flask_sqlalchemy.pagination import _encode_cursor
+from werkzeug.exceptions import NotFound
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    return app
+
+
+@pytest.fixture
+def db(app):
+    db = SQLAlchemy(app)
+
+    with app.app_context():
+        yield db
+
+
+@pytest.fixture
+def Item(db):
+    class Item(db.Model):
+        id = sa.Column(sa.Integer, primary_key=True)
+        group = sa.Column(sa.Integer)
+
+    db.create_all()
+    db.session.add_all([Item(id=i, group=i % 3) for i in range(1, 11)])
+    db.session.commit()
+    return Item
+
+
+def _cursor(values):
+    data = TaggedJSONSerializer().dumps(values).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def test_pages(db, Item):
+    page = db.keyset_paginate(sa.select(Item), key=Item.id, per_page=4)
+    ids = [item.id for item in page]
+
+    while page.has_next:
+        page = db.keyset_paginate(
+            sa.select(Item), key=Item.id, cursor=page.next_cursor, per_page=4
+        )
+        ids.extend(item.id for item in page)
+
+    assert ids == list(range(1, 11))
+
+
+def test_mixed_direction_key(db, Item):
+    key = (sa.desc(Item.group), Item.id)
+    page = db.keyset_paginate(sa.select(Item), key=key, per_page=4)
+    assert [item.id for item in page] == [2, 5, 8, 1]
+
+    page = db.keyset_paginate(
+        sa.select(Item), key=key, cursor=page.next_cursor, per_page=4
+    )
+    assert [item.id for item in page] == [4, 7, 10, 3]
+
+
+def test_datetime_key(db):
+    class Post(db.Model):
+        id = sa.Column(sa.Integer, primary_key=True)
+        created = sa.Column(sa.DateTime)
+
+    db.create_all()
+    start = datetime.datetime(2024, 1, 1, 12)
+    db.session.add_all(
+        # sub-second timestamps, several posts in the same second
+        Post(id=i, created=start + datetime.timedelta(microseconds=i * 100))
+        for i in range(1, 11)
+    )
+    db.session.commit()
+
+    key = (sa.desc(Post.created), sa.desc(Post.id))
+    page = db.keyset_paginate(sa.select(Post), key=key, per_page=3)
+    ids = [post.id for post in page]
+    assert ids == [10, 9, 8]
+
+    while page.has_next:
+        page = db.keyset_paginate(
+            sa.select(Post), key=key, cursor=page.next_cursor, per_page=3
+        )
+        ids.extend(post.id for post in page)
+
+    assert ids == list(range(10, 0, -1))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(2024, 1, 1, 12, 0, 0, 800),
+        datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        datetime.datetime(
+            2024, 1, 1, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+        ),
+        datetime.date(2024, 1, 1),
+        datetime.time(12, 0, 0, 800),
+        decimal.Decimal("1.10"),
+        decimal.Decimal("12345678901234567890.000000000001"),
+        1.5,
+        "a",
+        None,
+        b"\x00",
+    ],
+)
+def test_cursor_round_trip(value):
+    (decoded,) = _decode_cursor(_encode_cursor([value]), 1)
+    assert type(decoded) is type(value)
+    assert decoded == value
+    assert str(decoded) == str(value)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        base64.urlsafe_b64encode(b"\xff").decode(),
+        base64.urlsafe_b64encode(b"{").decode(),
+        _cursor(3),
+        _cursor([]),
+        _cursor([1, 2]),
+        _cursor([[1]]),
+        _cursor([(1, 2)]),
+        _cursor([{"a": 1}]),
+        base64.urlsafe_b64encode(b'[{" de": "abc"}]').decode(),
+        base64.urlsafe_b64encode(b'[{" dt": "abc"}]').decode(),
+    ],
+)
+def test_invalid_cursor(db, Item, cursor):
+    with pytest.raises(NotFound):
+        db.keyset_paginate(sa.select(Item), key=Item.id, cursor=cursor)
+
+    page = db.keyset_paginate(
+        sa.select(Item), key=Item.id, cursor=cursor, error_out=False
+    )
+    assert page.cursor is None
+    assert page.items[0].id == 1
@@ -0,0 +1,209 @@
+"""The count_mode argument of SQLAlchemy.paginate(), and the row estimates of the
+MySQL dialect it uses."""
+
+import pytest
+import sqlalchemy as sa
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy import pagination
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import with_loader_criteria
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = True
+    return app
+
+
+@pytest.fixture
+def db(app):
+    db = SQLAlchemy(app)
+
+    with app.app_context():
+        yield db
+
+
+@pytest.fixture
+def Item(db):
+    class Item(db.Model):
+        id = sa.Column(sa.Integer, primary_key=True)
+        group = sa.Column(sa.Integer)
+
+    db.create_all()
+    db.session.add_all([Item(id=i, group=i % 3) for i in range(1, 11)])
+    db.session.commit()
+    return Item
+
+
+@pytest.fixture
+def counts(db):
+    """The number of count queries executed."""
+    counts = []
+
+    @sa.event.listens_for(db.engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement:
+            counts.append(statement)
+
+    yield counts
+    sa.event.remove(db.engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pagination.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _total(db, select, **kw):
+    return db.paginate(select, per_page=3, count_mode="cached", **kw).total
+
+
+def test_cached(db, Item, counts, clock):
+    select = sa.select(Item)
+    assert _total(db, select) == 10
+    assert _total(db, sa.select(Item)) == 10
+    assert len(counts) == 1
+
+    # other parameters are counted separately
+    assert _total(db, select.where(Item.group == 1)) == 4
+    assert _total(db, select.where(Item.group == 2)) == 3
+    assert _total(db, select.where(Item.group == 1)) == 4
+    assert len(counts) == 3
+
+    # counted again once expired
+    db.session.execute(sa.delete(Item).where(Item.id == 10))
+    clock[0] += 59
+    assert _total(db, select) == 10
+    assert len(counts) == 3
+    clock[0] += 2
+    assert _total(db, select) == 9
+    assert len(counts) == 4
+
+
+def test_cached_invalidated_on_commit(db, Item, counts, clock):
+    assert _total(db, sa.select(Item)) == 10
+    db.session.add(Item(id=11, group=0))
+    db.session.commit()
+    assert _total(db, sa.select(Item)) == 11
+    assert len(counts) == 2
+
+
+def test_invalidate_count_cache(db, Item, counts, clock):
+    select = sa.select(Item)
+    assert _total(db, select) == 10
+
+    # not seen by models_committed
+    db.session.execute(sa.insert(Item).values(id=11, group=0))
+    db.session.commit()
+    assert _total(db, select) == 10
+
+    db.invalidate_count_cache("other")
+    assert _total(db, select) == 10
+    db.invalidate_count_cache("item")
+    assert _total(db, select) == 11
+    assert len(counts) == 2
+
+    db.session.execute(sa.insert(Item).values(id=12, group=0))
+    db.session.commit()
+    db.invalidate_count_cache()
+    assert _total(db, select) == 12
+    assert len(counts) == 3
+
+
+def test_estimate_falls_back_to_count(db, Item, counts):
+    # SQLite has no row estimates
+    page = db.paginate(sa.select(Item), per_page=3, count_mode="estimate")
+    assert page.total == 10
+    assert len(counts) == 1
+
+    union = sa.union_all(
+        sa.select(Item.id).where(Item.group == 1),
+        sa.select(Item.id).where(Item.group == 2),
+    )
+    page = db.paginate(union, per_page=3, count_mode="estimate")
+    assert page.total == 7
+    assert len(counts) == 2
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _Connection:
+    """Answer the queries of the MySQL dialect's estimate_row_count()."""
+
+    dialect = mysql.dialect()
+    dialect.default_schema_name = "test"
+
+    def __init__(self):
+        self.queries = []
+
+    def scalar(self, statement, parameters):
+        self.queries.append(("table_rows", parameters["name"]))
+        return 1000
+
+    def exec_driver_sql(self, statement):
+        self.queries.append(("explain", statement))
+        return _Result([{"id": 1, "rows": 200, "filtered": 10.0, "Extra": None}])
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Entry(Base):
+    __tablename__ = "entry"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    type: Mapped[str]
+    hidden: Mapped[bool] = mapped_column(default=False)
+
+    __mapper_args__ = {"polymorphic_on": "type", "polymorphic_identity": "entry"}
+
+
+class Note(Entry):
+    __mapper_args__ = {"polymorphic_identity": "note"}
+
+
+def _estimate(statement):
+    conn = _Connection()
+    estimate = conn.dialect.estimate_row_count(conn, statement)
+    return estimate, [kind for kind, _ in conn.queries]
+
+
+def test_mysql_estimate():
+    table = Entry.__table__
+    assert _estimate(sa.select(table)) == (1000, ["table_rows"])
+    assert _estimate(sa.select(Entry)) == (1000, ["table_rows"])
+    assert _estimate(sa.select(Entry).where(Entry.id > 5)) == (20, ["explain"])
+    assert _estimate(sa.select(table).limit(5)) == (20, ["explain"])
+
+
+def test_mysql_estimate_compile_time_criteria():
+    # criteria added when the ORM statement is compiled rule out the table's
+    # row count
+    assert _estimate(sa.select(Note)) == (20, ["explain"])
+    statement = sa.select(Entry).options(
+        with_loader_criteria(Entry, Entry.hidden == sa.false())
+    )
+    assert _estimate(statement) == (20, ["explain"])
+
+
+def test_mysql_estimate_compound_select():
+    union = sa.union(sa.select(Entry.id), sa.select(Note.id))
+    assert _estimate(union) == (None, [])
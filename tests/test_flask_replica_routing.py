@@ -0,0 +1,95 @@
+"""Routing of Flask-SQLAlchemy session reads between a primary and replicas."""
+
+import pytest
+import sqlalchemy as sa
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config["SQLALCHEMY_REPLICAS"] = {None: [f"sqlite:///{tmp_path / 'replica.db'}"]}
+    return app
+
+
+@pytest.fixture
+def db(app):
+    db = SQLAlchemy(app)
+
+    with app.app_context():
+        yield db
+
+
+@pytest.fixture
+def User(db):
+    class User(db.Model):
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String)
+
+    db.create_all()
+
+    # The replica has never received any of the primary's writes.
+    (replica,) = db.routers[None].replicas
+    User.metadata.create_all(replica)
+    return User
+
+
+def _database(db, statement, **kw):
+    return db.session.get_bind(clause=statement, **kw).url.database
+
+
+def test_select_goes_to_replica(db, User):
+    assert _database(db, sa.select(User)).endswith("replica.db")
+    assert _database(db, sa.insert(User)).endswith("primary.db")
+    assert _database(db, sa.select(User).with_for_update()).endswith("primary.db")
+
+
+def test_readonly_overrides(db, User):
+    assert _database(db, sa.text("select 1"), readonly=True).endswith("replica.db")
+    statement = sa.select(User).execution_options(readonly=False)
+    assert _database(db, statement).endswith("primary.db")
+
+
+def test_reads_after_write_stay_on_primary(db, User):
+    db.session.add(User(id=1, name="a"))
+    db.session.flush()
+    assert db.session.scalars(sa.select(User.name)).all() == ["a"]
+    db.session.commit()
+    assert db.session.scalars(sa.select(User.name)).all() == []
+
+
+def test_refresh_after_commit_uses_primary(db, User):
+    user = User(id=1, name="a")
+    db.session.add(user)
+    db.session.commit()
+
+    # Expired by the commit; the replica doesn't have the row.
+    assert user.name == "a"
+    db.session.commit()
+
+    db.session.expire(user)
+    assert db.session.get(User, 1) is user
+    assert user.name == "a"
+
+
+def test_unavailable_replica(tmp_path):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config["SQLALCHEMY_REPLICAS"] = {
+        None: [f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"]
+    }
+    db = SQLAlchemy(app)
+
+    class User(db.Model):
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(id=1))
+        db.session.commit()
+
+        # The replica can't be opened, so reads fall back to the primary.
+        assert db.session.scalars(sa.select(User.id)).all() == [1]
+        assert _database(db, sa.select(User)).endswith("primary.db")
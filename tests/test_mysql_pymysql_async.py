@@ -0,0 +1,111 @@
+"""The mysql+pymysql_async dialect through create_async_engine(), against the
+stand-in server of benchmarks/fakemysql.py."""
+
+import asyncio
+
+import pytest
+from fakemysql import FakeServer
+from pymysql.constants import FIELD_TYPE
+
+from sqlalchemy import exc
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+STRING = FIELD_TYPE.VAR_STRING
+
+# the queries of the dialect's first connect
+VARIABLES = {
+    "SELECT VERSION()": (STRING, b"8.0.99-stand-in"),
+    "SELECT DATABASE()": (STRING, b"test"),
+    "SELECT @@transaction_isolation": (STRING, b"REPEATABLE-READ"),
+    "SELECT @@sql_mode": (STRING, b"STRICT_TRANS_TABLES"),
+    "SELECT @@lower_case_table_names": (FIELD_TYPE.LONG, b"0"),
+}
+
+COLUMNS = [("id", FIELD_TYPE.LONG, 63), ("name", STRING, 45)]
+ROWS = [[b"%d" % i, b"name %d" % i] for i in range(1, 1001)]
+
+
+def handler(sql):
+    if sql in VARIABLES:
+        type_code, value = VARIABLES[sql]
+        charset = 63 if type_code == FIELD_TYPE.LONG else 45
+        return [("rs", [(sql[7:], type_code, charset)], [[value]])]
+    if sql == "select rows":
+        return [("rs", COLUMNS, ROWS)]
+    if sql.startswith("select name"):
+        return [("rs", [("name", STRING, 45)], [[sql.split("=", 1)[1].encode()]])]
+    if sql.startswith("insert"):
+        return [("ok", 1, 42)]
+    if sql.startswith("fail"):
+        return [("err", 1064, "You have an error in your SQL syntax")]
+    return [("ok", 0)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+def _run(server, test):
+    async def main():
+        engine = create_async_engine(
+            f"mysql+pymysql_async://u@127.0.0.1:{server.port}/test"
+        )
+        try:
+            await test(engine)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+def test_execute(server):
+    async def test(engine):
+        async with engine.connect() as conn:
+            result = await conn.execute(text("select rows"))
+            rows = result.all()
+            assert len(rows) == 1000
+            assert rows[0] == (1, "name 1")
+
+            result = await conn.execute(
+                text("select name=:name"), {"name": "it's"}
+            )
+            assert result.scalar() == "'it\\'s'"
+
+            result = await conn.execute(text("insert into t values (1)"))
+            assert result.rowcount == 1
+            assert result.lastrowid == 42
+            await conn.commit()
+
+        assert engine.dialect.server_version_info == (8, 0, 99)
+
+    _run(server, test)
+
+
+def test_stream(server):
+    async def test(engine):
+        async with engine.connect() as conn:
+            result = await conn.stream(text("select rows"))
+            ids = []
+            async for partition in result.partitions(100):
+                ids.extend(row.id for row in partition)
+            assert ids == list(range(1, 1001))
+
+            # the connection can be used again once the stream is consumed
+            result = await conn.execute(text("select rows"))
+            assert len(result.all()) == 1000
+
+    _run(server, test)
+
+
+def test_error(server):
+    async def test(engine):
+        async with engine.connect() as conn:
+            with pytest.raises(exc.ProgrammingError, match="1064"):
+                await conn.execute(text("fail"))
+            await conn.rollback()
+            result = await conn.execute(text("select rows"))
+            assert result.first() == (1, "name 1")
+
+    _run(server, test)
@@ -0,0 +1,258 @@
+"""Batched lazy loading (lazy="batch", batchload(), the batch_lazyload
+execution option) and the detect_n_plus_one execution option."""
+
+import warnings
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKeyConstraint
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class User(Base):
+    __tablename__ = "user"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    posts = relationship("Post", back_populates="author", order_by="Post.id.desc()")
+
+
+class Post(Base):
+    __tablename__ = "post"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id = mapped_column(ForeignKey("user.id"))
+    author = relationship("User", back_populates="posts", lazy="batch")
+
+
+class Region(Base):
+    __tablename__ = "region"
+
+    country: Mapped[str] = mapped_column(primary_key=True)
+    code: Mapped[str] = mapped_column(primary_key=True)
+
+
+class Office(Base):
+    __tablename__ = "office"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["country", "region_code"], ["region.country", "region.code"]
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    country: Mapped[str]
+    region_code: Mapped[str]
+    region = relationship("Region", lazy="batch")
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def statements(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append((statement, parameters))
+
+    return statements
+
+
+def _add_users(engine, count, posts_per_user=2):
+    with Session(engine) as session:
+        for i in range(count):
+            user = User(id=i + 1, name=f"u{i + 1}")
+            session.add(user)
+            for j in range(posts_per_user):
+                session.add(Post(id=i * posts_per_user + j + 1, author=user))
+        session.add(Post(id=count * posts_per_user + 1, author=None))
+        session.commit()
+
+
+def test_many_to_one_loads_all_siblings(engine, statements):
+    _add_users(engine, 10)
+
+    with Session(engine) as session:
+        posts = session.scalars(select(Post).order_by(Post.id)).all()
+        statements.clear()
+
+        assert posts[0].author.name == "u1"
+        assert len(statements) == 1
+        assert " IN " in statements[0][0]
+
+        assert [p.author and p.author.name for p in posts[:4]] == [
+            "u1",
+            "u1",
+            "u2",
+            "u2",
+        ]
+        assert posts[-1].author is None
+        assert len(statements) == 1
+
+
+def test_batchload_option_one_to_many(engine, statements):
+    _add_users(engine, 10, posts_per_user=3)
+
+    with Session(engine) as session:
+        users = session.scalars(
+            select(User).options(batchload(User.posts)).order_by(User.id)
+        ).all()
+        statements.clear()
+
+        assert [p.id for p in users[0].posts] == [3, 2, 1]
+        assert len(statements) == 1
+        assert [[p.id for p in u.posts] for u in users[1:3]] == [[6, 5, 4], [9, 8, 7]]
+        assert len(statements) == 1
+
+
+def test_siblings_populated_as_committed(engine, statements):
+    _add_users(engine, 3)
+
+    with Session(engine) as session:
+        users = session.scalars(
+            select(User).options(batchload(User.posts)).order_by(User.id)
+        ).all()
+        users[0].posts
+
+        for user in users[1:]:
+            state = inspect(user)
+            assert "posts" in state.dict
+            assert not state.attrs.posts.history.has_changes()
+        assert not session.dirty
+
+        users[1].posts.append(Post(id=100))
+        session.flush()
+        assert session.get(Post, 100).author_id == 2
+
+
+def test_loaded_and_expired_siblings(engine, statements):
+    _add_users(engine, 4)
+
+    with Session(engine) as session:
+        users = session.scalars(
+            select(User).options(batchload(User.posts)).order_by(User.id)
+        ).all()
+        set_committed_value(users[1], "posts", [])
+        statements.clear()
+
+        # users[1] has the attribute already, so only the others are loaded
+        users[0].posts
+        assert len(statements) == 1
+        assert sorted(statements[0][1]) == [1, 3, 4]
+        assert users[1].posts == []
+
+        session.expire(users[2], ["posts"])
+        statements.clear()
+        assert [p.id for p in users[2].posts] == [6, 5]
+        assert len(statements) == 1
+
+
+def test_chunks_of_500(engine, statements):
+    _add_users(engine, 1201, posts_per_user=1)
+
+    with Session(engine) as session:
+        posts = session.scalars(select(Post)).all()
+        statements.clear()
+
+        posts[0].author
+        assert len(statements) == 3
+        assert [len(parameters) for _, parameters in statements] == [500, 500, 201]
+        assert all("author" in inspect(p).dict for p in posts if p.author_id)
+
+
+def test_batch_lazyload_execution_option(engine, statements):
+    _add_users(engine, 5)
+
+    with Session(engine) as session:
+        users = session.scalars(
+            select(User).execution_options(batch_lazyload=True)
+        ).all()
+        statements.clear()
+
+        # applies to the lazy loads that the option's lazy loads trigger
+        assert all(p.author is u for u in users for p in u.posts)
+        assert len(statements) == 1
+
+
+def test_composite_key_falls_back(engine, statements):
+    assert Office.region.property.strategy._batch_clause is None
+
+    with Session(engine) as session:
+        session.add_all(
+            [Region(country="fr", code=str(i)) for i in range(3)]
+            + [Office(id=i, country="fr", region_code=str(i)) for i in range(3)]
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        offices = session.scalars(select(Office).order_by(Office.id)).all()
+        statements.clear()
+
+        assert [o.region.code for o in offices] == ["0", "1", "2"]
+        assert len(statements) == 3
+        assert all(" IN " not in statement for statement, _ in statements)
+
+
+def test_detect_n_plus_one(engine):
+    _add_users(engine, 3)
+    detected = []
+
+    with Session(engine) as session:
+        event.listen(
+            session,
+            "n_plus_one_detected",
+            lambda *args: detected.append(args),
+        )
+        users = session.scalars(
+            select(User).execution_options(detect_n_plus_one=True).order_by(User.id)
+        ).all()
+
+        users[0].posts
+        assert not detected
+
+        with pytest.warns(exc.SAWarning, match="N\\+1 query pattern"):
+            users[1].posts
+        assert detected == [(session, users[1], User.posts.property)]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            users[2].posts
+        assert len(detected) == 1
+
+
+def test_detect_n_plus_one_not_for_batch(engine):
+    _add_users(engine, 3)
+
+    with Session(engine) as session:
+        users = session.scalars(
+            select(User)
+            .options(batchload(User.posts))
+            .execution_options(detect_n_plus_one=True)
+        ).all()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for user in users:
+                user.posts
@@ -0,0 +1,401 @@
+"""Session.flush() inserting pending objects of a single mapper directly with
+persistence.fast_insert_obj() rather than through the unit of work."""
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import JSON
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import persistence
+from sqlalchemy.orm import Session
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Message(Base):
+    __tablename__ = "message"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    body: Mapped[str]
+    channel: Mapped[int] = mapped_column(nullable=True)
+    sent: Mapped[int] = mapped_column(default=0)
+    extra = mapped_column(JSON(none_as_null=False), nullable=True)
+
+
+class Note(Base):
+    __tablename__ = "note"
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    txt: Mapped[str] = mapped_column(nullable=True)
+    created: Mapped[str] = mapped_column(server_default=text("'now'"))
+
+
+class Channel(Base):
+    __tablename__ = "channel"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    topics = relationship("Topic")
+
+
+class Topic(Base):
+    __tablename__ = "topic"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    channel_id = mapped_column(ForeignKey("channel.id"))
+
+
+class Author(Base):
+    __tablename__ = "author"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Book(Base):
+    __tablename__ = "book"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id = mapped_column(ForeignKey("author.id"), nullable=True)
+    author = relationship(Author)
+
+
+class Shelf(Base):
+    __tablename__ = "shelf"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    items = relationship("Item", back_populates="shelf")
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    shelf_id = mapped_column(ForeignKey("shelf.id"), nullable=True)
+    shelf = relationship(Shelf, back_populates="items")
+
+
+class Category(Base):
+    __tablename__ = "category"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id = mapped_column(ForeignKey("category.id"), nullable=True)
+    parent = relationship("Category", remote_side=id)
+
+
+class Versioned(Base):
+    __tablename__ = "versioned"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column()
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        fast_insert = []
+        event.listen(
+            session,
+            "after_flush",
+            lambda session, flush_context: fast_insert.append(
+                flush_context.fast_insert
+            ),
+        )
+        session.fast_insert = fast_insert
+        yield session
+
+
+def test_inserts_pending_objects(session):
+    messages = [Message(body=f"m{i}", channel=i % 3) for i in range(100)]
+    session.add_all(messages)
+    session.flush()
+
+    assert session.fast_insert == [True]
+    assert [m.id for m in messages] == list(range(1, 101))
+    assert all(inspect(m).persistent for m in messages)
+    assert not session.new
+    assert session.get(Message, 5) is messages[4]
+    assert messages[0].sent == 0
+
+    rows = session.execute(
+        select(Message.body, Message.channel, Message.sent).order_by(Message.id)
+    ).all()
+    assert rows == [(f"m{i}", i % 3, 0) for i in range(100)]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_same_as_unit_of_work(engine, monkeypatch, fast):
+    if not fast:
+        monkeypatch.setattr(persistence, "_fast_insert_mapper", lambda *arg: None)
+
+    with Session(engine) as session:
+        messages = [
+            Message(body="a"),
+            Message(id=7, body=func.lower("B"), sent=None),
+            Message(body="c", channel=3, extra={"k": [1]}),
+            Message(body="d", extra=None),
+        ]
+        session.add_all(messages)
+        session.commit()
+
+        assert all(inspect(m).expired_attributes for m in messages)
+        rows = session.execute(text("select * from message order by id")).all()
+        assert rows == [
+            (1, "a", None, 0, None),
+            (7, "b", None, 0, None),
+            (8, "c", 3, 0, '{"k": [1]}'),
+            (9, "d", None, 0, "null"),
+        ]
+
+
+def test_executemany(engine, session):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, parameters, context, executemany: (
+            statements.append((statement, executemany))
+        ),
+    )
+
+    session.add_all([Message(id=i, body=f"m{i}") for i in range(1, 101)])
+    session.flush()
+
+    assert session.fast_insert == [True]
+    assert statements == [
+        ("INSERT INTO message (id, body, channel, sent) VALUES (?, ?, ?, ?)", True)
+    ]
+
+
+def test_column_values(session):
+    session.add_all(
+        [
+            Message(id=1, body=func.upper("sql"), channel=None),
+            Message(id=2, body="none", extra=None),
+            Message(id=3, body="missing"),
+        ]
+    )
+    session.flush()
+
+    assert session.fast_insert == [True]
+    session.expire_all()
+    assert session.get(Message, 1).body == "SQL"
+    rows = session.execute(
+        text("select id, channel, extra from message order by id")
+    ).all()
+    # JSON(none_as_null=False) evaluates None, so it's sent as JSON null
+    assert rows == [(1, None, None), (2, None, "null"), (3, None, None)]
+
+
+def test_mapper_events_and_eager_defaults(session):
+    calls = []
+
+    @event.listens_for(Note, "before_insert")
+    def before_insert(mapper, connection, target):
+        calls.append(("before", target.id))
+        target.txt = (target.txt or "") + "!"
+
+    @event.listens_for(Note, "after_insert")
+    def after_insert(mapper, connection, target):
+        calls.append(("after", target.id))
+
+    try:
+        notes = [Note(), Note(id=10, txt="a")]
+        session.add_all(notes)
+        session.flush()
+    finally:
+        event.remove(Note, "before_insert", before_insert)
+        event.remove(Note, "after_insert", after_insert)
+
+    assert session.fast_insert == [True]
+    assert calls == [("before", None), ("before", 10), ("after", 1), ("after", 10)]
+    assert [(n.id, n.txt) for n in notes] == [(1, "!"), (10, "a!")]
+    assert "created" in inspect(notes[0]).dict
+    assert notes[0].created == "now"
+
+
+def test_identity_conflict(session):
+    session.add(Message(id=1, body="a"))
+    session.commit()
+    existing = session.get(Message, 1)
+
+    session.add(Message(id=1, body="b"))
+    with pytest.warns(exc.SAWarning, match="conflicts with persistent instance"):
+        with pytest.raises(exc.IntegrityError):
+            session.flush()
+    assert inspect(existing).persistent
+
+
+def test_update_and_rollback_after_fast_insert(session):
+    message = Message(body="a")
+    session.add(message)
+    session.commit()
+
+    message.body = "b"
+    session.add(Message(body="c"))
+    session.flush()
+    # the dirty object makes this flush go through the unit of work
+    assert session.fast_insert == [True, False]
+    assert session.scalars(select(Message.body).order_by(Message.id)).all() == [
+        "b",
+        "c",
+    ]
+
+    pending = Message(body="d")
+    session.add(pending)
+    session.flush()
+    assert session.fast_insert[-1] is True
+    session.rollback()
+    assert inspect(pending).transient
+    assert session.scalars(select(Message.body)).all() == ["a"]
+
+
+@pytest.mark.parametrize(
+    "make_objects",
+    [
+        pytest.param(lambda: [Message(body="a"), Note()], id="two mappers"),
+        pytest.param(lambda: [Channel(topics=[Topic()])], id="relationship"),
+        pytest.param(lambda: [Channel()], id="relationship, no related"),
+        pytest.param(lambda: [Versioned()], id="version counter"),
+        pytest.param(
+            lambda: [Book(), Book(author=Author())], id="many-to-one, pending"
+        ),
+        pytest.param(
+            lambda: [Category(parent=Category())], id="many-to-one, same mapper"
+        ),
+    ],
+)
+def test_unit_of_work_used(session, make_objects):
+    objects = make_objects()
+    session.add_all(objects)
+    session.flush()
+
+    assert session.fast_insert == [False]
+    assert all(inspect(obj).persistent for obj in objects)
+
+
+def test_many_to_one_foreign_key(session):
+    session.add(Author(id=1))
+    session.flush()
+
+    books = [Book(author_id=1), Book()]
+    session.add_all(books)
+    session.flush()
+
+    assert session.fast_insert == [True, True]
+    assert books[0].author is session.get(Author, 1)
+    assert books[1].author is None
+
+
+def test_flush_objects_uses_unit_of_work(session):
+    messages = [Message(body="a"), Message(body="b")]
+    session.add_all(messages)
+    session.flush([messages[0]])
+
+    assert session.fast_insert == [False]
+    assert inspect(messages[0]).persistent
+    assert inspect(messages[1]).pending
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_many_to_one_set(engine, monkeypatch, fast):
+    if not fast:
+        monkeypatch.setattr(persistence, "_fast_insert_mapper", lambda *arg: None)
+
+    with Session(engine) as session:
+        session.add_all([Author(id=1), Author(id=2)])
+        session.commit()
+        # its key is loaded again
+        author = session.get(Author, 2)
+        session.expire(author)
+
+        books = [
+            Book(id=1, author=session.get(Author, 1)),
+            Book(id=2, author=author),
+            Book(id=3, author=None, author_id=2),
+            Book(id=4, author_id=1),
+        ]
+        session.add_all(books)
+        session.flush()
+
+        assert [book.author_id for book in books] == [1, 2, None, 1]
+        assert books[1].author is author
+        session.commit()
+        rows = session.execute(text("select * from book order by id")).all()
+        assert rows == [(1, 1), (2, 2), (3, None), (4, 1)]
+
+
+def test_many_to_one_set_is_fast(session):
+    session.add(Author(id=1))
+    session.flush()
+
+    author = session.get(Author, 1)
+    books = [Book(author=author) for _ in range(3)] + [Book(author=None)]
+    session.add_all(books)
+    session.flush()
+
+    assert session.fast_insert == [True, True]
+    assert [book.author_id for book in books] == [1, 1, 1, None]
+    assert not inspect(books[0]).modified
+
+
+@pytest.mark.parametrize("loaded", [True, False])
+def test_many_to_one_backref(session, loaded):
+    session.add(Shelf(id=1, items=[Item(id=1)]))
+    session.commit()
+
+    shelf = session.get(Shelf, 1)
+    if loaded:
+        shelf.items
+    items = [Item(shelf=shelf), Item(shelf=shelf)]
+    session.add_all(items)
+    assert shelf in session.dirty
+    session.flush()
+
+    assert session.fast_insert == [False, True]
+    assert not session.dirty
+    assert not inspect(shelf).modified
+    assert [item.shelf_id for item in items] == [1, 1]
+    session.expire(shelf)
+    assert [item.id for item in shelf.items] == [1, 2, 3]
+
+
+def test_many_to_one_backref_other_changes(session):
+    session.add_all([Shelf(id=1, items=[Item(id=1)]), Shelf(id=2)])
+    session.commit()
+
+    # moving a persistent item, or another change to the shelf, go through
+    # the unit of work
+    shelf = session.get(Shelf, 2)
+    item = session.get(Item, 1)
+    shelf.items.append(item)
+    session.add(Item(shelf=shelf))
+    session.flush()
+    assert session.fast_insert[-1] is False
+    assert item.shelf_id == 2
+
+    shelf.items.remove(item)
+    session.add(Item(shelf=shelf))
+    session.flush()
+    assert session.fast_insert[-1] is False
+    assert item.shelf_id is None
@@ -0,0 +1,186 @@
+"""ORM statements executed with the readonly_entities execution option."""
+
+import pytest
+
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import immediateload
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import ReadOnlySnapshot
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class User(Base):
+    __tablename__ = "user"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    posts = relationship("Post", back_populates="author", order_by="Post.id")
+    selectin_posts = relationship("Post", lazy="selectin", viewonly=True)
+
+
+class Post(Base):
+    __tablename__ = "post"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id = mapped_column(ForeignKey("user.id"))
+    author = relationship("User", back_populates="posts")
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(User(id=1, name="u1", posts=[Post(id=1), Post(id=2)]))
+        session.commit()
+        yield session
+
+
+def _readonly(stmt):
+    return stmt.execution_options(readonly_entities=True)
+
+
+def test_snapshots(session):
+    (post,) = session.scalars(
+        _readonly(select(Post).where(Post.id == 1).options(joinedload(Post.author)))
+    ).all()
+
+    assert isinstance(post, ReadOnlySnapshot)
+    assert not isinstance(post, Post)
+    assert (post.id, post.author_id, post.author.name) == (1, 1, "u1")
+    assert len(session.identity_map) == 0
+
+    with pytest.raises(AttributeError):
+        post.id = 2
+
+
+def test_joinedload_collection(session):
+    (user,) = (
+        session.scalars(
+            _readonly(
+                select(User).options(
+                    lazyload(User.selectin_posts), joinedload(User.posts)
+                )
+            )
+        )
+        .unique()
+        .all()
+    )
+    assert [post.id for post in user.posts] == [1, 2]
+    assert type(user.posts) is tuple
+
+    with pytest.raises(AttributeError):
+        user.posts.append(user.posts[0])
+
+
+def test_empty_collection(session):
+    session.add(User(id=2, name="u2"))
+    session.commit()
+
+    users = (
+        session.scalars(
+            _readonly(
+                select(User)
+                .options(lazyload(User.selectin_posts), joinedload(User.posts))
+                .order_by(User.id)
+            )
+        )
+        .unique()
+        .all()
+    )
+    assert [len(user.posts) for user in users] == [2, 0]
+    assert users[1].posts == ()
+
+
+def test_keys_which_are_not_slot_names():
+    mapper_registry = registry()
+    table = Table(
+        "t",
+        mapper_registry.metadata,
+        Column("id", Integer, primary_key=True),
+        Column("first name", String),
+        Column("private", String),
+    )
+
+    class T:
+        pass
+
+    mapper_registry.map_imperatively(
+        T,
+        table,
+        properties={
+            "first name": table.c["first name"],
+            "__private": table.c.private,
+        },
+    )
+
+    engine = create_engine("sqlite://")
+    mapper_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(table.insert(), {"id": 1, "first name": "a", "private": "b"})
+
+        (t,) = session.scalars(_readonly(select(T))).all()
+        assert getattr(t, "first name") == "a"
+        assert getattr(t, "__private") == "b"
+        assert t._asdict() == {"id": 1, "first name": "a", "__private": "b"}
+        assert "first name='a'" in repr(t)
+
+
+@pytest.mark.parametrize(
+    "loader, lazy",
+    [
+        (selectinload, "selectin"),
+        (subqueryload, "subquery"),
+        (immediateload, "immediate"),
+    ],
+)
+def test_post_loaders_raise(session, loader, lazy):
+    stmt = _readonly(
+        select(User).options(lazyload(User.selectin_posts), loader(User.posts))
+    )
+    with pytest.raises(exc.InvalidRequestError, match=f"User.posts .* lazy='{lazy}'"):
+        session.scalars(stmt).all()
+
+
+def test_configured_post_loader_raises(session):
+    with pytest.raises(exc.InvalidRequestError, match="User.selectin_posts"):
+        session.scalars(_readonly(select(User))).all()
+
+    # leaving the relationship out makes the statement usable
+    (user,) = session.scalars(
+        _readonly(select(User).options(lazyload(User.selectin_posts)))
+    ).all()
+    assert user.name == "u1"
+    with pytest.raises(AttributeError):
+        user.selectin_posts
+
+
+def test_nested_post_loader_raises(session):
+    stmt = _readonly(
+        select(User).options(
+            lazyload(User.selectin_posts),
+            joinedload(User.posts).selectinload(Post.author),
+        )
+    )
+    with pytest.raises(exc.InvalidRequestError, match="Post.author"):
+        session.scalars(stmt).unique().all()
@@ -0,0 +1,197 @@
+"""AffinityQueuePool handing connections back to the thread which returned
+them."""
+
+import threading
+import time
+
+import pytest
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AffinityQueuePool
+
+
+class Connection:
+    def __init__(self, closed):
+        self._closed = closed
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self._closed.append(self)
+
+
+@pytest.fixture
+def closed():
+    return []
+
+
+@pytest.fixture
+def make_pool(closed):
+    pools = []
+
+    def make_pool(**kw):
+        pool = AffinityQueuePool(lambda: Connection(closed), **kw)
+        pools.append(pool)
+        return pool
+
+    yield make_pool
+    for pool in pools:
+        pool.dispose()
+
+
+def _in_thread(fn):
+    """Run fn in a new thread and return its result once the thread
+    exited."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    return result[0]
+
+
+def test_same_thread_gets_its_connection(make_pool):
+    pool = make_pool(pool_size=2, max_overflow=0)
+    first = pool.connect()
+    second = pool.connect()
+    first_record = first._connection_record
+    second_record = second._connection_record
+
+    first.close()
+    # the slot holds one connection; the next goes to the shared queue
+    second.close()
+    assert pool._local.slot == [first_record]
+    assert pool._pool.qsize() == 1
+
+    conn = pool.connect()
+    assert conn._connection_record is first_record
+    conn.close()
+    conn = pool.connect()
+    assert conn._connection_record is first_record
+    other = pool.connect()
+    assert other._connection_record is second_record
+    conn.close()
+    other.close()
+
+
+def test_steal_from_idle_slot(make_pool, closed):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=1)
+    conn = pool.connect()
+    record = conn._connection_record
+    conn.close()
+    assert pool._pool.qsize() == 0
+
+    def checkout():
+        conn = pool.connect()
+        try:
+            return conn._connection_record
+        finally:
+            conn.invalidate()
+            conn.close()
+
+    assert _in_thread(checkout) is record
+    assert pool._local.slot == []
+
+
+def test_steal_from_exited_thread(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=1)
+
+    def checkout_and_return():
+        conn = pool.connect()
+        record = conn._connection_record
+        conn.close()
+        return record
+
+    record = _in_thread(checkout_and_return)
+    assert len(pool._slots) == 1
+    assert pool.checkedin() == 1
+
+    conn = pool.connect()
+    assert conn._connection_record is record
+    # the empty slot of the exited thread is forgotten by the next search
+    assert pool._steal() is None
+    assert [ref() for ref, slot in pool._slots] == [threading.current_thread()]
+    conn.close()
+
+
+def test_checkin_to_queue_while_waiting(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=5)
+    conn = pool.connect()
+    record = conn._connection_record
+
+    got = []
+    waiter = threading.Thread(
+        target=lambda: got.append(pool.connect()._connection_record)
+    )
+    waiter.start()
+    deadline = time.time() + 5
+    while not pool._waiters:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+    conn.close()
+    # handed over through the shared queue rather than parked in our slot
+    assert pool._local.slot == []
+    waiter.join(5)
+    assert got == [record]
+    assert pool._waiters == 0
+
+
+def test_overflow_discarded(make_pool, closed):
+    pool = make_pool(pool_size=1, max_overflow=1)
+    first = pool.connect()
+    second = pool.connect()
+    assert pool.overflow() == 1
+
+    first.close()
+    second.close()
+    assert pool._local.slot == []
+    assert pool._pool.qsize() == 1
+    assert len(closed) == 1
+    assert pool.overflow() == 0
+    assert pool.checkedin() == 1
+    assert pool.checkedout() == 0
+
+
+def test_timeout(make_pool):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=0.1)
+    conn = pool.connect()
+    with pytest.raises(exc.TimeoutError, match="AffinityQueuePool limit"):
+        pool.connect()
+    assert pool._waiters == 0
+    conn.close()
+    pool.connect().close()
+
+
+def test_dispose_closes_slots(make_pool, closed):
+    pool = make_pool(pool_size=2, max_overflow=0)
+    conn = pool.connect()
+    _in_thread(lambda: pool.connect().close())
+    conn.close()
+    assert pool.checkedin() == 2
+    assert pool._pool.qsize() == 0
+
+    pool.dispose()
+    assert len(closed) == 2
+    assert pool.checkedin() == 0
+
+
+def test_counts(make_pool):
+    pool = make_pool(pool_size=3, max_overflow=0)
+    first = pool.connect()
+    second = pool.connect()
+    assert (pool.checkedin(), pool.checkedout()) == (0, 2)
+
+    first.close()
+    second.close()
+    # one in this thread's slot, one in the shared queue
+    assert (pool.checkedin(), pool.checkedout()) == (2, 0)
+    assert pool.status() == (
+        "Pool size: 3  Connections in pool: 2 Current Overflow: -1 "
+        "Current Checked out connections: 0"
+    )
+
+    conn = pool.connect()
+    assert (pool.checkedin(), pool.checkedout()) == (1, 1)
+    conn.close()
@@ -0,0 +1,188 @@
+"""Background maintenance of QueuePool: min_idle and warmup, its race with
+dispose(), and pings skipped within pre_ping_interval."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import AffinityQueuePool
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool.base import _ConnDialect
+
+
+class _BlockingPingDialect(_ConnDialect):
+    """Hold the maintenance thread inside its ping until released."""
+
+    def __init__(self):
+        self.pinging = threading.Event()
+        self.release = threading.Event()
+
+    def _do_ping_w_event(self, dbapi_connection):
+        self.pinging.set()
+        self.release.wait(5)
+        return True
+
+
+class _CountingPingDialect(_ConnDialect):
+    def __init__(self):
+        self.pings = 0
+
+    def _do_ping_w_event(self, dbapi_connection):
+        self.pings += 1
+        return True
+
+
+@pytest.fixture(params=[QueuePool, AffinityQueuePool])
+def pool_cls(request):
+    return request.param
+
+
+def _make_pool(pool_cls, closed, **kw):
+    class Connection:
+        def __init__(self):
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+
+        def cursor(self):
+            return self._conn.cursor()
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            closed.append(self)
+
+    kw.setdefault("pool_size", 2)
+    kw.setdefault("max_overflow", 0)
+    kw.setdefault("pre_ping", True)
+    kw.setdefault("pre_ping_interval", 0.05)
+    pool = pool_cls(Connection, **kw)
+    pool._dialect = _BlockingPingDialect()
+    return pool
+
+
+def _wait_for(condition):
+    deadline = time.time() + 5
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_in_flight_connection_is_neither_checked_in_nor_out(pool_cls):
+    closed = []
+    pool = _make_pool(pool_cls, closed)
+    pool.connect().close()
+    assert pool._dialect.pinging.wait(5)
+
+    assert pool.checkedin() == 0
+    assert pool.checkedout() == 0
+    assert pool.overflow() == -2
+
+    pool._dialect.release.set()
+    _wait_for(lambda: pool.checkedin() == 1)
+    assert pool.checkedout() == 0
+    assert pool.overflow() == -1
+    pool.dispose()
+
+
+def test_dispose_during_maintenance_closes_connection(pool_cls):
+    closed = []
+    pool = _make_pool(pool_cls, closed)
+    pool.connect().close()
+    assert pool._dialect.pinging.wait(5)
+
+    pool.dispose()
+    pool._dialect.release.set()
+    _wait_for(lambda: closed)
+
+    assert pool._pool.qsize() == 0
+    assert pool.checkedin() == 0
+    assert pool.checkedout() == 0
+    assert pool.overflow() == -2
+
+
+def test_ping_skipped_within_interval(pool_cls):
+    # an interval long enough that the maintenance thread doesn't get to
+    # ping while the test runs
+    pool = _make_pool(pool_cls, [], pre_ping_interval=60)
+    pool._dialect = dialect = _CountingPingDialect()
+
+    conn = pool.connect()
+    record = conn._connection_record
+    conn.close()
+    assert dialect.pings == 0
+
+    # checked in just now
+    conn = pool.connect()
+    assert conn._connection_record is record
+    conn.close()
+    assert dialect.pings == 0
+
+    # checked in longer ago than the interval
+    record._checkin_time -= 61
+    conn = pool.connect()
+    assert conn._connection_record is record
+    conn.close()
+    assert dialect.pings == 1
+
+    pool.dispose()
+
+
+def test_min_idle(pool_cls):
+    closed = []
+    pool = _make_pool(
+        pool_cls,
+        closed,
+        pool_size=4,
+        min_idle=2,
+        pre_ping=False,
+        pre_ping_interval=0,
+    )
+    pool._maintenance_interval = 0.02
+
+    conn = pool.connect()
+    _wait_for(lambda: pool.checkedin() == 2)
+    assert pool.checkedout() == 1
+
+    # the pool is topped up as idle connections are checked out, as far
+    # as pool_size allows
+    second = pool.connect()
+    _wait_for(lambda: pool.checkedin() == 2)
+    assert pool.checkedout() == 2
+    third = pool.connect()
+    time.sleep(0.1)
+    assert pool.checkedin() == 1
+    assert pool.checkedout() == 3
+
+    for c in (conn, second, third):
+        c.close()
+    assert pool.checkedin() == 4
+    assert not closed
+    pool.dispose()
+
+
+def test_warmup(tmp_path):
+    path = str(tmp_path / "warmup.db")
+    created = []
+
+    def creator():
+        created.append(None)
+        return sqlite3.connect(path, check_same_thread=False)
+
+    engine = create_engine(
+        "sqlite://",
+        creator=creator,
+        poolclass=QueuePool,
+        pool_size=5,
+        pool_warmup=3,
+    )
+    # opened before any connection is requested
+    _wait_for(lambda: engine.pool.checkedin() == 3)
+    assert len(created) == 3
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("select 1").scalar() == 1
+    assert len(created) == 3
+    engine.dispose()
@@ -0,0 +1,189 @@
+"""pymysql.aio and logging in, against the stand-in server of
+benchmarks/fakemysql.py."""
+
+import asyncio
+
+import pymysql
+import pymysql.aio
+import pytest
+from fakemysql import FakeServer
+from pymysql.constants import FIELD_TYPE
+
+COLUMNS = [("id", FIELD_TYPE.LONG, 63), ("name", FIELD_TYPE.VAR_STRING, 45)]
+ROWS = [[b"%d" % i, b"name %d" % i] for i in range(1, 101)]
+
+
+def handler(sql):
+    if sql == "select rows":
+        return [("rs", COLUMNS, ROWS)]
+    if sql == "select two":
+        return [("rs", COLUMNS, ROWS[:1]), ("rs", COLUMNS, ROWS[1:2])]
+    if sql.startswith("insert"):
+        return [("ok", 2, 7)]
+    if sql.startswith("fail"):
+        return [("err", 1064, "You have an error in your SQL syntax")]
+    return [("ok", 0)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler, password="secret")
+
+
+def _run(server, test, **kw):
+    async def main():
+        conn = await pymysql.aio.connect(
+            host="127.0.0.1", port=server.port, user="u", password="secret", **kw
+        )
+        try:
+            await test(conn)
+        finally:
+            if conn.open:
+                await conn.close()
+
+    asyncio.run(main())
+
+
+def test_execute_and_fetch(server):
+    async def test(conn):
+        assert conn.open
+        assert conn.get_server_info() == "8.0.99-stand-in"
+
+        async with conn.cursor() as cursor:
+            assert await cursor.execute("select rows") == 100
+            assert await cursor.fetchone() == (1, "name 1")
+            assert await cursor.fetchmany(2) == ((2, "name 2"), (3, "name 3"))
+            assert [row async for row in cursor][0] == (4, "name 4")
+            assert await cursor.fetchone() is None
+
+            assert await cursor.execute("insert into t values (%s)", ("x",)) == 2
+            assert cursor.lastrowid == 7
+            assert server.queries[-1] == "insert into t values ('x')"
+
+            await cursor.execute("select two")
+            assert await cursor.fetchall() == ((1, "name 1"),)
+            assert await cursor.nextset()
+            assert await cursor.fetchall() == ((2, "name 2"),)
+            assert not await cursor.nextset()
+
+            with pytest.raises(pymysql.ProgrammingError, match="1064"):
+                await cursor.execute("fail")
+            await cursor.execute("select rows")
+
+        async with conn.cursor(pymysql.aio.AsyncDictCursor) as cursor:
+            await cursor.execute("select two")
+            assert await cursor.fetchall() == [{"id": 1, "name": "name 1"}]
+
+        await conn.ping()
+        await conn.select_db("db")
+
+    _run(server, test)
+
+
+def test_ss_cursor(server):
+    async def test(conn):
+        async with conn.cursor(pymysql.aio.AsyncSSCursor) as cursor:
+            await cursor.execute("select rows")
+            assert await cursor.fetchone() == (1, "name 1")
+            assert await cursor.fetchmany(2) == [(2, "name 2"), (3, "name 3")]
+            await cursor.scroll(2)
+            rows = [row async for row in cursor]
+            assert rows[0] == (6, "name 6")
+            assert len(rows) == 95
+
+            # closing the cursor reads the rest of the result
+            await cursor.execute("select rows")
+            await cursor.fetchone()
+        async with conn.cursor() as cursor:
+            await cursor.execute("select two")
+            assert await cursor.fetchall() == ((1, "name 1"),)
+
+        async with conn.cursor(pymysql.aio.AsyncSSDictCursor) as cursor:
+            await cursor.execute("select rows")
+            assert (await cursor.fetchall())[-1] == {"id": 100, "name": "name 100"}
+
+    _run(server, test)
+
+
+def test_close(server):
+    async def test(conn):
+        cursor = conn.cursor()
+        await conn.close()
+        assert not conn.open
+        with pytest.raises(pymysql.err.Error, match="Already closed"):
+            await conn.close()
+        with pytest.raises(pymysql.err.InterfaceError):
+            await cursor.execute("select rows")
+
+    _run(server, test)
+
+    async def main():
+        async with await pymysql.aio.connect(
+            host="127.0.0.1", port=server.port, user="u", password="secret"
+        ) as conn:
+            pass
+        assert not conn.open
+
+    asyncio.run(main())
+
+
+def test_sync_context_managers_rejected(server):
+    async def test(conn):
+        with pytest.raises(TypeError, match="async with"):
+            with conn:
+                pass
+        with pytest.raises(TypeError, match="async with"):
+            with conn.cursor():
+                pass
+
+    _run(server, test)
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [
+        {"compress": "zlib"},
+        {"recv_buffer_size": 65536},
+        {"auth_plugin_map": {"dialog": object}},
+    ],
+)
+def test_rejected_options(kw):
+    (name,) = kw
+    with pytest.raises(NotImplementedError, match=name):
+        pymysql.aio.AsyncConnection(user="u", **kw)
+
+
+@pytest.mark.parametrize(
+    "auth_switch",
+    [
+        None,
+        "mysql_native_password",
+        "caching_sha2_password",
+        "mysql_clear_password",
+    ],
+)
+def test_login(auth_switch):
+    server = FakeServer(handler, password="secret", auth_switch=auth_switch)
+    kw = dict(host="127.0.0.1", port=server.port, user="u")
+
+    with pymysql.connect(password="secret", **kw) as conn:
+        conn.ping()
+    with pytest.raises(pymysql.OperationalError, match="1045"):
+        pymysql.connect(password="wrong", **kw)
+
+    async def main():
+        conn = await pymysql.aio.connect(password="secret", **kw)
+        await conn.ping()
+        await conn.close()
+        with pytest.raises(pymysql.OperationalError, match="1045"):
+            await pymysql.aio.connect(password="wrong", **kw)
+
+    asyncio.run(main())
+
+
+def test_connect_error():
+    async def main():
+        with pytest.raises(pymysql.OperationalError, match="2003"):
+            await pymysql.aio.connect(host="127.0.0.1", port=1, user="u")
+
+    asyncio.run(main())
@@ -0,0 +1,212 @@
+"""The compressed protocol (compress="zlib" / "zstd") against the stand-in
+server of benchmarks/fakemysql.py."""
+
+import struct
+import zlib
+
+import fakemysql
+import pymysql
+import pytest
+from fakemysql import FakeServer
+from pymysql.constants import FIELD_TYPE
+
+BIG = 2**24 + 1000
+
+# the zstd cases need the zstandard package; the zlib ones always run
+COMPRESS = [
+    "zlib",
+    pytest.param(
+        "zstd",
+        marks=pytest.mark.skipif(
+            pymysql.connections.zstandard is None, reason="zstandard not installed"
+        ),
+    ),
+]
+
+COLUMNS = [("id", FIELD_TYPE.LONG, 63), ("body", FIELD_TYPE.BLOB, 45)]
+ROWS = [[b"%d" % i, b"lorem ipsum %d " % i * 50] for i in range(200)]
+
+
+def handler(sql):
+    if sql == "select rows":
+        return [("rs", COLUMNS, ROWS)]
+    if sql == "select big":
+        return [("rs", COLUMNS, [[b"1", b"x" * BIG]])]
+    return [("ok", 0)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+class _RecordingSocket:
+    """Keep what the client sends on its socket."""
+
+    def __init__(self, sock):
+        self._sock = sock
+        self.sent = bytearray()
+
+    def sendall(self, data):
+        self.sent += data
+        return self._sock.sendall(data)
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+@pytest.fixture
+def connect(server):
+    connections = []
+
+    def connect(**kw):
+        conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u", **kw)
+        conn._sock = _RecordingSocket(conn._sock)
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
+
+
+def _frames(sent):
+    """Split the bytes sent by a client into compressed packets of
+    (sequence id, uncompressed length, payload)."""
+    frames = []
+    pos = 0
+    while pos < len(sent):
+        length = int.from_bytes(sent[pos : pos + 3], "little")
+        seq = sent[pos + 3]
+        uncompressed = int.from_bytes(sent[pos + 4 : pos + 7], "little")
+        frames.append((seq, uncompressed, bytes(sent[pos + 7 : pos + 7 + length])))
+        pos += 7 + length
+    return frames
+
+
+def _decompress(compress, payload, length):
+    if compress == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(payload, max_output_size=length)
+    return zlib.decompress(payload)
+
+
+def _query_packet(sql):
+    payload = b"\x03" + sql
+    return struct.pack("<I", len(payload))[:3] + b"\x00" + payload
+
+
+@pytest.mark.parametrize("compress", COMPRESS)
+def test_round_trip(server, connect, compress):
+    conn = connect(compress=compress)
+    assert conn._compression is not None
+
+    with conn.cursor() as cursor:
+        cursor.execute("select rows")
+        assert cursor.fetchall() == tuple((int(i), b.decode()) for i, b in ROWS)
+
+        sql = "select '" + "abc" * 1000 + "'"
+        conn._sock.sent.clear()
+        cursor.execute(sql)
+    assert server.queries[-1] == sql
+
+    ((seq, length, payload),) = _frames(conn._sock.sent)
+    assert seq == 0
+    assert length == len(sql) + 5
+    assert len(payload) < length
+    assert _decompress(compress, payload, length) == _query_packet(sql.encode())
+
+
+@pytest.mark.parametrize("compress", COMPRESS)
+def test_not_negotiated(compress):
+    no_compress = FakeServer(
+        handler,
+        capabilities=~(
+            fakemysql.CLIENT_COMPRESS | fakemysql.CLIENT_ZSTD_COMPRESSION_ALGORITHM
+        ),
+    )
+    conn = pymysql.connect(
+        host="127.0.0.1", port=no_compress.port, user="u", compress=compress
+    )
+    with conn, conn.cursor() as cursor:
+        assert conn._compression is None
+        cursor.execute("select rows")
+        assert len(cursor.fetchall()) == len(ROWS)
+
+
+def test_min_length(connect):
+    conn = connect(compress="zlib", compress_min_length=100)
+    with conn.cursor() as cursor:
+        for sql in ("select '" + "a" * 80 + "'", "select '" + "a" * 100 + "'"):
+            cursor.execute(sql)
+
+    # packets are compressed from compress_min_length bytes, header included
+    assert [length for _, length, _ in _frames(conn._sock.sent)] == [0, 114]
+
+    conn = connect(compress="zlib", compress_min_length=0)
+    conn._sock.sent.clear()
+    with conn.cursor() as cursor:
+        cursor.execute("select 1")
+    # zlib makes it longer, so it's sent as it is
+    ((_, length, payload),) = _frames(conn._sock.sent)
+    assert (length, payload) == (0, _query_packet(b"select 1"))
+
+
+@pytest.mark.parametrize("compress", COMPRESS)
+def test_big_packets(server, connect, compress):
+    conn = connect(compress=compress)
+    sql = "select '" + "a" * BIG + "'"
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+        assert server.queries[-1] == sql
+
+        # the server splits its response in many compressed packets, whose
+        # sequence ids wrap around
+        cursor.execute("select big")
+        ((_, body),) = cursor.fetchall()
+        assert body == "x" * BIG
+
+        conn._sock.sent.clear()
+        cursor.execute(sql)
+
+    frames = _frames(conn._sock.sent)
+    # a packet of 2**24 - 1 bytes, then the rest of the query; each command
+    # starts again from 0
+    assert [seq for seq, _, _ in frames] == [0, 1]
+    data = b"".join(_decompress(compress, p, n) for _, n, p in frames)
+    assert len(data) == len(sql) + 9
+    assert data[3] == 0 and data[2**24 + 6] == 1
+
+
+@pytest.fixture
+def skew(monkeypatch):
+    """Make the server send wrong sequence ids in its response to
+    ``select skew <attribute>``."""
+    dispatch = fakemysql._Conn.dispatch
+
+    def skewed_dispatch(self, data):
+        if data.startswith(b"\x03select skew "):
+            attr = data[len(b"\x03select skew ") :].decode()
+            setattr(self, attr, getattr(self, attr) + 1)
+        dispatch(self, data)
+
+    monkeypatch.setattr(fakemysql._Conn, "dispatch", skewed_dispatch)
+
+
+def test_packet_sequence_ids(connect, skew):
+    conn = connect(compress="zlib")
+    with conn.cursor() as cursor:
+        # the sequence ids of the packets carried by compressed packets
+        # aren't checked, as the server doesn't check them either
+        cursor.execute("select skew seq")
+        assert cursor.execute("select rows") == len(ROWS)
+
+        with pytest.raises(pymysql.InternalError, match="Compressed packet sequence"):
+            cursor.execute("select skew compressed_seq")
+    assert not conn.open
+
+    conn = connect()
+    with conn.cursor() as cursor:
+        with pytest.raises(pymysql.InternalError, match="Packet sequence number"):
+            cursor.execute("select skew seq")
@@ -0,0 +1,218 @@
+"""Cross-check the fromisoformat() fast paths of the PyMySQL temporal
+converters against the regex-only implementations they sit in front of.
+
+The regex implementations below are the converters as they were before the
+fast paths were added.  Both are run over a generated corpus of the values
+MySQL sends, values with time zones, out-of-range fields and fractions of any
+length, and random mutations of all of these, as str and as bytes.  Results,
+including the types of exceptions raised, must be identical.
+"""
+
+import datetime
+import random
+import re
+
+import pytest
+
+from pymysql import converters
+
+
+def _convert_second_fraction(s):
+    if not s:
+        return 0
+    # Pad zeros to ensure the fraction length in microseconds
+    s = s.ljust(6, "0")
+    return int(s[:6])
+
+
+DATETIME_RE = re.compile(
+    r"(\d{1,4})-(\d{1,2})-(\d{1,2})[T ](\d{1,2}):(\d{1,2}):(\d{1,2})(?:.(\d{1,6}))?"
+)
+
+
+def regex_convert_datetime(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode("ascii")
+
+    m = DATETIME_RE.match(obj)
+    if not m:
+        return regex_convert_date(obj)
+
+    try:
+        groups = list(m.groups())
+        groups[-1] = _convert_second_fraction(groups[-1])
+        return datetime.datetime(*[int(x) for x in groups])
+    except ValueError:
+        return regex_convert_date(obj)
+
+
+TIMEDELTA_RE = re.compile(r"(-)?(\d{1,3}):(\d{1,2}):(\d{1,2})(?:.(\d{1,6}))?")
+
+
+def regex_convert_timedelta(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode("ascii")
+
+    m = TIMEDELTA_RE.match(obj)
+    if not m:
+        return obj
+
+    try:
+        groups = list(m.groups())
+        groups[-1] = _convert_second_fraction(groups[-1])
+        negate = -1 if groups[0] else 1
+        hours, minutes, seconds, microseconds = groups[1:]
+
+        tdelta = (
+            datetime.timedelta(
+                hours=int(hours),
+                minutes=int(minutes),
+                seconds=int(seconds),
+                microseconds=int(microseconds),
+            )
+            * negate
+        )
+        return tdelta
+    except ValueError:
+        return obj
+
+
+TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2}):(\d{1,2})(?:.(\d{1,6}))?")
+
+
+def regex_convert_time(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode("ascii")
+
+    m = TIME_RE.match(obj)
+    if not m:
+        return obj
+
+    try:
+        groups = list(m.groups())
+        groups[-1] = _convert_second_fraction(groups[-1])
+        hours, minutes, seconds, microseconds = groups
+        return datetime.time(
+            hour=int(hours),
+            minute=int(minutes),
+            second=int(seconds),
+            microsecond=int(microseconds),
+        )
+    except ValueError:
+        return obj
+
+
+def regex_convert_date(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode("ascii")
+    try:
+        return datetime.date(*[int(x) for x in obj.split("-", 2)])
+    except ValueError:
+        return obj
+
+
+def _fraction(rand):
+    return "".join(rand.choice("0123456789") for _ in range(rand.randint(0, 9)))
+
+
+def _datetime_text(rand):
+    year = rand.choice([rand.randint(0, 9999), 0, 1970, 2024])
+    text = "%04d-%02d-%02d%s%02d:%02d:%02d" % (
+        year,
+        rand.randint(0, 13),
+        rand.randint(0, 32),
+        rand.choice(" T"),
+        rand.choice([rand.randint(0, 25), 24]),
+        rand.randint(0, 61),
+        rand.randint(0, 61),
+    )
+    r = rand.random()
+    if r < 0.5:
+        text += "." + _fraction(rand)
+    elif r < 0.55:
+        text += rand.choice(["Z", "+05:00", " ", "x", ".", " 1", ",5", ".5+01:00"])
+    return text
+
+
+def _timedelta_text(rand):
+    text = "%s%s:%02d:%02d" % (
+        rand.choice(["", "-"]),
+        str(rand.randint(0, 999)).zfill(rand.choice([1, 2, 3])),
+        rand.randint(0, 99),
+        rand.randint(0, 99),
+    )
+    r = rand.random()
+    if r < 0.5:
+        text += rand.choice(".,x") + _fraction(rand)
+    elif r < 0.55:
+        text += rand.choice(["+01:00", " ", "Z"])
+    return text
+
+
+def _mutate(rand, text):
+    if text and rand.random() < 0.3:
+        i = rand.randrange(len(text))
+        text = text[:i] + rand.choice("0123456789 -:.T+٣²_a") + text[i + 1 :]
+    if text and rand.random() < 0.05:
+        i = rand.randrange(len(text))
+        text = text[:i] + text[i + 1 :]
+    return text
+
+
+def _call(fn, value):
+    try:
+        result = fn(value)
+    except Exception as e:
+        return ("raised", type(e))
+    if isinstance(result, (datetime.datetime, datetime.time)):
+        # naive and aware values can compare equal
+        return (type(result), result, result.tzinfo)
+    return (type(result), result)
+
+
+CASES = [
+    ("convert_datetime", regex_convert_datetime, _datetime_text),
+    ("convert_date", regex_convert_date, lambda rand: _datetime_text(rand)[:10]),
+    ("convert_timedelta", regex_convert_timedelta, _timedelta_text),
+    (
+        "convert_time",
+        regex_convert_time,
+        lambda rand: _timedelta_text(rand).lstrip("-"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "name, regex_convert, make_text", CASES, ids=[case[0] for case in CASES]
+)
+def test_same_as_regex_converter(name, regex_convert, make_text):
+    convert = getattr(converters, name)
+    rand = random.Random(name)
+    for _ in range(50_000):
+        text = _mutate(rand, make_text(rand))
+        values = [text]
+        if text.isascii():
+            values.append(text.encode("ascii"))
+        for value in values:
+            assert _call(convert, value) == _call(regex_convert, value), value
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("convert_datetime", "2007-02-25 23:06:20"),
+        ("convert_datetime", b"2007-02-25T23:06:20.123456"),
+        ("convert_datetime", "0000-00-00 00:00:00"),
+        ("convert_datetime", "2007-02-31 23:06:20"),
+        ("convert_date", "2007-02-26"),
+        ("convert_date", b"0000-00-00"),
+        ("convert_timedelta", "25:06:17"),
+        ("convert_timedelta", "-25:06:17.5"),
+        ("convert_timedelta", b"838:59:59.000000"),
+        ("convert_time", "15:06:17"),
+        ("convert_time", "24:00:00"),
+    ],
+)
+def test_documented_values(name, value):
+    regex_convert = globals()["regex_" + name]
+    assert _call(getattr(converters, name), value) == _call(regex_convert, value)
@@ -0,0 +1,90 @@
+"""Escaping of Cursor arguments through the per-type escapers cached by
+Connection._literal_sequence()."""
+
+import datetime
+import decimal
+import time
+
+import pymysql
+import pytest
+from pymysql import converters
+from pymysql.constants import SERVER_STATUS
+
+from fakemysql import FakeServer
+
+VALUES = [
+    1,
+    -2**63,
+    True,
+    1.5,
+    None,
+    "it's",
+    "\\\n\x00",
+    b"b'\x00",
+    bytearray(b"ba"),
+    decimal.Decimal("1.20"),
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 60),
+    datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+    datetime.date(2024, 1, 2),
+    datetime.time(3, 4, 5, 6),
+    datetime.timedelta(days=1, seconds=5),
+    time.struct_time((2024, 1, 2, 3, 4, 5, 0, 2, -1)),
+    (1, "a"),
+    [None, b"x"],
+    {1, 2},
+    frozenset(["a"]),
+]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(lambda sql: [("ok", 0)])
+
+
+@pytest.fixture
+def conn(server):
+    conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u")
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("no_backslash_escapes", [False, True])
+def test_same_as_literal(conn, no_backslash_escapes):
+    if no_backslash_escapes:
+        conn.server_status |= SERVER_STATUS.SERVER_STATUS_NO_BACKSLASH_ESCAPES
+
+    expected = tuple(conn.literal(value) for value in VALUES)
+    # the second time, with the escapers cached
+    assert conn._literal_sequence(VALUES) == expected
+    assert conn._literal_sequence(VALUES) == expected
+
+    cursor = conn.cursor()
+    mogrified = cursor.mogrify("%s, %s", (1, "it's"))
+    assert mogrified == "%s, %s" % (expected[0], expected[5])
+    assert cursor.mogrify("%(a)s", {"a": "it's"}) == expected[5]
+
+
+def test_escapers_cached(conn):
+    conn._literal_sequence([1, "a"])
+    escapers = dict(conn._escapers)
+    assert set(escapers) == {int, str}
+    conn._literal_sequence([2, "b"])
+    assert conn._escapers == escapers
+
+
+def test_encoder_changed(conn):
+    assert conn._literal_sequence([1]) == ("1",)
+
+    # encoders changed in place
+    escape_int = conn.encoders[int]
+    conn.encoders[int] = lambda value, mapping=None: "int(%d)" % value
+    assert conn._literal_sequence([1]) == ("int(1)",)
+    conn.encoders[int] = escape_int
+    assert conn._literal_sequence([1]) == ("1",)
+
+    # encoders replaced
+    conn.encoders = dict(converters.encoders)
+    conn.encoders[int] = lambda value, mapping=None: "other(%d)" % value
+    assert conn._literal_sequence([1]) == ("other(1)",)
+    assert conn._escapers_mapping is conn.encoders
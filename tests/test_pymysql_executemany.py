@@ -0,0 +1,168 @@
+"""Cursor.executemany() batching statements into multi-statement queries,
+against the stand-in server of benchmarks/fakemysql.py."""
+
+import asyncio
+
+import pymysql
+import pymysql.aio
+import pytest
+from pymysql.constants import CLIENT
+
+from fakemysql import FakeServer
+
+UPDATE = "UPDATE t SET a = %s WHERE id = %s"
+
+
+def handler(sql):
+    responses = []
+    for stmt in sql.split("\n;\n"):
+        if "fail" in stmt:
+            responses.append(("err", 1146, "Table 'db.fail' doesn't exist"))
+        elif stmt.startswith("UPDATE"):
+            # affects as many rows as the id
+            responses.append(("ok", int(stmt.rsplit(" ", 1)[1])))
+        else:
+            responses.append(("ok", 0))
+    return responses
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+@pytest.fixture
+def conn(server):
+    conn = pymysql.connect(
+        host="127.0.0.1",
+        port=server.port,
+        user="u",
+        client_flag=CLIENT.MULTI_STATEMENTS,
+    )
+    yield conn
+    conn.close()
+
+
+def _queries(server, start):
+    return [sql for sql in server.queries[start:] if sql.startswith("UPDATE")]
+
+
+def test_not_batched_by_default(server, conn):
+    start = len(server.queries)
+    with conn.cursor() as cursor:
+        assert cursor.executemany(UPDATE, [(1, 1), (2, 2)]) == 3
+        assert cursor.rowcounts == [1, 2]
+
+    assert _queries(server, start) == [
+        "UPDATE t SET a = 1 WHERE id = 1",
+        "UPDATE t SET a = 2 WHERE id = 2",
+    ]
+
+
+def test_batched(server, conn):
+    start = len(server.queries)
+    with conn.cursor() as cursor:
+        cursor.batch_statements = True
+        assert cursor.executemany(UPDATE, [(i, i) for i in range(1, 4)]) == 6
+        assert cursor.rowcounts == [1, 2, 3]
+        assert cursor.rowcount == 6
+
+    assert _queries(server, start) == [
+        "UPDATE t SET a = 1 WHERE id = 1\n;\n"
+        "UPDATE t SET a = 2 WHERE id = 2\n;\n"
+        "UPDATE t SET a = 3 WHERE id = 3"
+    ]
+
+
+def test_chunks_at_max_stmt_length(server, conn):
+    stmt = "UPDATE t SET a = 1 WHERE id = 1"
+    start = len(server.queries)
+    with conn.cursor() as cursor:
+        cursor.batch_statements = True
+        # room for two statements and their separator, but not three
+        cursor.max_stmt_length = len(stmt) * 3 + 5
+        assert cursor.executemany(UPDATE, [(1, 1)] * 5) == 5
+        assert cursor.rowcounts == [1] * 5
+
+        cursor.max_stmt_length = len(stmt) * 2 + 3
+        cursor.executemany(UPDATE, [(1, 1)] * 3)
+
+    two = f"{stmt}\n;\n{stmt}"
+    assert _queries(server, start) == [two, two, stmt, two, stmt]
+    assert all(len(sql) <= len(stmt) * 3 + 5 for sql in _queries(server, start))
+
+
+def test_requires_multi_statements(server):
+    conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u")
+    with conn, conn.cursor() as cursor:
+        cursor.batch_statements = True
+        with pytest.raises(pymysql.ProgrammingError, match="MULTI_STATEMENTS"):
+            cursor.executemany(UPDATE, [(1, 1)])
+
+
+def test_error_in_batch(server, conn):
+    start = len(server.queries)
+    with conn.cursor() as cursor:
+        cursor.batch_statements = True
+        cursor.max_stmt_length = 80
+        with pytest.raises(pymysql.ProgrammingError, match="1146"):
+            cursor.executemany(
+                UPDATE, [(1, 1), (2, 2), (3, 3), ("fail", 4), (5, 5), (6, 6)]
+            )
+        # the statements run before the failing one
+        assert cursor.rowcounts == [1, 2, 3]
+
+        # the batches after the failing one aren't sent, and the connection
+        # can still be used
+        assert len(_queries(server, start)) == 2
+        assert cursor.execute("SELECT 1") == 0
+
+
+def test_error_not_batched(server, conn):
+    start = len(server.queries)
+    with conn.cursor() as cursor:
+        cursor.executemany(UPDATE, [(1, 1)])
+        with pytest.raises(pymysql.ProgrammingError, match="1146"):
+            cursor.executemany(UPDATE, [(1, 1), (2, 2), ("fail", 3), (4, 4)])
+        # the statements run before the failing one, not those of the
+        # previous call
+        assert cursor.rowcounts == [1, 2]
+        assert len(_queries(server, start)) == 4
+
+
+def test_async(server):
+    async def main():
+        conn = await pymysql.aio.connect(
+            host="127.0.0.1",
+            port=server.port,
+            user="u",
+            client_flag=CLIENT.MULTI_STATEMENTS,
+        )
+        try:
+            async with conn.cursor() as cursor:
+                start = len(server.queries)
+                assert await cursor.executemany(UPDATE, [(1, 1), (2, 2)]) == 3
+                assert len(_queries(server, start)) == 2
+
+                cursor.batch_statements = True
+                cursor.max_stmt_length = 70
+                start = len(server.queries)
+                args = [(i, i) for i in (1, 2, 3)]
+                assert await cursor.executemany(UPDATE, args) == 6
+                assert cursor.rowcounts == [1, 2, 3]
+                assert len(_queries(server, start)) == 2
+
+                with pytest.raises(pymysql.ProgrammingError, match="1146"):
+                    await cursor.executemany(UPDATE, [(1, 1), ("fail", 2)])
+                assert cursor.rowcounts == [1]
+
+                cursor.batch_statements = False
+                with pytest.raises(pymysql.ProgrammingError, match="1146"):
+                    await cursor.executemany(
+                        UPDATE, [(1, 1), (2, 2), ("fail", 3), (4, 4)]
+                    )
+                assert cursor.rowcounts == [1, 2]
+        finally:
+            await conn.close()
+
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""SSCursor.fetch_columns() against the stand-in server of
+benchmarks/fakemysql.py."""
+
+import array
+
+import pymysql
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from fakemysql import FakeServer
+
+COLUMNS = [
+    ("id", FIELD_TYPE.LONG, 63),
+    ("price", FIELD_TYPE.DOUBLE, 63),
+    ("name", FIELD_TYPE.VAR_STRING, 45),
+    ("qty", FIELD_TYPE.LONG, 63),
+]
+
+ROWS = [
+    [b"%d" % i, b"%d.5" % i, b"n%d" % i, None if i == 5 else b"%d" % i]
+    for i in range(10)
+]
+
+
+def handler(sql):
+    if sql == "select rows":
+        return [("rs", COLUMNS, ROWS)]
+    return [("ok", 0)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+@pytest.fixture
+def connect(server):
+    connections = []
+
+    def connect(**kw):
+        conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u", **kw)
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
+
+
+@pytest.mark.parametrize("recv_buffer_size", [None, 64])
+def test_fetch_columns(connect, recv_buffer_size):
+    kw = {} if recv_buffer_size is None else {"recv_buffer_size": recv_buffer_size}
+    conn = connect(**kw)
+    with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+        cursor.execute("select rows")
+        batches = []
+        while (columns := cursor.fetch_columns(4)) is not None:
+            batches.append(columns)
+        assert cursor.rownumber == 10
+
+    assert len(batches) == 3
+    ids, prices, names, qty = batches[0]
+    assert ids == array.array("q", [0, 1, 2, 3])
+    assert prices == array.array("d", [0.5, 1.5, 2.5, 3.5])
+    assert names == ["n0", "n1", "n2", "n3"]
+    assert qty == array.array("q", [0, 1, 2, 3])
+
+    # a NULL keeps the column a list for that batch
+    assert batches[1][3] == [4, None, 6, 7]
+    assert type(batches[1][0]) is array.array
+    assert [list(batch[0]) for batch in batches] == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9],
+    ]
+
+
+def test_fetch_columns_matches_rows(connect):
+    conn = connect()
+    with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+        cursor.execute("select rows")
+        columns = cursor.fetch_columns(100)
+        assert cursor.fetch_columns() is None
+        cursor.execute("select rows")
+        rows = cursor.fetchall()
+
+    assert [tuple(row) for row in zip(*columns)] == list(rows)
+
+
+def test_dict_cursor(connect):
+    conn = connect()
+    with conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+        cursor.execute("select rows")
+        columns = cursor.fetch_columns(2)
+
+    assert list(columns) == ["id", "price", "name", "qty"]
+    assert columns["name"] == ["n0", "n1"]
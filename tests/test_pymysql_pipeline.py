@@ -0,0 +1,132 @@
+"""Connection.pipeline() and AsyncConnection.pipeline() against the stand-in
+server of benchmarks/fakemysql.py."""
+
+import asyncio
+
+import pymysql
+import pymysql.aio
+import pytest
+from fakemysql import FakeServer
+from pymysql.constants import CLIENT
+from pymysql.constants import FIELD_TYPE
+
+COLUMNS = [("n", FIELD_TYPE.LONG, 63), ("s", FIELD_TYPE.VAR_STRING, 45)]
+
+
+def handler(sql):
+    responses = []
+    for stmt in sql.split(";"):
+        name, _, arg = stmt.partition(" ")
+        if name == "fail":
+            responses.append(("err", 1146, f"Table 'db.{arg}' doesn't exist"))
+            break
+        if name == "select":
+            rows = [[b"%d" % i, b"x" * 100] for i in range(int(arg))]
+            responses.append(("rs", COLUMNS, rows))
+        else:
+            responses.append(("ok", 1, 0))
+    return responses
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+def _rows(results):
+    return [len(result.rows) if result.rows else None for result in results]
+
+
+@pytest.fixture(params=[{}, {"compress": "zlib"}], ids=["plain", "zlib"])
+def conn(request, server):
+    conn = pymysql.connect(
+        host="127.0.0.1",
+        port=server.port,
+        user="u",
+        client_flag=CLIENT.MULTI_STATEMENTS,
+        # a deadlock fails the test instead of hanging it
+        write_timeout=10,
+        **request.param,
+    )
+    yield conn
+    conn.close()
+
+
+def test_results(conn):
+    results = conn.pipeline(
+        ["select 3", b"select 1000", "update t", "select 2;select 5", "select 0"]
+    )
+    assert _rows(results) == [3, 1000, None, 2, None]
+    assert results[2].affected_rows == 1
+    assert results[0].rows[1] == (1, "x" * 100)
+    assert results[0].description[0][:2] == ("n", FIELD_TYPE.LONG)
+    assert len(conn.pipeline(["select 10"] * 50)) == 50
+
+
+def test_large_results(conn):
+    # The results are much larger than the socket buffers, and so are the
+    # queries: they can't all be sent before results are read.
+    queries = ["select 1000" + " " * 50000] * 100
+    results = conn.pipeline(queries)
+    assert _rows(results) == [1000] * 100
+    assert _rows(conn.pipeline(["select 1"])) == [1]
+
+
+@pytest.mark.parametrize(
+    "queries",
+    [
+        ["fail a", "select 2", "select 3"],
+        ["select 1", "fail a", "select 3"],
+        ["select 1", "select 2", "fail a"],
+        ["select 1", "select 2;fail a", "select 3"],
+        ["select 1", "fail a", "fail b", "select 3"],
+    ],
+    ids=["first", "middle", "last", "multiple statements", "two errors"],
+)
+def test_error(server, conn, queries):
+    start = len(server.queries)
+    with pytest.raises(pymysql.ProgrammingError, match="db.a"):
+        conn.pipeline(queries)
+    # the queries after the failing one still ran
+    assert server.queries[start:] == queries
+
+    # and their results were read, so the connection can be used
+    with conn.cursor() as cursor:
+        assert cursor.execute("select 7") == 7
+        assert len(cursor.fetchall()) == 7
+    assert _rows(conn.pipeline(["select 1", "select 2"])) == [1, 2]
+
+
+@pytest.mark.parametrize("failing", [0, 1, 2], ids=["first", "middle", "last"])
+def test_error_async(server, failing):
+    queries = ["select 1", "select 2", "select 3"]
+    queries[failing] = "fail a"
+
+    async def main():
+        conn = await pymysql.aio.connect(host="127.0.0.1", port=server.port, user="u")
+        try:
+            with pytest.raises(pymysql.ProgrammingError, match="db.a"):
+                await conn.pipeline(queries)
+
+            async with conn.cursor() as cursor:
+                assert await cursor.execute("select 7") == 7
+            results = await conn.pipeline(["select 1", "update t", "select 2"])
+            assert _rows(results) == [1, None, 2]
+        finally:
+            await conn.close()
+
+    asyncio.run(main())
+
+
+def test_large_results_async(server):
+    async def main():
+        conn = await pymysql.aio.connect(
+            host="127.0.0.1", port=server.port, user="u", write_timeout=10
+        )
+        try:
+            results = await conn.pipeline(["select 1000" + " " * 50000] * 100)
+            assert _rows(results) == [1000] * 100
+        finally:
+            await conn.close()
+
+    asyncio.run(main())
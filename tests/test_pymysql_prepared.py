@@ -0,0 +1,248 @@
+"""PreparedCursor against the stand-in server of benchmarks/fakemysql.py:
+binary protocol parameters and rows, and the statement cache."""
+
+import datetime
+from decimal import Decimal
+
+import fakemysql
+import pymysql
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from fakemysql import FakeServer
+
+# (type_code, charsetnr, text protocol value)
+MATRIX = [
+    (FIELD_TYPE.TINY, 63, b"-5"),
+    (FIELD_TYPE.SHORT, 63, b"300"),
+    (FIELD_TYPE.INT24, 63, b"70000"),
+    (FIELD_TYPE.LONG, 63, b"-70000"),
+    (FIELD_TYPE.LONGLONG, 63, b"9000000000"),
+    (FIELD_TYPE.YEAR, 63, b"2024"),
+    (FIELD_TYPE.FLOAT, 63, b"1.1"),
+    (FIELD_TYPE.DOUBLE, 63, b"2.5"),
+    (FIELD_TYPE.NEWDECIMAL, 63, b"1.50"),
+    (FIELD_TYPE.DATE, 63, b"2024-01-02"),
+    (FIELD_TYPE.DATE, 63, b"0000-00-00"),
+    (FIELD_TYPE.DATETIME, 63, b"2024-01-02 03:04:05"),
+    (FIELD_TYPE.DATETIME, 63, b"2024-01-02 03:04:05.250000"),
+    (FIELD_TYPE.DATETIME, 63, b"2024-01-02 00:00:00"),
+    (FIELD_TYPE.DATETIME, 63, b"0000-00-00 00:00:00"),
+    (FIELD_TYPE.TIMESTAMP, 63, b"2024-01-02 03:04:05"),
+    (FIELD_TYPE.TIME, 63, b"12:34:56"),
+    (FIELD_TYPE.TIME, 63, b"-01:02:03.500000"),
+    (FIELD_TYPE.TIME, 63, b"49:00:00"),
+    (FIELD_TYPE.VAR_STRING, 45, "héllo".encode()),
+    (FIELD_TYPE.VAR_STRING, 45, b""),
+    (FIELD_TYPE.BLOB, 63, b"\x00\xff"),
+    (FIELD_TYPE.BLOB, 45, b"x" * 300),
+    (FIELD_TYPE.JSON, 45, b'{"a": 1}'),
+]
+
+COLUMNS = [
+    (f"c{i}", type_code, charsetnr)
+    for i, (type_code, charsetnr, _) in enumerate(MATRIX)
+]
+
+
+def handler(sql):
+    if sql == "select * from matrix":
+        rows = [
+            [value for _, _, value in MATRIX],
+            [None] * len(MATRIX),
+            # NULLs on both sides of the byte boundaries of the NULL bitmap
+            [
+                None if i % 7 in (0, 5) else value
+                for i, (_, _, value) in enumerate(MATRIX)
+            ],
+        ]
+        return [("rs", COLUMNS, rows)]
+    if sql.startswith("select"):
+        return [("rs", [("x", FIELD_TYPE.LONGLONG, 63)], [[b"1"]])]
+    if sql.startswith("fail"):
+        return [("err", 1064, "You have an error in your SQL syntax")]
+    return [("ok", 1, 5)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+@pytest.fixture
+def connect(server):
+    connections = []
+
+    def connect(**kw):
+        conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u", **kw)
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
+
+
+def test_rows_match_text_protocol(connect):
+    conn = connect()
+    with conn.cursor() as cursor:
+        cursor.execute("select * from matrix")
+        text_rows = cursor.fetchall()
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute("select * from matrix")
+        binary_rows = cursor.fetchall()
+        description = cursor.description
+
+    assert binary_rows == text_rows
+    assert [tuple(map(type, row)) for row in binary_rows] == [
+        tuple(map(type, row)) for row in text_rows
+    ]
+    assert [d[1] for d in description] == [type_code for type_code, _, _ in MATRIX]
+    assert binary_rows[0][:4] == (-5, 300, 70000, -70000)
+    assert binary_rows[0][6] == 1.1
+    assert binary_rows[0][10] == "0000-00-00"
+    assert binary_rows[0][17] == -datetime.timedelta(hours=1, minutes=2, seconds=3.5)
+    assert binary_rows[1] == (None,) * len(MATRIX)
+
+
+def test_dict_cursor(connect):
+    conn = connect()
+    with conn.cursor(pymysql.cursors.PreparedDictCursor) as cursor:
+        cursor.execute("select 1")
+        assert cursor.fetchall() == [{"x": 1}]
+
+
+PARAMS = [
+    1,
+    -(1 << 63),
+    (1 << 64) - 1,
+    1.5,
+    Decimal("1.50"),
+    1 << 70,
+    b"\x00\xff",
+    "héllo",
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 250000),
+    datetime.date(2024, 1, 2),
+    datetime.timedelta(days=2, seconds=3, microseconds=4),
+    -datetime.timedelta(hours=1),
+    datetime.time(12, 34, 56, 7),
+    None,
+]
+
+
+def test_parameters(server, connect):
+    query = "select " + ", ".join(["%s"] * len(PARAMS))
+    conn = connect()
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute(query, PARAMS)
+
+    sql, params = server.executions[-1]
+    assert sql == "select " + ", ".join(["?"] * len(PARAMS))
+    assert params == [
+        *PARAMS[:5],
+        Decimal(1 << 70),
+        *PARAMS[6:-2],
+        datetime.timedelta(hours=12, minutes=34, seconds=56, microseconds=7),
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    "nulls", [(), (0,), (7,), (8,), (0, 7, 8, 15, 16), tuple(range(17))]
+)
+def test_null_bitmap(server, connect, nulls):
+    args = [None if i in nulls else i for i in range(17)]
+    conn = connect()
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute("select " + ", ".join(["%s"] * 17), args)
+        # the parameter types are sent again with each execution
+        cursor.execute("select " + ", ".join(["%s"] * 17), list(range(17)))
+
+    assert [params for _, params in server.executions[-2:]] == [args, list(range(17))]
+
+
+def test_named_placeholders(server, connect):
+    conn = connect()
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute("select %(a)s, '%%', %(b)s, %(a)s", {"a": 1, "b": "x"})
+        with pytest.raises(pymysql.ProgrammingError, match="Missing parameter 'b'"):
+            cursor.execute("select %(a)s, '%%', %(b)s, %(a)s", {"a": 1})
+
+    assert server.executions[-1] == ("select ?, '%', ?, ?", [1, "x", 1])
+
+
+def test_executemany_and_errors(server, connect):
+    conn = connect()
+    executed = len(server.executions)
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        assert cursor.executemany("insert into t values (%s)", [(1,), (2,), (3,)]) == 3
+        assert cursor.rowcounts == [1, 1, 1]
+        assert cursor.lastrowid == 5
+
+        with pytest.raises(pymysql.ProgrammingError, match="takes 1 parameters"):
+            cursor.execute("insert into t values (%s)", (1, 2))
+        with pytest.raises(pymysql.ProgrammingError):
+            cursor.execute("insert into t values (%s)", ([1, 2],))
+        with pytest.raises(pymysql.ProgrammingError, match="1064"):
+            cursor.execute("fail %s", (1,))
+
+        # the connection is still usable
+        cursor.execute("select 1")
+        assert cursor.fetchall() == ((1,),)
+
+    # only the statement the server rejected was sent besides the inserts
+    assert server.executions[executed:-1] == [
+        ("insert into t values (?)", [1]),
+        ("insert into t values (?)", [2]),
+        ("insert into t values (?)", [3]),
+        ("fail ?", [1]),
+    ]
+
+
+def test_cache_eviction_closes_statements(server, connect):
+    conn = connect(stmt_cache_size=2)
+    closed = len(server.closed_statements)
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute("select 1")
+        first = conn._stmt_cache["select 1"].statement_id
+        cursor.execute("select 2")
+        cursor.execute("select 1")
+        assert server.closed_statements[closed:] == []
+
+        # "select 2" is the least recently used one
+        second = conn._stmt_cache["select 2"].statement_id
+        cursor.execute("select 3")
+        cursor.execute("select 4")
+        cursor.execute("select 3")
+        # reusing a statement makes it the most recently used one
+        assert list(conn._stmt_cache) == ["select 4", "select 3"]
+
+    conn.ping()
+    assert server.closed_statements[closed:] == [second, first]
+
+
+def test_failed_prepare_keeps_cache(server, connect, monkeypatch):
+    prepare = fakemysql._Conn.prepare
+
+    def failing_prepare(self, sql):
+        if sql.startswith("bad"):
+            self.err(1064, "You have an error in your SQL syntax")
+        else:
+            prepare(self, sql)
+
+    monkeypatch.setattr(fakemysql._Conn, "prepare", failing_prepare)
+    conn = connect(stmt_cache_size=2)
+    closed = len(server.closed_statements)
+    with conn.cursor(pymysql.cursors.PreparedCursor) as cursor:
+        cursor.execute("select 1")
+        cursor.execute("select 2")
+        with pytest.raises(pymysql.ProgrammingError, match="1064"):
+            cursor.execute("bad %s", (1,))
+        assert list(conn._stmt_cache) == ["select 1", "select 2"]
+
+        cursor.execute("select 1")
+        assert cursor.fetchall() == ((1,),)
+
+    conn.ping()
+    assert server.closed_statements[closed:] == []
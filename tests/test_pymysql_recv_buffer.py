@@ -0,0 +1,123 @@
+"""Reading results with recv_buffer_size against the stand-in server of
+benchmarks/fakemysql.py: rows decoded from slices of the receive buffer, and
+the reuse of that buffer."""
+
+import pymysql
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from fakemysql import FakeServer
+
+BIG = 2**24 + 1000
+
+COLUMNS = [
+    ("id", FIELD_TYPE.LONG, 63),
+    ("price", FIELD_TYPE.DOUBLE, 63),
+    ("name", FIELD_TYPE.VAR_STRING, 45),
+    ("body", FIELD_TYPE.BLOB, 63),
+    ("created", FIELD_TYPE.DATETIME, 63),
+    ("doc", FIELD_TYPE.JSON, 45),
+]
+
+# a few values are longer than the receive buffer of the tests
+ROWS = [
+    [
+        b"%d" % i,
+        b"%d.5" % i,
+        ("héllo %d" % i).encode(),
+        b"\x00\xff" * (i % 400),
+        b"2024-01-02 03:04:%02d" % (i % 60),
+        b'{"i": %d}' % i,
+    ]
+    for i in range(500)
+]
+ROWS[7] = [b"7"] + [None] * 5
+
+
+def handler(sql):
+    if sql.startswith("select rows"):
+        return [("rs", COLUMNS, ROWS)]
+    if sql == "select big":
+        return [("rs", [("body", FIELD_TYPE.BLOB, 63)], [[b"x" * BIG], [b"y"]])]
+    return [("ok", 0)]
+
+
+@pytest.fixture(scope="module")
+def server():
+    return FakeServer(handler)
+
+
+@pytest.fixture
+def connect(server):
+    connections = []
+
+    def connect(**kw):
+        conn = pymysql.connect(host="127.0.0.1", port=server.port, user="u", **kw)
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "cursorclass",
+    [
+        pymysql.cursors.Cursor,
+        pymysql.cursors.SSCursor,
+        pymysql.cursors.DictCursor,
+        pymysql.cursors.PreparedCursor,
+    ],
+)
+@pytest.mark.parametrize("use_unicode", [True, False])
+def test_rows_match_file_reads(connect, cursorclass, use_unicode):
+    results = []
+    for kw in ({}, {"recv_buffer_size": 64}):
+        conn = connect(use_unicode=use_unicode, **kw)
+        with conn.cursor(cursorclass) as cursor:
+            # twice, so that the second result reuses the buffer
+            for _ in range(2):
+                cursor.execute("select rows")
+                results.append(list(cursor.fetchall()))
+
+    assert results[0] == results[1] == results[2] == results[3]
+    rows = results[2]
+    assert len(rows) == len(ROWS)
+    if cursorclass is not pymysql.cursors.DictCursor:
+        assert [type(value) for value in rows[3][:4]] == [
+            int,
+            float,
+            str if use_unicode else bytes,
+            bytes,
+        ]
+        assert rows[3][3] == b"\x00\xff" * 3
+        assert rows[7] == (7,) + (None,) * 5
+
+
+def test_multi_packet_row(connect):
+    conn = connect(recv_buffer_size=4096)
+    with conn.cursor() as cursor:
+        cursor.execute("select big")
+        assert cursor.fetchall() == ((b"x" * BIG,), (b"y",))
+        cursor.execute("select rows")
+        assert len(cursor.fetchall()) == len(ROWS)
+
+
+def test_buffer_reused(connect):
+    conn = connect(recv_buffer_size=256)
+    buffers = []
+    with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+        cursor.execute("select rows")
+        for _ in cursor:
+            buffers.append(conn._rbuf_base)
+    # rows of an unbuffered result are decoded one at a time, so nothing
+    # holds on to the buffer when it's refilled
+    assert all(buf is buffers[0] for buf in buffers)
+
+    # a buffered result keeps its rows in the buffer until it's read in full,
+    # so those buffers can't be reused
+    with conn.cursor() as cursor:
+        cursor.execute("select rows")
+        assert conn._rbuf_base is not buffers[0]
+        assert cursor.fetchall()[499][0] == 499
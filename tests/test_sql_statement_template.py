@@ -0,0 +1,132 @@
+"""statement_template() producing statements whose cache key is generated once."""
+
+import pytest
+
+from sqlalchemy import bindparam
+from sqlalchemy import column
+from sqlalchemy import create_engine
+from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import select
+from sqlalchemy import statement_template
+from sqlalchemy import String
+from sqlalchemy import TypeDecorator
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.cache_key import HasCacheKey
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Post(Base):
+    __tablename__ = "post"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id: Mapped[int]
+    comments = relationship("Comment")
+
+
+class Comment(Base):
+    __tablename__ = "comment"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    post_id = mapped_column(ForeignKey("post.id"))
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Post(id=i, author_id=i % 2, comments=[Comment(), Comment()])
+                for i in range(1, 7)
+            ]
+        )
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def cache_keys(monkeypatch):
+    """Objects a cache key was generated for."""
+    generated = []
+    generate = HasCacheKey._generate_cache_key
+
+    def record(obj):
+        generated.append(obj)
+        return generate(obj)
+
+    monkeypatch.setattr(HasCacheKey, "_generate_cache_key", record)
+    return generated
+
+
+def _keyed(cache_keys, stmt):
+    return sum(obj is stmt for obj in cache_keys)
+
+
+def posts_by_author(author_id, limit):
+    return (
+        select(Post)
+        .where(Post.author_id == author_id)
+        .options(selectinload(Post.comments))
+        .order_by(Post.id.desc())
+        .limit(limit)
+    )
+
+
+def test_function(session, cache_keys):
+    template = statement_template(posts_by_author)
+    assert _keyed(cache_keys, template) == 1
+
+    for author_id, ids in [(1, [5, 3]), (0, [6, 4]), (1, [5, 3])]:
+        posts = session.scalars(template, {"author_id": author_id, "limit": 2}).all()
+        assert [post.id for post in posts] == ids
+        assert all(len(post.comments) == 2 for post in posts)
+        session.expunge_all()
+
+    # only the statements of the selectinload are keyed per execution
+    assert _keyed(cache_keys, template) == 1
+
+
+def test_rebuilt_statement_keyed_each_time(session, cache_keys):
+    statements = []
+    for _ in range(2):
+        stmt = posts_by_author(bindparam("author_id"), bindparam("limit"))
+        session.scalars(stmt, {"author_id": 1, "limit": 2}).all()
+        statements.append(stmt)
+    assert all(_keyed(cache_keys, stmt) == 1 for stmt in statements)
+
+
+def test_statement(session, cache_keys):
+    template = statement_template(
+        select(Post.id).where(Post.author_id == bindparam("author_id"))
+    )
+    assert session.scalars(template, {"author_id": 0}).all() == [2, 4, 6]
+    assert session.scalars(template, {"author_id": 1}).all() == [1, 3, 5]
+    assert _keyed(cache_keys, template) == 1
+
+
+def test_unused_argument():
+    def by_author(author_id, limit):
+        return select(Post).where(Post.author_id == author_id)
+
+    with pytest.raises(exc.ArgumentError, match="'limit' are not used"):
+        statement_template(by_author)
+
+
+def test_not_cacheable():
+    class NotCacheable(TypeDecorator):
+        impl = String
+        cache_ok = False
+
+    stmt = select(Post).where(column("x", NotCacheable()) == "x")
+    with pytest.raises(exc.ArgumentError, match="not cacheable"):
+        statement_template(stmt)